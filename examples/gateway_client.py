@@ -0,0 +1,62 @@
+"""Minimal gateway client: send a WAV file as one turn and save the reply.
+
+Start the gateway first:
+
+    amplifier-voice serve --max-sessions 4
+
+Then:
+
+    python examples/gateway_client.py question.wav reply.wav
+
+The WAV must be mono 16-bit PCM at the gateway's sample rate (24kHz by default).
+"""
+
+import asyncio
+import sys
+import wave
+
+from amplifier_app_voice.gateway import FRAME_AUDIO
+from amplifier_app_voice.gateway import FRAME_COMMIT
+from amplifier_app_voice.gateway import FRAME_END
+from amplifier_app_voice.gateway import FRAME_ERROR
+from amplifier_app_voice.gateway import FRAME_TEXT
+from amplifier_app_voice.gateway import read_frame
+from amplifier_app_voice.gateway import write_frame
+
+
+async def ask(wav_in: str, wav_out: str, host: str = "127.0.0.1", port: int = 8765) -> None:
+    with wave.open(wav_in, "rb") as wav:
+        rate = wav.getframerate()
+        pcm = wav.readframes(wav.getnframes())
+
+    reader, writer = await asyncio.open_connection(host, port)
+    for offset in range(0, len(pcm), 4800):  # Send in 100ms chunks, as a live client would
+        write_frame(writer, FRAME_AUDIO, pcm[offset : offset + 4800])
+        await writer.drain()
+    write_frame(writer, FRAME_COMMIT)
+    await writer.drain()
+
+    reply = bytearray()
+    while frame := await read_frame(reader):
+        kind, payload = frame
+        if kind == FRAME_TEXT:
+            print(f"Assistant: {payload.decode()}")
+        elif kind == FRAME_AUDIO:
+            reply += payload
+        elif kind == FRAME_ERROR:
+            print(f"Error: {payload.decode()}")
+            break
+        elif kind == FRAME_END:
+            break
+    writer.close()
+    await writer.wait_closed()
+
+    with wave.open(wav_out, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(reply)
+
+
+if __name__ == "__main__":
+    asyncio.run(ask(sys.argv[1], sys.argv[2]))
@@ -0,0 +1,171 @@
+"""Streaming audio archive for amplifier-app-voice sessions.
+
+Each direction of the conversation is appended to one file in
+``session_dir/audio/`` - ``user.wav`` for everything recorded and
+``assistant.wav`` for every response - so a session can be replayed or
+re-evaluated later. Transcript entries point into these files by sample
+offset and length (see AudioArchive.segment()).
+
+Chunks are queued by reference as audio flows (the capture tap runs on the
+PortAudio thread) and written by a background thread in batches; nothing
+is copied or held beyond the queue. FLAC needs the optional ``soundfile``
+package; without it the archive falls back to WAV.
+"""
+
+import importlib.util
+import logging
+import queue
+import threading
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+ARCHIVE_FORMATS = ("wav", "flac")
+STREAMS = ("user", "assistant")
+
+_CLOSE = object()  # Queue sentinel
+
+
+class AudioArchive:
+    """Appends PCM16 audio per stream to WAV/FLAC files from a background thread."""
+
+    def __init__(self, directory: Path, sample_rate: int, audio_format: str = "wav", flush_ms: int = 200) -> None:
+        """Initialize archive (files are created with the first audio).
+
+        Args:
+            directory: Directory for the archive files (created if needed)
+            sample_rate: Sample rate of all archived audio
+            audio_format: "wav" or "flac" (falls back to wav without soundfile)
+            flush_ms: How long to gather chunks into one write
+
+        Raises:
+            ValueError: If audio_format is unknown
+        """
+        if audio_format not in ARCHIVE_FORMATS:
+            raise ValueError(
+                f"Unknown archive format: {audio_format} (expected one of {', '.join(ARCHIVE_FORMATS)})"
+            )
+        if audio_format == "flac":
+            if importlib.util.find_spec("soundfile") is None:
+                logging.warning("soundfile not installed - archiving audio as WAV instead of FLAC")
+                audio_format = "wav"
+
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.audio_format = audio_format
+        self.flush_interval = flush_ms / 1000
+        self._frames = dict.fromkeys(STREAMS, 0)
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._files: dict = {}
+
+    def filename(self, stream: str) -> str:
+        """Archive file for a stream, relative to the session directory."""
+        return f"{self.directory.name}/{stream}.{self.audio_format}"
+
+    def position(self, stream: str) -> int:
+        """Samples queued for a stream so far (the offset of the next chunk)."""
+        return self._frames[stream]
+
+    def write(self, stream: str, pcm: bytes | memoryview) -> None:
+        """Queue a chunk for the stream. Thread-safe, never blocks.
+
+        The chunk is kept by reference, so it must not be modified afterwards.
+
+        Args:
+            stream: "user" or "assistant"
+            pcm: PCM16 mono audio at sample_rate
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audio-archive", daemon=True)
+                self._thread.start()
+            self._frames[stream] += len(pcm) // 2  # PCM16 = 2 bytes per sample
+            self._queue.put((stream, pcm))
+
+    def segment(self, stream: str, offset: int) -> dict:
+        """Reference to the audio queued for a stream since offset.
+
+        Args:
+            stream: "user" or "assistant"
+            offset: position(stream) before the audio was written
+
+        Returns:
+            Dict with file, offset and length (in samples) and sample_rate
+        """
+        return {
+            "file": self.filename(stream),
+            "offset": offset,
+            "length": self.position(stream) - offset,
+            "sample_rate": self.sample_rate,
+        }
+
+    def close(self) -> None:
+        """Write everything queued and finalize the files.
+
+        Blocks until done; from the event loop use ``await asyncio.to_thread(archive.close)``.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(_CLOSE)
+        thread.join()
+
+    def _run(self) -> None:
+        """Writer thread: gather chunks into batches until the close sentinel."""
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not _CLOSE:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch[-1] is _CLOSE:
+                closing = True
+                batch.pop()
+            self._write_batch(batch)
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def _write_batch(self, batch: list[tuple[str, bytes | memoryview]]) -> None:
+        """Append one batch, updating each file's header once."""
+        chunks: dict[str, list[bytes | memoryview]] = {}
+        for stream, pcm in batch:
+            chunks.setdefault(stream, []).append(pcm)
+
+        for stream, stream_chunks in chunks.items():
+            try:
+                f = self._files.get(stream) or self._open(stream)
+                if self.audio_format == "flac":
+                    for pcm in stream_chunks:
+                        f.write(np.frombuffer(pcm, dtype=np.int16))
+                else:
+                    for pcm in stream_chunks:
+                        f.writeframesraw(pcm)
+                    f.writeframes(b"")  # Patches the header sizes, so the file stays playable
+            except Exception as e:
+                # Don't fail the application if archiving fails
+                logging.error(f"Failed to archive {stream} audio: {e}")
+
+    def _open(self, stream: str):
+        """Create the archive file for a stream."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory.parent / self.filename(stream)
+        if self.audio_format == "flac":
+            import soundfile
+
+            f = soundfile.SoundFile(path, "w", samplerate=self.sample_rate, channels=1, format="FLAC", subtype="PCM_16")
+        else:
+            f = wave.open(str(path), "wb")
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+        self._files[stream] = f
+        return f
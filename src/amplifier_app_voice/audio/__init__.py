@@ -1,7 +1,23 @@
-"""Audio subsystem for amplifier-app-voice."""
+"""Audio subsystem for amplifier-app-voice.
 
-from amplifier_app_voice.audio.capture import AudioCapture
-from amplifier_app_voice.audio.playback import AudioPlayback
-from amplifier_app_voice.audio.utils import list_audio_devices
+Exports are imported on first use, so importing a light submodule (e.g.
+``audio.codec``) doesn't load PortAudio.
+"""
 
-__all__ = ["AudioCapture", "AudioPlayback", "list_audio_devices"]
+import importlib
+
+_EXPORTS = {
+    "AudioCapture": "capture",
+    "AudioPlayback": "playback",
+    "VoiceActivityDetector": "vad",
+    "list_audio_devices": "utils",
+}
+
+__all__ = ["AudioCapture", "AudioPlayback", "VoiceActivityDetector", "list_audio_devices"]
+
+
+def __getattr__(name: str):
+    """Import an exported name's module on first access."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
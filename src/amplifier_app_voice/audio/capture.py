@@ -1,52 +1,204 @@
 """Audio capture for amplifier-app-voice."""
 
+import asyncio
+import math
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+
 import pyaudio
 
+from amplifier_app_voice.audio.dsp import DspChain
+from amplifier_app_voice.audio.resample import StreamingResampler
+from amplifier_app_voice.audio.utils import get_native_sample_rate
+
 
 class AudioCapture:
     """Captures audio from microphone using PyAudio.
 
     Uses callback-based recording for low latency. Captures PCM16 audio
     at 24kHz mono, matching OpenAI Realtime API requirements.
+
+    Recordings go into one buffer preallocated for max_duration seconds;
+    the callback copies into it without allocating, and reaching the end
+    stops accepting audio and signals wait_for_limit().
+
+    In persistent mode the input stream is opened once and left running;
+    recording just flips a flag. While idle, the most recent audio is kept
+    in a small pre-roll ring so the start of an utterance isn't clipped.
+
+    With native_rate the device is opened at its own default rate and each
+    chunk is resampled to sample_rate in the callback (bounded cost per chunk).
+    An optional DSP chain then cleans each chunk up before it is recorded.
+
+    Input overflows and underflows reported by PortAudio are counted in
+    overflows and underflows.
     """
 
-    def __init__(self, device_index: int | None = None, sample_rate: int = 24000, buffer_size: int = 1024) -> None:
+    def __init__(
+        self,
+        device_index: int | None = None,
+        sample_rate: int = 24000,
+        buffer_size: int = 1024,
+        persistent: bool = False,
+        preroll_ms: int = 300,
+        max_duration: int = 30,
+        native_rate: bool = False,
+        pa: pyaudio.PyAudio | None = None,
+        dsp: DspChain | None = None,
+    ) -> None:
         """Initialize audio capture.
 
         Args:
             device_index: Input device index (None = system default)
             sample_rate: Sample rate in Hz (default: 24000 for OpenAI)
             buffer_size: Buffer size in frames (default: 1024)
+            persistent: Keep the input stream open between recordings (default: False)
+            preroll_ms: Audio kept from before start_recording() in persistent mode (default: 300)
+            max_duration: Maximum recording length in seconds (default: 30)
+            native_rate: Open the device at its native rate and resample (default: False)
+            pa: Shared PyAudio instance, terminated by its owner (default: create one)
+            dsp: Filters applied to every chunk in the callback (default: none)
         """
         self.device_index = device_index
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
-        self.p = pyaudio.PyAudio()
+        self.persistent = persistent
+        self.preroll_ms = preroll_ms
+        self._owns_pa = pa is None
+        self.p = pa or pyaudio.PyAudio()
         self.stream: pyaudio.Stream | None = None
-        self.frames: list[bytes] = []
+        self.device_rate = get_native_sample_rate(self.p, device_index, "input") if native_rate else sample_rate
+        self._resampler = StreamingResampler(self.device_rate, sample_rate) if self.device_rate != sample_rate else None
+        self.dsp = dsp
+        self.buffer = bytearray(sample_rate * 2 * max_duration)  # PCM16 = 2 bytes per sample
+        self.length = 0
+        self.limit_reached = False
+        self.preroll: deque[bytes] = deque(maxlen=math.ceil(preroll_ms * sample_rate / 1000 / buffer_size))
         self.is_recording = False
+        self.overflows = 0  # Callbacks flagged paInputOverflow (audio was dropped)
+        self.underflows = 0  # Callbacks flagged paInputUnderflow
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._chunks: asyncio.Queue[bytes | None] | None = None
+        self._limit_event: asyncio.Event | None = None
+        # Optional observer for every recorded chunk (e.g. an archive); runs on the audio thread, must not block
+        self.tap: Callable[[bytes | memoryview], None] | None = None
 
-    def start_recording(self) -> None:
-        """Start recording from microphone.
+    def open(self) -> None:
+        """Open and start the input stream (no-op if already open).
 
-        Opens PyAudio stream with callback for low-latency capture.
-        Clears any existing frames before starting.
+        Called by start_recording(); call it up front in persistent mode to
+        pay the device open cost before the first key press.
         """
-        self.frames = []
-        self.is_recording = True
+        if self.stream:
+            return
+
+        if self._resampler:
+            self._resampler.reset()
+        if self.dsp:
+            self.dsp.reset()
 
         self.stream = self.p.open(
             format=pyaudio.paInt16,
             channels=1,
-            rate=self.sample_rate,
+            rate=self.device_rate,
             input=True,
             input_device_index=self.device_index,
-            frames_per_buffer=self.buffer_size,
+            frames_per_buffer=self.buffer_size * self.device_rate // self.sample_rate,
             stream_callback=self._callback,
         )
 
         self.stream.start_stream()
 
+    def set_buffer_size(self, buffer_size: int) -> None:
+        """Change frames per buffer, reopening the stream if it is open.
+
+        Call between recordings; it blocks while the device reopens.
+
+        Args:
+            buffer_size: Buffer size in frames at sample_rate
+        """
+        reopen = self.stream is not None
+        if reopen:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        with self._lock:
+            self.buffer_size = buffer_size
+            self.preroll = deque(
+                self.preroll, maxlen=math.ceil(self.preroll_ms * self.sample_rate / 1000 / buffer_size)
+            )
+        if reopen:
+            self.open()
+
+    def start_recording(self, streaming: bool = False) -> None:
+        """Start recording from microphone.
+
+        Opens PyAudio stream with callback for low-latency capture.
+        Discards the previous recording before starting (persistent mode
+        seeds the new one with the pre-roll). Views returned by earlier
+        stop_recording() calls are overwritten from here on.
+
+        Args:
+            streaming: Also publish each captured chunk to chunks() as it
+                arrives. Requires a running event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            self._loop = loop
+            self._chunks = asyncio.Queue() if streaming else None
+            self._limit_event = asyncio.Event() if loop else None
+            self.length = 0
+            self.limit_reached = False
+            for chunk in self.preroll:
+                self._write(chunk)
+            self.preroll.clear()
+            self.is_recording = True
+
+        self.open()
+
+    def _write(self, data: bytes) -> None:
+        """Copy a chunk into the recording buffer (caller holds the lock).
+
+        Args:
+            data: PCM16 audio chunk
+        """
+        n = min(len(data), len(self.buffer) - self.length)
+        if n:
+            chunk = data if n == len(data) else memoryview(data)[:n]
+            self.buffer[self.length : self.length + n] = chunk
+            self.length += n
+            if self.tap is not None:
+                self.tap(chunk)
+            if self._chunks is not None and self._loop is not None:
+                # May run on the PortAudio thread - hand the chunk to the event loop
+                self._loop.call_soon_threadsafe(self._chunks.put_nowait, chunk)
+
+        if self.length == len(self.buffer) and not self.limit_reached:
+            self.limit_reached = True
+            if self._limit_event is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(self._limit_event.set)
+
+    def detach_buffer(self) -> None:
+        """Record the next utterance into a fresh buffer.
+
+        Views returned by stop_recording() stay valid (the old buffer lives
+        as long as they do). Use when the last recording is still in use.
+        """
+        with self._lock:
+            self.buffer = bytearray(len(self.buffer))
+
+    async def wait_for_limit(self) -> None:
+        """Wait until the current recording fills the buffer (max_duration reached)."""
+        if self._limit_event is not None:
+            await self._limit_event.wait()
+
     def _callback(self, in_data: bytes, frame_count: int, time_info: dict, status: int) -> tuple[None, int]:
         """Callback for audio stream.
 
@@ -59,24 +211,58 @@ class AudioCapture:
         Returns:
             Tuple of (None, continue flag)
         """
-        if self.is_recording:
-            self.frames.append(in_data)
+        if status & pyaudio.paInputOverflow:
+            self.overflows += 1
+        if status & pyaudio.paInputUnderflow:
+            self.underflows += 1
+        if self._resampler:
+            in_data = self._resampler.process(in_data)
+        if self.dsp:
+            in_data = self.dsp.process(in_data)
+
+        with self._lock:
+            if self.is_recording:
+                self._write(in_data)
+            elif self.persistent:
+                self.preroll.append(in_data)
         return (None, pyaudio.paContinue)
 
-    def stop_recording(self) -> bytes:
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield captured chunks as they arrive (streaming mode only).
+
+        Iteration ends once stop_recording() has been called and every
+        chunk captured before it has been delivered.
+
+        Yields:
+            PCM16 audio chunks in capture order
+        """
+        queue = self._chunks
+        if queue is None:
+            return
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+
+    def stop_recording(self) -> memoryview:
         """Stop recording and return captured audio data.
 
+        In persistent mode the stream keeps running and refills the pre-roll.
+
         Returns:
-            PCM16 audio data as bytes
+            PCM16 audio data as a zero-copy view of the recording buffer,
+            valid until the next start_recording()
         """
-        self.is_recording = False
+        with self._lock:
+            self.is_recording = False
+            if self._chunks is not None and self._loop is not None:
+                # Queued behind any chunks still in flight from the callback thread
+                self._loop.call_soon_threadsafe(self._chunks.put_nowait, None)
 
-        if self.stream:
+        if self.stream and not self.persistent:
             self.stream.stop_stream()
             self.stream.close()
             self.stream = None
 
-        return b"".join(self.frames)
+        return memoryview(self.buffer)[: self.length]
 
     def cleanup(self) -> None:
         """Release PyAudio resources.
@@ -86,4 +272,5 @@ class AudioCapture:
         if self.stream:
             self.stream.close()
             self.stream = None
-        self.p.terminate()
+        if self._owns_pa:
+            self.p.terminate()
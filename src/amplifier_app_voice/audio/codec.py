@@ -0,0 +1,175 @@
+"""Wire encodings for audio sent to and received from the Realtime API.
+
+G.711 µ-law and A-law halve the bytes of PCM16 (8 bits per sample). Both
+directions are single NumPy table lookups: encoding indexes a 65536-entry
+table with the raw 16-bit sample, decoding a 256-entry table with the byte.
+Tables follow the ITU-T G.711 reference implementation.
+
+G.711 is carried at 8kHz; WireEncoder/WireDecoder handle the rate change
+to and from the app's sample rate for streamed audio.
+"""
+
+import numpy as np
+
+from amplifier_app_voice.audio.resample import StreamingResampler
+
+WIRE_FORMATS = ("pcm16", "g711_ulaw", "g711_alaw")
+WIRE_SAMPLE_RATES = {"g711_ulaw": 8000, "g711_alaw": 8000}
+
+_ULAW_SEG_END = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+_ALAW_SEG_END = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF])
+
+
+def _build_ulaw_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Build µ-law encode (uint16 sample -> byte) and decode (byte -> int16) tables."""
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2  # 14-bit
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    mag = np.minimum(np.abs(pcm), 8159) + 0x21
+    seg = np.searchsorted(_ULAW_SEG_END, mag)
+    code = (seg << 4) | ((mag >> (np.minimum(seg, 7) + 1)) & 0x0F)
+    encode = np.where(seg >= 8, 0x7F, code) ^ mask
+
+    u = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = (((u & 0x0F) << 3) + 0x84) << ((u & 0x70) >> 4)
+    decode = np.where(u & 0x80, 0x84 - t, t - 0x84)
+
+    return encode.astype(np.uint8), decode.astype(np.int16)
+
+
+def _build_alaw_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Build A-law encode (uint16 sample -> byte) and decode (byte -> int16) tables."""
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 3  # 13-bit
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    mag = np.where(pcm >= 0, pcm, -pcm - 1)
+    seg = np.searchsorted(_ALAW_SEG_END, mag)
+    shift = np.where(seg < 2, 1, np.minimum(seg, 7))
+    code = (seg << 4) | ((mag >> shift) & 0x0F)
+    encode = np.where(seg >= 8, 0x7F, code) ^ mask
+
+    a = np.arange(256, dtype=np.int32) ^ 0x55
+    seg = (a & 0x70) >> 4
+    t = (a & 0x0F) << 4
+    t = np.where(seg == 0, t + 8, (t + 0x108) << np.maximum(seg - 1, 0))
+    decode = np.where(a & 0x80, t, -t)
+
+    return encode.astype(np.uint8), decode.astype(np.int16)
+
+
+_TABLES = {
+    "g711_ulaw": _build_ulaw_tables(),
+    "g711_alaw": _build_alaw_tables(),
+}
+
+
+def encode(pcm: bytes | memoryview, wire_format: str) -> bytes | memoryview:
+    """Encode PCM16 audio for the wire.
+
+    Args:
+        pcm: PCM16 mono audio
+        wire_format: One of WIRE_FORMATS
+
+    Returns:
+        Encoded audio (pcm16 is passed through without copying)
+
+    Raises:
+        ValueError: If wire_format is unknown
+    """
+    if wire_format == "pcm16":
+        return pcm
+    if wire_format not in _TABLES:
+        raise ValueError(f"Unknown wire format: {wire_format} (expected one of {', '.join(WIRE_FORMATS)})")
+
+    samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+    return _TABLES[wire_format][0][samples.view(np.uint16)].tobytes()
+
+
+def decode(data: bytes | memoryview, wire_format: str) -> bytes | memoryview:
+    """Decode wire audio to PCM16.
+
+    Args:
+        data: Encoded audio
+        wire_format: One of WIRE_FORMATS
+
+    Returns:
+        PCM16 mono audio (pcm16 is passed through without copying)
+
+    Raises:
+        ValueError: If wire_format is unknown
+    """
+    if wire_format == "pcm16":
+        return data
+    if wire_format not in _TABLES:
+        raise ValueError(f"Unknown wire format: {wire_format} (expected one of {', '.join(WIRE_FORMATS)})")
+
+    return _TABLES[wire_format][1][np.frombuffer(data, dtype=np.uint8)].tobytes()
+
+
+def wire_sample_rate(wire_format: str, sample_rate: int) -> int:
+    """Sample rate audio is carried at for a wire format.
+
+    Args:
+        wire_format: One of WIRE_FORMATS
+        sample_rate: App sample rate (used for pcm16)
+
+    Returns:
+        Sample rate in Hz
+    """
+    return WIRE_SAMPLE_RATES.get(wire_format, sample_rate)
+
+
+class WireEncoder:
+    """Converts a stream of PCM16 chunks to a wire format and its sample rate."""
+
+    def __init__(self, wire_format: str, sample_rate: int) -> None:
+        """Initialize encoder for one stream (e.g. one turn).
+
+        Args:
+            wire_format: One of WIRE_FORMATS
+            sample_rate: Sample rate of the PCM16 input
+        """
+        self.wire_format = wire_format
+        self.sample_rate = wire_sample_rate(wire_format, sample_rate)
+        self._resampler = StreamingResampler(sample_rate, self.sample_rate) if self.sample_rate != sample_rate else None
+
+    def encode(self, pcm: bytes | memoryview) -> bytes | memoryview:
+        """Encode the next chunk.
+
+        Args:
+            pcm: PCM16 mono audio
+
+        Returns:
+            Wire-format audio at self.sample_rate
+        """
+        if self._resampler:
+            pcm = self._resampler.process(pcm)
+        return encode(pcm, self.wire_format)
+
+
+class WireDecoder:
+    """Converts a stream of wire-format audio back to PCM16 at the app's sample rate."""
+
+    def __init__(self, wire_format: str, sample_rate: int, wire_rate: int | None = None) -> None:
+        """Initialize decoder for one stream (e.g. one response).
+
+        Args:
+            wire_format: One of WIRE_FORMATS
+            sample_rate: Sample rate wanted for the PCM16 output
+            wire_rate: Sample rate of the incoming audio (default: the format's rate)
+        """
+        self.wire_format = wire_format
+        wire_rate = wire_rate or wire_sample_rate(wire_format, sample_rate)
+        self._resampler = StreamingResampler(wire_rate, sample_rate) if wire_rate != sample_rate else None
+
+    def decode(self, data: bytes | memoryview) -> bytes | memoryview:
+        """Decode the next chunk.
+
+        Args:
+            data: Wire-format audio
+
+        Returns:
+            PCM16 mono audio at the app sample rate
+        """
+        pcm = decode(data, self.wire_format)
+        if self._resampler:
+            pcm = self._resampler.process(pcm)
+        return pcm
@@ -0,0 +1,391 @@
+"""Streaming clean-up filters for captured audio.
+
+A DspChain runs each captured chunk through a list of filters before it is
+recorded, so the recording buffer, the streamed upload, the VAD, the meter
+and the archive all see the cleaned audio:
+
+- ``highpass``: removes rumble, handling noise and DC below cutoff_hz
+- ``noise_gate``: attenuates the room between utterances
+- ``agc``: brings speech to a steady level without clipping
+
+Filters work on float32 samples in PCM16 scale and keep their state
+between chunks, so the output doesn't depend on how the stream is chunked
+(up to the gate's and AGC's frame boundaries). Each filter's time per
+chunk is measured against its budget - a fraction of the chunk's duration -
+and chunks that exceed it are counted (see DspChain.stats()).
+
+The chain is built from the ``audio.dsp`` list in the config, e.g.::
+
+    dsp:
+      - highpass: {cutoff_hz: 100}
+      - noise_gate
+      - agc: {target_db: -18}
+"""
+
+import logging
+import math
+import time
+from abc import ABC
+from abc import abstractmethod
+
+import numpy as np
+
+SCAN_BLOCK = 256  # Most samples per vectorized step of a recursive filter
+SCAN_RANGE = 1e-150  # Smallest a**k used, so a**-k stays far from float64 overflow (and a**k from underflow)
+
+
+def _scan_block(a: float) -> int:
+    """Samples per vectorized step for feedback coefficient a (fewer when a is small, i.e. a high cutoff)."""
+    return max(1, min(SCAN_BLOCK, math.floor(math.log(SCAN_RANGE) / math.log(a))))
+
+
+def _one_pole(b: np.ndarray, a: float, y_prev: float, powers: np.ndarray) -> np.ndarray:
+    """Solve y[n] = a * y[n-1] + b[n] without a per-sample Python loop.
+
+    Within a block, y[k] = a**k * (a * y_prev + sum_{j<=k} a**-j * b[j]),
+    which is one cumulative sum.
+
+    Args:
+        b: Input term, float64
+        a: Feedback coefficient, 0 < a < 1
+        y_prev: Output just before b[0]
+        powers: a ** arange(_scan_block(a)); its length is the block length
+
+    Returns:
+        y, float64
+    """
+    y = np.empty_like(b)
+    for start in range(0, len(b), len(powers)):
+        block = b[start : start + len(powers)]
+        p = powers[: len(block)]
+        y[start : start + len(block)] = p * (np.cumsum(block / p) + a * y_prev)
+        y_prev = y[start + len(block) - 1]
+    return y
+
+
+def _frame_levels(x: np.ndarray, frame_len: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a chunk into frames (the last may be short) and measure them.
+
+    Returns:
+        (frame end offsets, RMS level in dBFS, peak magnitude) per frame
+    """
+    starts = np.arange(0, len(x), frame_len)
+    ends = np.append(starts[1:], len(x))
+    energy = np.add.reduceat(x * x, starts) / (ends - starts)
+    level_db = 10.0 * np.log10(energy / 32768.0**2 + 1e-12)
+    peak = np.maximum.reduceat(np.abs(x), starts)
+    return ends, level_db, peak
+
+
+def _ramp(n: int, ends: np.ndarray, start_gain: float, frame_gains: np.ndarray) -> np.ndarray:
+    """Per-sample gain moving linearly from start_gain to each frame's gain over that frame (no clicks)."""
+    return np.interp(
+        np.arange(1, n + 1, dtype=np.float32),
+        np.concatenate(([0], ends)),
+        np.concatenate(([start_gain], frame_gains)),
+    ).astype(np.float32)
+
+
+class Filter(ABC):
+    """A stage of the chain: float32 samples in, float32 samples out, same length."""
+
+    name = ""
+    budget = 0.05  # Share of a chunk's duration this filter may spend on it
+
+    def __init__(self, sample_rate: int, budget: float | None = None) -> None:
+        """Initialize timing counters.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            budget: Override of the class budget
+        """
+        self.sample_rate = sample_rate
+        if budget is not None:
+            self.budget = budget
+        self.chunks = 0
+        self.audio_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.max_seconds = 0.0
+        self.over_budget = 0
+
+    @abstractmethod
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Filter the next chunk of the stream."""
+
+    def reset(self) -> None:
+        """Forget stream state (start of a new, unrelated stream)."""
+
+    def account(self, seconds: float, chunk_seconds: float) -> None:
+        """Record the time one chunk took (called by DspChain)."""
+        self.chunks += 1
+        self.audio_seconds += chunk_seconds
+        self.cpu_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if seconds > self.budget * chunk_seconds:
+            if not self.over_budget:
+                logging.warning(
+                    f"DSP filter {self.name} took {seconds * 1e6:.0f} µs for a "
+                    f"{chunk_seconds * 1000:.1f} ms chunk (budget {self.budget:.0%})"
+                )
+            self.over_budget += 1
+
+
+class HighPassFilter(Filter):
+    """Cascade of one-pole high-pass sections (6 dB/octave each)."""
+
+    name = "highpass"
+
+    def __init__(self, sample_rate: int, cutoff_hz: float = 80.0, order: int = 2, budget: float | None = None) -> None:
+        """Initialize filter.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            cutoff_hz: Corner frequency (default: 80)
+            order: Number of sections, 1-4 (default: 2, 12 dB/octave)
+            budget: Override of the CPU budget
+
+        Raises:
+            ValueError: If cutoff_hz or order is out of range
+        """
+        super().__init__(sample_rate, budget)
+        if not 0 < cutoff_hz < sample_rate / 2:
+            raise ValueError(f"highpass cutoff_hz {cutoff_hz} must be between 0 and {sample_rate // 2}")
+        if not 1 <= order <= 4:
+            raise ValueError(f"highpass order {order} must be 1-4")
+        self.cutoff_hz = cutoff_hz
+        self.order = order
+        self.a = math.exp(-2 * math.pi * cutoff_hz / sample_rate)
+        self._powers = self.a ** np.arange(_scan_block(self.a), dtype=np.float64)
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero each section's last input and output."""
+        self._state = [(0.0, 0.0)] * self.order
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """y[n] = a * (y[n-1] + x[n] - x[n-1]) per section."""
+        if not len(x):
+            return x
+        y = x.astype(np.float64)
+        for i, (x_prev, y_prev) in enumerate(self._state):
+            out = _one_pole(self.a * np.diff(y, prepend=x_prev), self.a, y_prev, self._powers)
+            self._state[i] = (float(y[-1]), float(out[-1]))
+            y = out
+        return y.astype(np.float32)
+
+
+class NoiseGate(Filter):
+    """Attenuates audio whose level stays below a threshold, e.g. the room between utterances.
+
+    Opens within one frame when a frame reaches threshold_db, stays open for
+    hold_ms after the last loud frame, then fades to floor_db over release_ms.
+    """
+
+    name = "noise_gate"
+
+    def __init__(
+        self,
+        sample_rate: int,
+        threshold_db: float = -45.0,
+        floor_db: float = -30.0,
+        hold_ms: int = 250,
+        release_ms: int = 150,
+        frame_ms: int = 10,
+        budget: float | None = None,
+    ) -> None:
+        """Initialize gate (closed).
+
+        Args:
+            sample_rate: Sample rate in Hz
+            threshold_db: Frame RMS level in dBFS that opens the gate (default: -45)
+            floor_db: Gain while closed, in dB (default: -30)
+            hold_ms: Time the gate stays open after the last loud frame (default: 250)
+            release_ms: Fade from open to closed (default: 150)
+            frame_ms: Level measurement frame (default: 10)
+            budget: Override of the CPU budget
+        """
+        super().__init__(sample_rate, budget)
+        self.threshold_db = threshold_db
+        self.floor = 10 ** (floor_db / 20)
+        self.frame_len = max(1, sample_rate * frame_ms // 1000)
+        self.hold_frames = hold_ms // frame_ms
+        self.release_step = (1.0 - self.floor) * frame_ms / max(release_ms, frame_ms)
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the gate."""
+        self.gain = self.floor
+        self._hold = 0
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Apply the gate's gain, ramped per frame."""
+        if not len(x):
+            return x
+        ends, level_db, _ = _frame_levels(x, self.frame_len)
+        frame_gains = np.empty(len(ends), dtype=np.float32)
+        start_gain = gain = self.gain
+        for i, level in enumerate(level_db):
+            if level >= self.threshold_db:
+                self._hold = self.hold_frames
+                gain = 1.0
+            elif self._hold:
+                self._hold -= 1
+            else:
+                gain = max(self.floor, gain - self.release_step)
+            frame_gains[i] = gain
+        self.gain = gain
+        return x * _ramp(len(x), ends, start_gain, frame_gains)
+
+
+class AutomaticGainControl(Filter):
+    """Steers speech toward target_db, rising slowly and falling fast, without clipping.
+
+    Frames quieter than floor_db (silence, gated noise) hold the gain rather
+    than pulling it up. The learned gain is kept across reset(), so each
+    recording starts at the level the last one settled on.
+    """
+
+    name = "agc"
+
+    def __init__(
+        self,
+        sample_rate: int,
+        target_db: float = -20.0,
+        max_gain_db: float = 20.0,
+        min_gain_db: float = -10.0,
+        floor_db: float = -50.0,
+        rise_db_per_s: float = 10.0,
+        fall_db_per_s: float = 40.0,
+        frame_ms: int = 10,
+        budget: float | None = None,
+    ) -> None:
+        """Initialize AGC at unity gain.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            target_db: Speech RMS level to aim for in dBFS (default: -20)
+            max_gain_db: Most boost applied (default: 20)
+            min_gain_db: Most cut applied (default: -10)
+            floor_db: Frames below this RMS level don't adapt the gain (default: -50)
+            rise_db_per_s: Fastest gain increase (default: 10)
+            fall_db_per_s: Fastest gain decrease (default: 40)
+            frame_ms: Level measurement frame (default: 10)
+            budget: Override of the CPU budget
+        """
+        super().__init__(sample_rate, budget)
+        self.target_db = target_db
+        self.max_gain_db = max_gain_db
+        self.min_gain_db = min_gain_db
+        self.floor_db = floor_db
+        self.rise_step = rise_db_per_s * frame_ms / 1000
+        self.fall_step = fall_db_per_s * frame_ms / 1000
+        self.frame_len = max(1, sample_rate * frame_ms // 1000)
+        self.gain_db = 0.0
+        self._applied = 1.0  # Linear gain at the end of the last chunk
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Apply the adapted gain, ramped per frame and limited so no frame peak clips."""
+        if not len(x):
+            return x
+        ends, level_db, peak = _frame_levels(x, self.frame_len)
+        # Highest gain per frame that keeps its peak in range
+        limit_db = 20.0 * np.log10(32767.0 / np.maximum(peak, 1.0))
+        limit = 10 ** (limit_db / 20)
+        frame_gains = np.empty(len(ends), dtype=np.float32)
+        gain_db = self.gain_db
+        for i, level in enumerate(level_db):
+            if level > self.floor_db:
+                wanted = min(self.max_gain_db, max(self.min_gain_db, self.target_db - level))
+                gain_db += min(self.rise_step, max(-self.fall_step, wanted - gain_db))
+            frame_gains[i] = min(10 ** (gain_db / 20), limit[i])
+        gain = _ramp(len(x), ends, self._applied, frame_gains)
+        # The ramp into a loud frame starts above its limit - cap it there, or its first samples clip
+        np.minimum(gain, np.repeat(limit, np.diff(ends, prepend=0)).astype(np.float32), out=gain)
+        self.gain_db = gain_db
+        self._applied = float(frame_gains[-1])
+        return x * gain
+
+
+FILTERS: dict[str, type[Filter]] = {cls.name: cls for cls in (HighPassFilter, NoiseGate, AutomaticGainControl)}
+
+
+class DspChain:
+    """Runs PCM16 chunks through filters in order, timing each one."""
+
+    def __init__(self, filters: list[Filter], sample_rate: int) -> None:
+        """Initialize chain.
+
+        Args:
+            filters: Filters in processing order
+            sample_rate: Sample rate of the chunks in Hz
+        """
+        self.filters = filters
+        self.sample_rate = sample_rate
+
+    def reset(self) -> None:
+        """Reset every filter (start of a new, unrelated stream)."""
+        for f in self.filters:
+            f.reset()
+
+    def process(self, pcm: bytes | memoryview) -> bytes:
+        """Filter the next chunk of a stream.
+
+        Args:
+            pcm: PCM16 mono audio at sample_rate
+
+        Returns:
+            Filtered PCM16 audio, same length
+        """
+        x = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2).astype(np.float32)
+        chunk_seconds = len(x) / self.sample_rate
+        for f in self.filters:
+            started = time.perf_counter()
+            x = f.process(x)
+            f.account(time.perf_counter() - started, chunk_seconds)
+        return np.clip(np.rint(x), -32768, 32767).astype(np.int16).tobytes()
+
+    def stats(self) -> dict[str, dict]:
+        """Per-filter cost so far: chunks, mean/max µs per chunk, real-time factor, chunks over budget."""
+        return {
+            f.name: {
+                "chunks": f.chunks,
+                "mean_us": round(f.cpu_seconds / max(1, f.chunks) * 1e6, 1),
+                "max_us": round(f.max_seconds * 1e6, 1),
+                "rtf": round(f.cpu_seconds / f.audio_seconds, 5) if f.audio_seconds else 0.0,
+                "over_budget": f.over_budget,
+            }
+            for f in self.filters
+        }
+
+
+def build_chain(spec: list, sample_rate: int) -> DspChain:
+    """Build a chain from the audio.dsp config list.
+
+    Each entry is a filter name, or a one-key mapping of name to options.
+
+    Args:
+        spec: audio.dsp entries
+        sample_rate: Sample rate of the captured chunks in Hz
+
+    Returns:
+        Chain of the listed filters, in order
+
+    Raises:
+        ValueError: If an entry is malformed, names an unknown filter or has invalid options
+    """
+    filters = []
+    for entry in spec:
+        if isinstance(entry, str):
+            name, options = entry, {}
+        elif isinstance(entry, dict) and len(entry) == 1:
+            name, options = next(iter(entry.items()))
+            options = options or {}
+        else:
+            raise ValueError(f"Invalid audio.dsp entry {entry!r} (expected a filter name or {{name: {{options}}}})")
+        if name not in FILTERS:
+            raise ValueError(f"Unknown audio.dsp filter '{name}' (expected one of {', '.join(FILTERS)})")
+        try:
+            filters.append(FILTERS[name](sample_rate, **options))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid audio.dsp options for {name}: {e}") from e
+    return DspChain(filters, sample_rate)
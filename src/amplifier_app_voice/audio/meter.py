@@ -0,0 +1,68 @@
+"""Microphone level meter for amplifier-app-voice.
+
+The PortAudio callback only copies audio into the recording buffer. The
+meter runs as a task on the event loop a fixed number of times per second,
+reads whatever the callback has written since its last frame straight
+from that buffer (as hands-free end-of-speech detection does) and reduces
+it to RMS and peak levels with NumPy - so metering adds nothing to the
+callback, and its cost is bounded by the frame rate, not the chunk rate.
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .capture import AudioCapture
+
+SILENCE_DB = -96.0  # Floor for digital silence (PCM16 dynamic range)
+
+
+def levels(pcm: bytes | memoryview) -> tuple[float, float]:
+    """RMS and peak level of PCM16 audio.
+
+    Args:
+        pcm: PCM16 mono audio
+
+    Returns:
+        (rms_db, peak_db) in dBFS, SILENCE_DB for empty or silent audio
+    """
+    samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+    if len(samples) == 0:
+        return SILENCE_DB, SILENCE_DB
+    floats = samples.astype(np.float32)
+    rms = float(np.sqrt(np.mean(floats * floats)))
+    peak = float(np.max(np.abs(floats)))
+    return (
+        max(SILENCE_DB, 20.0 * np.log10(rms / 32768.0 + 1e-10)),
+        max(SILENCE_DB, 20.0 * np.log10(peak / 32768.0 + 1e-10)),
+    )
+
+
+async def watch_levels(
+    audio_capture: "AudioCapture",
+    render: Callable[[float, float, float], None],
+    fps: float = 15.0,
+) -> None:
+    """Render the current recording's length and level until cancelled.
+
+    Each frame measures the audio captured since the previous frame, so a
+    short burst between frames still shows up as a peak.
+
+    Args:
+        audio_capture: Capture that is currently recording
+        render: Called with (seconds recorded, rms_db, peak_db) once per frame
+        fps: Frames per second
+    """
+    bytes_per_second = audio_capture.sample_rate * 2  # PCM16 = 2 bytes per sample
+    processed = 0
+    rms_db = peak_db = SILENCE_DB
+    while True:
+        await asyncio.sleep(1 / fps)
+        length = audio_capture.length
+        if length > processed:
+            rms_db, peak_db = levels(memoryview(audio_capture.buffer)[processed:length])
+            processed = length
+        render(length / bytes_per_second, rms_db, peak_db)
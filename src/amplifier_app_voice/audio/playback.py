@@ -1,47 +1,239 @@
 """Audio playback for amplifier-app-voice."""
 
+import asyncio
+import threading
+from collections import deque
+
 import pyaudio
 
+from amplifier_app_voice.audio.resample import StreamingResampler
+from amplifier_app_voice.audio.utils import get_native_sample_rate
+
+
+class JitterBuffer:
+    """Bounded byte FIFO between the event loop and the PortAudio callback.
+
+    Writers add whole chunks; the audio callback reads exactly as many bytes
+    as the device asks for. Thread-safe, never blocks the reader.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize jitter buffer.
+
+        Args:
+            max_bytes: Maximum bytes held before writers must wait
+        """
+        self.max_bytes = max_bytes
+        self._chunks: deque[memoryview] = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of buffered bytes not yet handed to the device."""
+        return self._size
+
+    def try_put(self, data: bytes | memoryview) -> bool:
+        """Append data if it fits.
+
+        An empty buffer always accepts, so chunks larger than max_bytes can't stall.
+
+        Args:
+            data: PCM16 audio bytes
+
+        Returns:
+            True if appended, False if the buffer is full
+        """
+        with self._lock:
+            if self._size and self._size + len(data) > self.max_bytes:
+                return False
+            self._chunks.append(memoryview(data))
+            self._size += len(data)
+            return True
+
+    def read(self, size: int) -> bytes:
+        """Remove and return up to size bytes (fewer on underrun).
+
+        Args:
+            size: Number of bytes wanted
+
+        Returns:
+            Buffered audio, possibly shorter than size
+        """
+        out = bytearray()
+        with self._lock:
+            while self._chunks and len(out) < size:
+                chunk = self._chunks[0]
+                take = size - len(out)
+                if len(chunk) <= take:
+                    out += chunk
+                    self._chunks.popleft()
+                else:
+                    out += chunk[:take]
+                    self._chunks[0] = chunk[take:]
+            self._size -= len(out)
+        return bytes(out)
+
+    def clear(self) -> int:
+        """Discard all buffered audio.
+
+        Returns:
+            Number of bytes discarded
+        """
+        with self._lock:
+            discarded = self._size
+            self._chunks.clear()
+            self._size = 0
+        return discarded
+
 
 class AudioPlayback:
     """Plays audio through speakers using PyAudio.
 
     Handles PCM16 audio at 24kHz mono, matching OpenAI Realtime API format.
-    Playback is blocking - waits for audio to complete before returning.
+    One output stream stays open for the session; its callback pulls from a
+    bounded jitter buffer on PortAudio's audio thread, so audio fed from the
+    event loop starts playing with the next callback and never blocks the loop.
+
+    With native_rate the device is opened at its own default rate and fed
+    audio is resampled from sample_rate on the way into the buffer.
+
+    Output underflows and overflows reported by PortAudio are counted in
+    underflows and overflows.
     """
 
-    def __init__(self, device_index: int | None = None, sample_rate: int = 24000) -> None:
+    def __init__(
+        self,
+        device_index: int | None = None,
+        sample_rate: int = 24000,
+        buffer_size: int = 1024,
+        max_buffer_ms: int = 2000,
+        native_rate: bool = False,
+        pa: pyaudio.PyAudio | None = None,
+    ) -> None:
         """Initialize audio playback.
 
         Args:
             device_index: Output device index (None = system default)
             sample_rate: Sample rate in Hz (default: 24000 for OpenAI)
+            buffer_size: Frames per device callback (default: 1024)
+            max_buffer_ms: Jitter buffer capacity in milliseconds (default: 2000)
+            native_rate: Open the device at its native rate and resample (default: False)
+            pa: Shared PyAudio instance, terminated by its owner (default: create one)
         """
         self.device_index = device_index
         self.sample_rate = sample_rate
-        self.p = pyaudio.PyAudio()
+        self.buffer_size = buffer_size
+        self.played_bytes = 0
+        self.underflows = 0  # Callbacks flagged paOutputUnderflow (the device played a gap)
+        self.overflows = 0  # Callbacks flagged paOutputOverflow
+        self._owns_pa = pa is None
+        self.p = pa or pyaudio.PyAudio()
+        self.stream: pyaudio.Stream | None = None
+        self.device_rate = get_native_sample_rate(self.p, device_index, "output") if native_rate else sample_rate
+        self._resampler = StreamingResampler(sample_rate, self.device_rate) if self.device_rate != sample_rate else None
+        self.buffer = JitterBuffer(max_bytes=self.bytes_per_second * max_buffer_ms // 1000)
 
-    def play(self, audio_data: bytes) -> None:
-        """Play PCM16 audio through speakers (blocking).
+    @property
+    def bytes_per_second(self) -> int:
+        """Buffered/played byte rate at the device (PCM16 mono)."""
+        return self.device_rate * 2
 
-        Args:
-            audio_data: PCM16 audio data as bytes
-        """
-        stream = self.p.open(
+    @property
+    def is_playing(self) -> bool:
+        """True while fed audio is still waiting to reach the device."""
+        return len(self.buffer) > 0
+
+    def start(self) -> None:
+        """Open the persistent output stream (no-op if already open)."""
+        if self.stream:
+            return
+
+        self.stream = self.p.open(
             format=pyaudio.paInt16,
             channels=1,
-            rate=self.sample_rate,
+            rate=self.device_rate,
             output=True,
             output_device_index=self.device_index,
+            frames_per_buffer=self.buffer_size,
+            stream_callback=self._callback,
         )
 
-        stream.write(audio_data)
-        stream.stop_stream()
-        stream.close()
+        self.stream.start_stream()
+
+    def _callback(self, in_data: bytes | None, frame_count: int, time_info: dict, status: int) -> tuple[bytes, int]:
+        """Callback for audio stream.
+
+        Args:
+            in_data: Unused for output streams
+            frame_count: Number of frames requested
+            time_info: Timing information
+            status: Stream status
+
+        Returns:
+            Tuple of (audio for this period, continue flag)
+        """
+        if status & pyaudio.paOutputUnderflow:
+            self.underflows += 1
+        if status & pyaudio.paOutputOverflow:
+            self.overflows += 1
+        wanted = frame_count * 2  # PCM16 = 2 bytes per sample
+        data = self.buffer.read(wanted)
+        self.played_bytes += len(data)
+        if len(data) < wanted:
+            # Underrun (or idle) - pad with silence rather than stalling the device
+            data += b"\x00" * (wanted - len(data))
+        return (data, pyaudio.paContinue)
+
+    async def feed(self, audio_data: bytes | memoryview) -> None:
+        """Queue audio for playback, starting it immediately.
+
+        Only waits (without blocking the event loop) while the jitter buffer is full.
+
+        Args:
+            audio_data: PCM16 audio data
+        """
+        self.start()
+        if self._resampler:
+            audio_data = self._resampler.process(audio_data)
+        chunk_bytes = self.buffer_size * 2
+        view = memoryview(audio_data)
+        for offset in range(0, len(view), chunk_bytes):
+            chunk = view[offset : offset + chunk_bytes]
+            while not self.buffer.try_put(chunk):
+                await asyncio.sleep(self.buffer_size / self.device_rate)
+
+    async def drain(self) -> None:
+        """Wait until all fed audio has been handed to the device."""
+        while self.is_playing:
+            await asyncio.sleep(self.buffer_size / self.device_rate)
+
+    async def play(self, audio_data: bytes | memoryview) -> None:
+        """Play PCM16 audio through speakers and wait for it to finish.
+
+        Args:
+            audio_data: PCM16 audio data
+        """
+        await self.feed(audio_data)
+        await self.drain()
+
+    def flush(self) -> int:
+        """Drop any audio not yet played.
+
+        Returns:
+            Number of bytes discarded (at the device rate, see bytes_per_second)
+        """
+        if self._resampler:
+            self._resampler.reset()
+        return self.buffer.clear()
 
     def cleanup(self) -> None:
         """Release PyAudio resources.
 
         Should be called when done with playback to free system resources.
         """
-        self.p.terminate()
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        if self._owns_pa:
+            self.p.terminate()
@@ -0,0 +1,99 @@
+"""Streaming sample-rate conversion for amplifier-app-voice."""
+
+from math import gcd
+
+import numpy as np
+
+
+def design_lowpass(up: int, down: int, taps_per_phase: int, beta: float = 8.0, rolloff: float = 0.9) -> np.ndarray:
+    """Design the anti-aliasing/anti-imaging filter for up/down rate conversion.
+
+    Kaiser-windowed sinc at the upsampled rate, scaled by ``up`` so the
+    passband gain after zero-stuffing is unity.
+
+    Args:
+        up: Interpolation factor L
+        down: Decimation factor M
+        taps_per_phase: Filter taps per polyphase branch
+        beta: Kaiser window shape (higher = more stopband attenuation)
+        rolloff: Cutoff as a fraction of the lower Nyquist frequency
+
+    Returns:
+        Prototype filter of length up * taps_per_phase
+    """
+    n_taps = up * taps_per_phase
+    cutoff = rolloff * 0.5 / max(up, down)  # cycles per upsampled sample
+    t = np.arange(n_taps) - (n_taps - 1) / 2
+    return up * 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(n_taps, beta)
+
+
+class StreamingResampler:
+    """Rational polyphase resampler for chunked PCM16 mono audio.
+
+    Converts by L/M = out_rate/in_rate (reduced). Only the taps of the
+    polyphase branch needed for each output sample are evaluated. When
+    downsampling, the branches are lengthened by the decimation ratio so the
+    anti-aliasing filter's transition band stays as narrow relative to the
+    output band; the cost per input sample stays the same because there are
+    proportionally fewer output samples. The last input samples are carried
+    between calls, making the output independent of how the input is
+    chunked.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, taps_per_phase: int = 24) -> None:
+        """Initialize resampler.
+
+        Args:
+            in_rate: Input sample rate in Hz
+            out_rate: Output sample rate in Hz
+            taps_per_phase: Filter taps per output sample before decimation scaling (default: 24)
+        """
+        g = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.up = out_rate // g
+        self.down = in_rate // g
+        self.taps = taps_per_phase * -(-self.down // self.up)  # ceil(down / up), at least 1 when upsampling
+
+        # phases[p, k] = h[p + k * up]: the taps that meet input sample (base - k) in branch p
+        h = design_lowpass(self.up, self.down, self.taps)
+        self.phases = h.reshape(self.taps, self.up).T.astype(np.float32).copy()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget carried samples (start of a new, unrelated stream)."""
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._consumed = 0  # Input samples seen so far
+        self._produced = 0  # Output samples emitted so far
+
+    def process(self, pcm: bytes | memoryview) -> bytes:
+        """Resample the next chunk of a stream.
+
+        Args:
+            pcm: PCM16 mono audio at in_rate
+
+        Returns:
+            PCM16 mono audio at out_rate (length varies by chunk)
+        """
+        x = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2).astype(np.float32)
+        if self.up == self.down:
+            return bytes(pcm)
+
+        ext = np.concatenate((self._history, x))
+        first_in = self._consumed - (self.taps - 1)  # Global index of ext[0]
+        self._consumed += len(x)
+
+        # Outputs whose newest input sample has arrived: floor(n * down / up) < consumed
+        last = (self._consumed * self.up - 1) // self.down
+        n = np.arange(self._produced, last + 1, dtype=np.int64)
+        self._produced = last + 1
+        self._history = ext[len(ext) - (self.taps - 1) :]
+
+        if len(n) == 0:
+            return b""
+
+        pos = n * self.down
+        base = pos // self.up - first_in
+        window = base[:, None] - np.arange(self.taps)[None, :]
+        y = np.einsum("ij,ij->i", ext[window], self.phases[pos % self.up])
+        return np.clip(np.rint(y), -32768, 32767).astype(np.int16).tobytes()
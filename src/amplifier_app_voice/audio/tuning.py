@@ -0,0 +1,118 @@
+"""Adaptive capture buffer size for amplifier-app-voice.
+
+Smaller PortAudio buffers mean less capture latency, but below some size
+(which depends on the machine, its load and the audio driver) the callback
+can't keep up and the device reports input overflows - dropped audio.
+
+BufferTuner finds the smallest overflow-free size by trial: after
+SHRINK_AFTER clean recordings it steps down to the next size in
+BUFFER_SIZES, and a recording with overflows steps it back up. A size that
+overflows in RULE_OUT_AFTER recordings is too small for the device and
+isn't tried again (one overflow may just be a busy moment). What it learns
+is saved per device in ``~/.amplifier/cache/audio-buffers.json`` when the
+app stops (never during a turn), so the next launch starts from the tuned
+size; delete the file to re-tune.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+CACHE_FILE = Path.home() / ".amplifier" / "cache" / "audio-buffers.json"
+
+BUFFER_SIZES = (128, 256, 512, 1024, 2048, 4096)  # Frames per buffer, at the app sample rate
+SHRINK_AFTER = 5  # Consecutive clean recordings before trying a smaller buffer
+RULE_OUT_AFTER = 2  # Recordings with overflows before a size is never tried again
+
+
+def device_key(info: dict, rate: int) -> str:
+    """Identify a device across launches (indexes change when devices come and go).
+
+    Args:
+        info: PortAudio device info dict
+        rate: Rate the device is opened at
+    """
+    return f"{info.get('hostApi', 0)}:{info['name']}@{rate}"
+
+
+def _load_all() -> dict:
+    """Saved tuning for every device (empty if missing or unreadable)."""
+    try:
+        with CACHE_FILE.open() as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable audio buffer cache: {e}")
+        return {}
+
+
+class BufferTuner:
+    """Picks the smallest capture buffer size that records without overflows."""
+
+    def __init__(self, key: str, default: int = 1024) -> None:
+        """Initialize from what was learned about the device in earlier runs.
+
+        Args:
+            key: device_key() of the input device
+            default: Buffer size for a device seen for the first time
+        """
+        self.key = key
+        saved = _load_all().get(key, {})
+        self.buffer_size: int = saved.get("buffer_size", default)
+        self.too_small: int = saved.get("too_small", 0)  # Largest size ruled out
+        self.failures: dict[str, int] = saved.get("failures", {})  # Size -> recordings with overflows
+        self.clean = 0
+        self.unsaved = False  # Learned something save() hasn't stored yet
+
+    def observe(self, overflows: int) -> int | None:
+        """Account for one finished recording.
+
+        Args:
+            overflows: Input overflows the device reported during it
+
+        Returns:
+            The new buffer size, or None to keep the current one
+        """
+        size = self.buffer_size
+        if overflows:
+            self.clean = 0
+            self.failures[str(size)] = self.failures.get(str(size), 0) + 1
+            if self.failures[str(size)] >= RULE_OUT_AFTER:
+                self.too_small = max(self.too_small, size)
+            self.buffer_size = next((s for s in BUFFER_SIZES if s > size), size)
+        else:
+            self.clean += 1
+            smaller = [s for s in BUFFER_SIZES if self.too_small < s < size]
+            if smaller and self.clean >= SHRINK_AFTER:
+                self.clean = 0
+                self.buffer_size = smaller[-1]
+
+        if self.buffer_size == size and not overflows:
+            return None
+        self.unsaved = True
+        return self.buffer_size if self.buffer_size != size else None
+
+    def save(self) -> None:
+        """Store this device's tuning. Failures are logged, never raised.
+
+        Blocking file I/O; from the event loop use ``await asyncio.to_thread(tuner.save)``.
+        """
+        tmp = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            devices = _load_all()
+            devices[self.key] = {
+                "buffer_size": self.buffer_size,
+                "too_small": self.too_small,
+                "failures": self.failures,
+            }
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w") as f:
+                json.dump(devices, f, indent=2)
+            os.replace(tmp, CACHE_FILE)
+            self.unsaved = False
+        except Exception as e:
+            # Don't fail the turn; the next launch just tunes from where it last saved
+            logging.error(f"Failed to save audio buffer size: {e}")
+            tmp.unlink(missing_ok=True)
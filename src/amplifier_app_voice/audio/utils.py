@@ -31,6 +31,38 @@ def list_audio_devices() -> None:
     p.terminate()
 
 
+def get_device_info(p: pyaudio.PyAudio, device_index: int | None, kind: str = "input") -> dict:
+    """Get a device's PortAudio info dict.
+
+    Args:
+        p: PyAudio instance
+        device_index: Device index (None = system default for kind)
+        kind: "input" or "output"
+
+    Returns:
+        Device info (name, channels, defaultSampleRate, ...)
+    """
+    if device_index is not None:
+        return p.get_device_info_by_index(device_index)
+    if kind == "input":
+        return p.get_default_input_device_info()
+    return p.get_default_output_device_info()
+
+
+def get_native_sample_rate(p: pyaudio.PyAudio, device_index: int | None, kind: str = "input") -> int:
+    """Get a device's native (default) sample rate.
+
+    Args:
+        p: PyAudio instance
+        device_index: Device index (None = system default for kind)
+        kind: "input" or "output"
+
+    Returns:
+        Native sample rate in Hz
+    """
+    return int(get_device_info(p, device_index, kind)["defaultSampleRate"])
+
+
 def main() -> None:
     """CLI entry point for device listing."""
     import sys
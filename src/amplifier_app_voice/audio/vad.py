@@ -0,0 +1,118 @@
+"""Voice activity detection for amplifier-app-voice."""
+
+import numpy as np
+
+
+class VoiceActivityDetector:
+    """Energy and zero-crossing-rate voice activity detector.
+
+    Audio is split into fixed frames and classified in one vectorized pass:
+    a frame is speech when it is loud enough and its zero-crossing rate is
+    below that of broadband noise (hiss, fans). Works on PCM16 mono.
+
+    Used two ways:
+    - trim(): cut leading/trailing silence from a finished recording
+    - feed(): streaming end-of-speech detection for hands-free turns
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        frame_ms: int = 20,
+        threshold_db: float = -50.0,
+        max_zcr: float = 0.35,
+        pad_ms: int = 200,
+        min_speech_ms: int = 120,
+        end_of_speech_ms: int = 800,
+    ) -> None:
+        """Initialize detector.
+
+        Args:
+            sample_rate: Sample rate in Hz (default: 24000)
+            frame_ms: Analysis frame length in milliseconds (default: 20)
+            threshold_db: Minimum frame RMS level in dBFS for speech (default: -50)
+            max_zcr: Maximum zero crossings per sample for speech (default: 0.35)
+            pad_ms: Silence kept around speech when trimming (default: 200)
+            min_speech_ms: Speech needed before end-of-speech can trigger (default: 120)
+            end_of_speech_ms: Trailing silence that ends a hands-free turn (default: 800)
+        """
+        self.frame_len = sample_rate * frame_ms // 1000
+        self.frame_ms = frame_ms
+        self.threshold_db = threshold_db
+        self.max_zcr = max_zcr
+        self.pad_frames = pad_ms // frame_ms
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.end_of_speech_frames = max(1, end_of_speech_ms // frame_ms)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear streaming state before a new recording."""
+        self._pending = b""
+        self.speech_frames = 0
+        self.silence_frames = 0
+
+    def is_speech(self, pcm: bytes | memoryview) -> np.ndarray:
+        """Classify each complete frame of a PCM16 buffer.
+
+        Args:
+            pcm: PCM16 mono audio (a trailing partial frame is ignored)
+
+        Returns:
+            Boolean array, one entry per frame
+        """
+        samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+        n_frames = len(samples) // self.frame_len
+        if n_frames == 0:
+            return np.zeros(0, dtype=bool)
+
+        frames = samples[: n_frames * self.frame_len].reshape(n_frames, self.frame_len).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        level_db = 20.0 * np.log10(rms / 32768.0 + 1e-10)
+
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (self.frame_len - 1)
+
+        return (level_db > self.threshold_db) & (zcr < self.max_zcr)
+
+    def trim(self, pcm: bytes | memoryview) -> memoryview:
+        """Cut leading and trailing silence, keeping pad_ms around speech.
+
+        Args:
+            pcm: PCM16 mono audio
+
+        Returns:
+            Zero-copy view of the speech region (empty if no speech was found)
+        """
+        view = memoryview(pcm)
+        speech = np.flatnonzero(self.is_speech(view))
+        if len(speech) == 0:
+            return view[:0]
+
+        frame_bytes = self.frame_len * 2
+        start = max(int(speech[0]) - self.pad_frames, 0) * frame_bytes
+        end = min((int(speech[-1]) + 1 + self.pad_frames) * frame_bytes, len(view))
+        return view[start:end]
+
+    def feed(self, pcm: bytes | memoryview) -> bool:
+        """Process streamed audio and report whether the speaker has finished.
+
+        Args:
+            pcm: Next PCM16 chunk of the current recording
+
+        Returns:
+            True once speech has been heard and followed by end_of_speech_ms of silence
+        """
+        data = self._pending + bytes(pcm)
+        usable = len(data) // (self.frame_len * 2) * (self.frame_len * 2)
+        self._pending = data[usable:]
+
+        speech = self.is_speech(data[:usable])
+        if len(speech):
+            voiced = np.flatnonzero(speech)
+            if len(voiced):
+                self.speech_frames += len(voiced)
+                self.silence_frames = len(speech) - 1 - int(voiced[-1])
+            else:
+                self.silence_frames += len(speech)
+
+        return self.speech_frames >= self.min_speech_frames and self.silence_frames >= self.end_of_speech_frames
@@ -0,0 +1,212 @@
+"""Headless batch mode for amplifier-app-voice.
+
+Runs a directory of recorded utterances (WAV or raw PCM16) through the
+Realtime provider as independent turns. A fixed pool of Amplifier sessions
+works through the files in parallel, so throughput scales with the number of
+sessions rather than with how fast someone can press SPACE.
+
+For each input file ``<name>.wav`` the output directory gets ``<name>/``
+containing ``response.wav`` (if the response had audio) and
+``transcript.jsonl``.
+"""
+
+import asyncio
+import json
+import time
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich.markup import escape
+
+from .audio import codec
+from .audio.resample import StreamingResampler
+from .config import AppConfig
+from .pipeline import SYSTEM_PROMPT
+from .realtime import get_provider
+from .realtime import response_decoder
+from .realtime import user_audio_message
+from .session_manager import SessionManager
+from .session_manager import transcript_entry
+from .ui.terminal import TerminalUI
+
+AUDIO_SUFFIXES = (".wav", ".pcm")
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one input file."""
+
+    path: Path
+    duration_ms: int = 0
+    response_text: str = ""
+    elapsed_ms: int = 0
+    error: str | None = None
+
+
+def load_utterance(path: Path, sample_rate: int) -> bytes:
+    """Read a recorded utterance as PCM16 mono at sample_rate.
+
+    Args:
+        path: .wav file (mono, 16-bit, any rate) or .pcm file (raw PCM16 mono at sample_rate)
+        sample_rate: App sample rate
+
+    Returns:
+        PCM16 audio
+
+    Raises:
+        ValueError: If a WAV file isn't mono 16-bit PCM
+    """
+    if path.suffix.lower() == ".pcm":
+        return path.read_bytes()
+
+    with wave.open(str(path), "rb") as wav:
+        if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise ValueError(f"{path.name}: expected mono 16-bit PCM WAV")
+        rate = wav.getframerate()
+        pcm = wav.readframes(wav.getnframes())
+
+    if rate != sample_rate:
+        pcm = StreamingResampler(rate, sample_rate).process(pcm)
+    return pcm
+
+
+def _write_outputs(out_dir: Path, entries: list[dict], audio: bytes | None, sample_rate: int) -> None:
+    """Write transcript.jsonl and response.wav for one file."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with (out_dir / "transcript.jsonl").open("w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+    if audio:
+        with wave.open(str(out_dir / "response.wav"), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(audio)
+
+
+async def process_file(session_mgr: SessionManager, config: AppConfig, path: Path, output_dir: Path) -> BatchResult:
+    """Send one utterance to the provider and write its outputs.
+
+    Args:
+        session_mgr: Session (with provider) to use for this file
+        config: Application configuration
+        path: Input audio file
+        output_dir: Root output directory
+
+    Returns:
+        Result for the file (error set on failure)
+    """
+    result = BatchResult(path=path)
+    started = time.monotonic()
+    try:
+        provider = get_provider(session_mgr.session)
+        if not provider:
+            raise RuntimeError("openai-realtime provider not found in session")
+
+        pcm = await asyncio.to_thread(load_utterance, path, config.sample_rate)
+        result.duration_ms = int(len(pcm) / (config.sample_rate * 2) * 1000)  # PCM16 = 2 bytes per sample
+
+        encoder = codec.WireEncoder(config.wire_format, config.sample_rate)
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            user_audio_message(encoder.encode(pcm), encoder),
+        ]
+        async with asyncio.timeout(config.turn_deadline):
+            response = await provider.complete(messages)
+        result.response_text = response.content
+
+        raw = response.raw or {}
+        audio = None
+        if "audio_data" in raw:
+            audio = bytes(response_decoder(raw, config.sample_rate).decode(raw["audio_data"]))
+
+        entries = [
+            transcript_entry(
+                "user",
+                "[audio input]",
+                audio_metadata={
+                    "file": path.name,
+                    "format": encoder.wire_format,
+                    "sample_rate": encoder.sample_rate,
+                    "duration_ms": result.duration_ms,
+                    "bytes": len(pcm),
+                },
+            ),
+            transcript_entry(
+                "assistant",
+                response.content,
+                audio_metadata={"format": "pcm16", "sample_rate": config.sample_rate} if audio else None,
+            ),
+        ]
+        await asyncio.to_thread(_write_outputs, output_dir / path.stem, entries, audio, config.sample_rate)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.elapsed_ms = int((time.monotonic() - started) * 1000)
+    return result
+
+
+async def _worker(
+    session_mgr: SessionManager,
+    config: AppConfig,
+    files: asyncio.Queue[Path],
+    output_dir: Path,
+    results: list[BatchResult],
+    ui: TerminalUI,
+) -> None:
+    """Process files from the queue with one session until it's empty."""
+    while not files.empty():
+        path = files.get_nowait()
+        result = await process_file(session_mgr, config, path, output_dir)
+        results.append(result)
+        if result.error:
+            ui.show_status(f"❌ {escape(path.name)}: {escape(result.error)}", "red")
+        else:
+            reply = escape(result.response_text or "")
+            ui.show_status(f"✓ {escape(path.name)} ({result.elapsed_ms} ms): {reply}", "green")
+
+
+async def run_batch(config: AppConfig, input_dir: Path, output_dir: Path, concurrency: int = 4) -> list[BatchResult]:
+    """Process every utterance in input_dir with up to concurrency sessions.
+
+    Args:
+        config: Application configuration
+        input_dir: Directory of .wav/.pcm files
+        output_dir: Directory for per-file outputs
+        concurrency: Number of sessions processing files at once
+
+    Returns:
+        One result per input file, in completion order
+    """
+    ui = TerminalUI()
+    paths = sorted(p for p in input_dir.iterdir() if p.suffix.lower() in AUDIO_SUFFIXES)
+    if not paths:
+        ui.show_status(f"No .wav or .pcm files in {escape(str(input_dir))}", "yellow")
+        return []
+
+    files: asyncio.Queue[Path] = asyncio.Queue()
+    for path in paths:
+        files.put_nowait(path)
+
+    sessions = [SessionManager(config) for _ in range(max(1, min(concurrency, len(paths))))]
+    results: list[BatchResult] = []
+    started = time.monotonic()
+    try:
+        await asyncio.gather(*(session_mgr.create_session() for session_mgr in sessions))
+        ui.show_status(f"Processing {len(paths)} files with {len(sessions)} sessions...", "cyan")
+        await asyncio.gather(
+            *(_worker(session_mgr, config, files, output_dir, results, ui) for session_mgr in sessions)
+        )
+    finally:
+        await asyncio.gather(*(session_mgr.close() for session_mgr in sessions), return_exceptions=True)
+
+    elapsed = time.monotonic() - started
+    failed = sum(1 for result in results if result.error)
+    audio_seconds = sum(result.duration_ms for result in results) / 1000
+    ui.show_status(
+        f"Done: {len(results) - failed} ok, {failed} failed in {elapsed:.1f}s "
+        f"({audio_seconds / elapsed:.1f}x real time) -> {output_dir}",
+        "red" if failed else "green",
+    )
+    return results
@@ -0,0 +1 @@
+"""Benchmarks for amplifier-app-voice (run with ``python -m amplifier_app_voice.bench.<name>``)."""
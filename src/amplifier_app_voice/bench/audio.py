@@ -0,0 +1,166 @@
+"""Micro-benchmarks for the audio processing path.
+
+Each benchmark reports the CPU cost of processing one second of 24kHz
+PCM16 audio and the resulting real-time factor (lower is better; 0.01
+means 1% of a CPU core while streaming).
+
+Usage:
+    python -m amplifier_app_voice.bench.audio [codec] [dsp] [meter] [resample]
+"""
+
+import time
+from collections.abc import Callable
+
+import click
+import numpy as np
+
+from amplifier_app_voice.audio import codec
+from amplifier_app_voice.audio.dsp import FILTERS
+from amplifier_app_voice.audio.dsp import build_chain
+from amplifier_app_voice.audio.meter import levels
+from amplifier_app_voice.audio.resample import StreamingResampler
+from amplifier_app_voice.audio.resample import design_lowpass
+
+SAMPLE_RATE = 24000
+
+
+def _test_signal(seconds: float = 1.0, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Speech-like test signal: a few harmonics plus low-level noise."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    signal = sum(0.2 / k * np.sin(2 * np.pi * 180 * k * t) for k in range(1, 6))
+    signal += 0.01 * rng.standard_normal(len(t))
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes()
+
+
+def _time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    """Best-of-5 seconds per call."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def _report(name: str, seconds_per_audio_second: float) -> None:
+    """Print one benchmark line."""
+    print(f"{name:<28} {seconds_per_audio_second * 1e6:10.1f} µs/s   RTF {seconds_per_audio_second:.5f}")
+
+
+def bench_codec(repeat: int) -> None:
+    """G.711 encode/decode cost per second of audio."""
+    pcm = _test_signal()
+    print(f"\nWire codecs (1s of audio = {len(pcm)} bytes pcm16)")
+    print("-" * 60)
+    for wire_format in codec.WIRE_FORMATS[1:]:
+        encoded = codec.encode(pcm, wire_format)
+        _report(f"{wire_format} encode", _time_per_call(lambda f=wire_format: codec.encode(pcm, f), repeat))
+        _report(f"{wire_format} decode", _time_per_call(lambda f=wire_format, e=encoded: codec.decode(e, f), repeat))
+        print(f"{'':<28} {len(encoded)} bytes on the wire ({len(encoded) / len(pcm):.0%} of pcm16)")
+
+
+def _reference_resample(pcm: bytes, resampler: StreamingResampler) -> np.ndarray:
+    """Textbook resampling with the same filter: zero-stuff by L, filter the whole signal, keep every Mth sample.
+
+    Checks the streaming polyphase implementation, not the filter design
+    (tests/test_resample.py covers accuracy and anti-aliasing).
+    """
+    x = np.frombuffer(pcm, dtype=np.int16).astype(np.float64)
+    upsampled = np.zeros(len(x) * resampler.up)
+    upsampled[:: resampler.up] = x
+    h = design_lowpass(resampler.up, resampler.down, resampler.taps)
+    return np.convolve(upsampled, h)[:: resampler.down]
+
+
+def bench_resample(repeat: int) -> None:
+    """Streaming resampler cost, checked against one-shot filtering with the same prototype."""
+    print("\nStreaming resampler (1024-frame chunks, output vs. one-shot convolution)")
+    print("-" * 60)
+    for in_rate, out_rate in [(48000, 24000), (44100, 24000), (16000, 24000), (24000, 48000), (24000, 8000)]:
+        pcm = _test_signal(sample_rate=in_rate)
+        chunks = [pcm[i : i + 2048] for i in range(0, len(pcm), 2048)]
+        resampler = StreamingResampler(in_rate, out_rate)
+
+        def run(r: StreamingResampler = resampler, c: list[bytes] = chunks) -> bytes:
+            r.reset()
+            return b"".join(r.process(chunk) for chunk in c)
+
+        out = np.frombuffer(run(), dtype=np.int16)
+        ref = _reference_resample(pcm, resampler)[: len(out)]
+        error = np.max(np.abs(out - ref))
+        _report(f"{in_rate} -> {out_rate} Hz", _time_per_call(run, max(1, repeat // 10)))
+        print(f"{'':<28} max |error| vs one-shot: {error:.2f} LSB")
+
+
+def _rms_db(pcm: bytes) -> float:
+    """RMS level of PCM16 audio in dBFS."""
+    x = np.frombuffer(pcm, dtype=np.int16).astype(np.float64)
+    return float(20 * np.log10(np.sqrt(np.mean(x * x)) / 32768 + 1e-10))
+
+
+def bench_dsp(repeat: int) -> None:
+    """Capture DSP cost per filter and for the full chain, in capture-sized chunks, against each filter's budget."""
+    chunk_bytes = 1024 * 2  # Default buffer_size frames of PCM16
+    chunk_us = 1024 / SAMPLE_RATE * 1e6
+    pcm = _test_signal()
+    chunks = [pcm[i : i + chunk_bytes] for i in range(0, len(pcm), chunk_bytes)]
+    print(f"\nCapture DSP ({len(chunks)} chunks of 1024 frames; one chunk = {chunk_us / 1000:.1f} ms of audio)")
+    print("-" * 60)
+    for spec in [[name] for name in FILTERS] + [list(FILTERS)]:
+        chain = build_chain(spec, SAMPLE_RATE)
+
+        def run(c: object = chain) -> None:
+            c.reset()
+            for chunk in chunks:
+                c.process(chunk)
+
+        _report(" + ".join(spec), _time_per_call(run, max(1, repeat // 5)))
+        for f in chain.filters:
+            mean_us = f.cpu_seconds / f.chunks * 1e6
+            print(
+                f"{'':<28} {f.name}: {mean_us:.0f} µs/chunk (max {f.max_seconds * 1e6:.0f}), "
+                f"budget {f.budget * chunk_us:.0f} µs, {f.over_budget} over"
+            )
+
+    # What the chain does: quiet speech-like audio comes up to the AGC target, room noise stays down
+    rng = np.random.default_rng(1)
+    speech = (np.frombuffer(_test_signal(4.0), dtype=np.int16) * 0.05).astype(np.int16).tobytes()
+    noise = (rng.standard_normal(SAMPLE_RATE * 2) * 40).astype(np.int16).tobytes()
+    for label, audio in (("quiet speech", speech), ("room noise", noise)):
+        chain = build_chain(list(FILTERS), SAMPLE_RATE)
+        out = b"".join(chain.process(audio[i : i + chunk_bytes]) for i in range(0, len(audio), chunk_bytes))
+        tail = len(out) // 2 // 2 * 2  # Last half, after the gate and AGC have settled
+        print(f"{label:<28} {_rms_db(audio[tail:]):6.1f} dBFS in -> {_rms_db(out[tail:]):6.1f} dBFS out")
+
+
+def bench_meter(repeat: int) -> None:
+    """Level meter cost at its frame rate (it measures what was captured since the last frame)."""
+    print("\nLevel meter (RMS + peak per frame)")
+    print("-" * 60)
+    pcm = _test_signal()
+    for fps in (10, 15, 30, 60):
+        frame = pcm[: len(pcm) // fps // 2 * 2]
+        _report(f"{fps} fps", _time_per_call(lambda f=frame: levels(f), repeat) * fps)
+
+
+BENCHMARKS = {
+    "codec": bench_codec,
+    "dsp": bench_dsp,
+    "meter": bench_meter,
+    "resample": bench_resample,
+}
+
+
+@click.command()
+@click.argument("names", nargs=-1, type=click.Choice(sorted(BENCHMARKS)))
+@click.option("--repeat", default=50, help="Iterations per timing run")
+def main(names: tuple[str, ...], repeat: int) -> None:
+    """Run audio micro-benchmarks (all by default)."""
+    for name in names or BENCHMARKS:
+        BENCHMARKS[name](repeat)
+
+
+if __name__ == "__main__":
+    main()
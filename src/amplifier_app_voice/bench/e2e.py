@@ -0,0 +1,409 @@
+"""Offline end-to-end benchmark of the turn pipeline.
+
+Drives the real TurnPipeline, AudioCapture and AudioPlayback against a fake
+sound card fed from WAV fixtures (or a synthetic utterance), a scripted
+keyboard and a stub provider mounted under "openai-realtime". Needs no
+microphone, speakers, API key or network, so it runs headless in CI.
+
+Reports per-span turn latency (p50/p95 from the turn:timing events), bytes
+moved at each boundary, peak memory, and how long the event loop was
+stalled. --trace-memory adds the Python heap peak from tracemalloc, which
+slows the app down enough to skew the latency and stall numbers.
+--hook-delay makes every hook emit slow, to compare the event bus against
+inline delivery (--sync-hooks). --show-levels runs the level meter, to
+check it costs no audio callback overruns.
+
+Usage:
+    python -m amplifier_app_voice.bench.e2e [--fixtures DIR] [--turns N] [--trace-memory] [--json]
+"""
+
+import asyncio
+import json
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+
+import click
+import numpy as np
+
+from amplifier_app_voice.bench.fakes import FakeAudioDevice
+from amplifier_app_voice.bench.fakes import ScriptedKeyboard
+from amplifier_app_voice.bench.fakes import StubRealtimeProvider
+from amplifier_app_voice.bench.fakes import install_fake_pyaudio
+from amplifier_app_voice.bench.fakes import stub_session
+
+SAMPLE_RATE = 24000
+STALL_INTERVAL = 0.005  # Event loop probe period (seconds)
+STALL_THRESHOLD = 0.010  # Lateness counted as a stall (seconds)
+
+
+def _synthetic_utterance(seconds: float, sample_rate: int, pitch: float = 180.0) -> bytes:
+    """Voiced-speech stand-in with leading and trailing silence."""
+    rng = np.random.default_rng(int(pitch))
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))  # ~syllable rate
+    voiced = envelope * sum(0.2 / k * np.sin(2 * np.pi * pitch * k * t) for k in range(1, 6))
+    voiced += 0.005 * rng.standard_normal(len(t))
+    silence = np.zeros(int(sample_rate * 0.3))
+    signal = np.concatenate([silence, voiced, silence])
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes()
+
+
+def _load_wav(path: Path, sample_rate: int) -> bytes:
+    """Read a mono PCM16 WAV file and convert it to sample_rate.
+
+    Raises:
+        click.ClickException: If the file isn't mono 16-bit PCM
+    """
+    from amplifier_app_voice.audio.resample import StreamingResampler
+
+    with wave.open(str(path), "rb") as wav:
+        if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise click.ClickException(f"{path}: fixtures must be mono 16-bit PCM WAV")
+        rate = wav.getframerate()
+        pcm = wav.readframes(wav.getnframes())
+    if rate != sample_rate:
+        pcm = StreamingResampler(rate, sample_rate).process(pcm)
+    return pcm
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    """p50/p95/max of a list of values."""
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "max": float(max(values)),
+    }
+
+
+def _peak_rss_bytes() -> int:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports kilobytes
+
+
+async def _monitor_stalls(lateness: list[float]) -> None:
+    """Sample how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(STALL_INTERVAL)
+        lateness.append(loop.time() - start - STALL_INTERVAL)
+
+
+async def _wait_for_events(hooks, event: str, count: int, timeout: float) -> None:
+    """Wait until hooks has recorded count events named event."""
+    deadline = time.monotonic() + timeout
+    while sum(1 for name, _ in hooks.events if name == event) < count:
+        if time.monotonic() > deadline:
+            raise click.ClickException(f"Timed out waiting for {event} #{count}")
+        await asyncio.sleep(0.01)
+
+
+async def run_benchmark(
+    utterances: list[bytes],
+    device: FakeAudioDevice,
+    turns: int,
+    response_delay: float,
+    stream_input: bool,
+    trace_memory: bool = False,
+    hook_delay: float = 0.0,
+    sync_hooks: bool = False,
+    show_levels: bool = False,
+    stream_output: bool = True,
+    fail_every: int = 0,
+    response_timeout: float = 15.0,
+    adaptive_buffer: bool = False,
+    dsp: bool = False,
+) -> dict:
+    """Run turns through the pipeline and collect metrics.
+
+    Args:
+        utterances: PCM16 at the device rate, spoken in rotation
+        device: Fake sound card (already installed as pyaudio)
+        turns: Number of turns to run
+        response_delay: Stub provider think time in seconds
+        stream_input: Stream microphone audio to the provider while recording
+        trace_memory: Measure the Python heap peak with tracemalloc
+        hook_delay: Seconds each hook emit takes (a slow logging hook)
+        sync_hooks: Deliver hook events inline instead of from the event bus
+        show_levels: Run the microphone level meter while recording
+        stream_output: Play and show the response as the provider streams it
+        fail_every: Every Nth provider request hangs until the app times it out (0 = never)
+        response_timeout: Seconds before the app cancels and retries a request
+        adaptive_buffer: Let the pipeline tune the capture buffer size
+        dsp: Run captured audio through the full DSP chain (high-pass, noise gate, AGC)
+
+    Returns:
+        Metrics dict (see _print_report)
+    """
+    # Imported here so the fake pyaudio is in place first
+    from rich.console import Console
+
+    from amplifier_app_voice import tracing
+    from amplifier_app_voice.audio import dsp as audio_dsp
+    from amplifier_app_voice.audio.capture import AudioCapture
+    from amplifier_app_voice.audio import tuning
+    from amplifier_app_voice.audio.playback import AudioPlayback
+    from amplifier_app_voice.audio.vad import VoiceActivityDetector
+    from amplifier_app_voice.config import AppConfig
+    from amplifier_app_voice.pipeline import TurnPipeline
+    from amplifier_app_voice.session_manager import SessionManager
+    from amplifier_app_voice.ui.terminal import TerminalUI
+
+    config = AppConfig(
+        api_key="offline-benchmark",
+        stream_input=stream_input,
+        stream_output=stream_output,
+        sync_hooks=sync_hooks,
+        show_audio_levels=show_levels,
+        response_timeout=response_timeout,
+        adaptive_buffer=adaptive_buffer,
+        dsp=list(audio_dsp.FILTERS) if dsp else [],
+    )
+    responses = [
+        ("Sure, here is a short answer.", _synthetic_utterance(1.0, SAMPLE_RATE, pitch=220.0)),
+        ("That's a good question.", _synthetic_utterance(0.6, SAMPLE_RATE, pitch=200.0)),
+    ]
+    provider = StubRealtimeProvider(
+        responses, sample_rate=SAMPLE_RATE, response_delay=response_delay, fail_every=fail_every
+    )
+
+    ui = TerminalUI()
+    ui.console = Console(quiet=True)
+    keyboard = ScriptedKeyboard()
+    audio_capture = AudioCapture(
+        device_index=config.input_device,
+        sample_rate=config.sample_rate,
+        buffer_size=config.buffer_size,
+        max_duration=config.max_recording_duration,
+        native_rate=config.native_rate,
+        dsp=audio_dsp.build_chain(config.dsp, config.sample_rate) if config.dsp else None,
+    )
+    audio_playback = AudioPlayback(
+        device_index=config.output_device,
+        sample_rate=config.sample_rate,
+        buffer_size=config.buffer_size,
+        max_buffer_ms=config.playback_buffer_ms,
+        native_rate=config.native_rate,
+    )
+    vad = VoiceActivityDetector(sample_rate=config.sample_rate, threshold_db=config.vad_threshold_db)
+
+    lateness: list[float] = []
+    with tempfile.TemporaryDirectory() as session_dir:
+        session_mgr = SessionManager(config)
+        session_mgr.session = stub_session(provider, hook_delay)
+        session_mgr.session_id = "offline-benchmark"
+        session_mgr.session_dir = Path(session_dir)
+        hooks = session_mgr.session.coordinator.hooks
+
+        tuning.CACHE_FILE = Path(session_dir) / "audio-buffers.json"  # Start untuned, leave the real cache alone
+        pipeline = TurnPipeline(config, session_mgr, ui, keyboard, audio_capture, audio_playback, vad)
+        if trace_memory:
+            tracemalloc.start()
+        monitor = asyncio.create_task(_monitor_stalls(lateness))
+        run = asyncio.create_task(pipeline.run())
+        started = time.perf_counter()
+        try:
+            for turn in range(1, turns + 1):
+                utterance = utterances[(turn - 1) % len(utterances)]
+                keyboard.press()
+                device.say(utterance)
+                await device.wait_said()
+                keyboard.press()
+                timeout = 10 + (len(utterance) / device.bytes_per_second + response_delay) / device.speed
+                if fail_every:
+                    timeout += config.turn_deadline
+                await _wait_for_events(hooks, "turn:timing", turn, timeout)
+        finally:
+            elapsed = time.perf_counter() - started
+            heap_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+            tracemalloc.stop()
+            run.cancel()
+            monitor.cancel()
+            await asyncio.gather(run, monitor, return_exceptions=True)
+            audio_capture.cleanup()
+            audio_playback.cleanup()
+            await session_mgr.events.close()  # Deliver queued hook events
+            await asyncio.to_thread(session_mgr.writer.close)  # Drain timings.jsonl
+
+        spans = tracing.summarize(Path(session_dir) / "timings.jsonl")
+
+    outcomes = [data["outcome"] for name, data in hooks.events if name == "turn:timing"]
+    stalls = [late for late in lateness if late > STALL_THRESHOLD]
+    return {
+        "turns": turns,
+        "outcomes": {outcome: outcomes.count(outcome) for outcome in sorted(set(outcomes))},
+        "elapsed_s": round(elapsed, 3),
+        "spans_ms": spans,
+        "bytes": {
+            "captured": device.captured_bytes,
+            "uploaded": provider.received_bytes,
+            "response": provider.sent_bytes,
+            "played": audio_playback.played_bytes,
+        },
+        "memory": {"heap_peak": heap_peak, "rss_peak": _peak_rss_bytes()},
+        "context_bytes": {"first": provider.context_bytes[0], "max": max(provider.context_bytes)}
+        if provider.context_bytes
+        else {"first": 0, "max": 0},
+        "callbacks": {
+            "count": device.callbacks,
+            "mean_us": device.callback_seconds / max(1, device.callbacks) * 1e6,
+            "overruns": device.overruns,
+        },
+        "retries": {
+            "requests": provider.requests,
+            "retried": sum(1 for name, _ in hooks.events if name == "provider:retry"),
+            "retry_ms": sum(data["retry_ms"] for name, data in hooks.events if name == "turn:timing"),
+        },
+        "dsp": audio_capture.dsp.stats() if audio_capture.dsp else None,
+        "xruns": {**pipeline.xrun_counts(), "buffer_size": audio_capture.buffer_size},
+        "hook_events": {"delivered": session_mgr.events.delivered, "dropped": session_mgr.events.dropped},
+        "event_loop": {
+            "lateness_ms": {k: v * 1000 for k, v in _percentiles(lateness or [0.0]).items()},
+            "stalls": len(stalls),
+            "stalled_ms": sum(stalls) * 1000,
+        },
+    }
+
+
+def _print_report(results: dict) -> None:
+    """Print benchmark results as tables."""
+    outcomes = ", ".join(f"{n} {outcome}" for outcome, n in results["outcomes"].items())
+    print(f"\nEnd-to-end: {results['turns']} turns in {results['elapsed_s']:.1f}s ({outcomes})")
+
+    print(f"\n{'span':<28} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    print("-" * 68)
+    for name, stats in results["spans_ms"].items():
+        print(f"{name:<28} {stats['count']:>6} {stats['p50']:>10.1f} {stats['p95']:>10.1f} {stats['max']:>10.1f}")
+
+    print(f"\n{'bytes':<28} {'total':>12} {'per turn':>12}")
+    print("-" * 54)
+    for name, total in results["bytes"].items():
+        print(f"{name:<28} {total:>12,} {total // results['turns']:>12,}")
+
+    memory = results["memory"]
+    print(f"\nProcess peak RSS:               {memory['rss_peak'] / 2**20:.1f} MiB")
+    if memory["heap_peak"] is not None:
+        print(f"Python heap peak (tracemalloc): {memory['heap_peak'] / 2**20:.1f} MiB")
+
+    context = results["context_bytes"]
+    print(f"Request text (prompt+history): first {context['first']:,} bytes, max {context['max']:,} bytes")
+    callbacks = results["callbacks"]
+    print(
+        f"Audio callbacks:                {callbacks['count']} (mean {callbacks['mean_us']:.1f} µs), "
+        f"{callbacks['overruns']} overruns"
+    )
+    retries = results["retries"]
+    print(
+        f"Provider requests:              {retries['requests']} ({retries['retried']} retried, "
+        f"{retries['retry_ms']:.0f} ms lost to retries)"
+    )
+    for name, stats in (results["dsp"] or {}).items():
+        print(
+            f"DSP {name + ':':<27}{stats['mean_us']:.0f} µs/chunk (max {stats['max_us']:.0f}), "
+            f"RTF {stats['rtf']:.5f}, {stats['over_budget']} over budget"
+        )
+    xruns = results["xruns"]
+    print(
+        f"Xruns:                          capture {xruns['capture_overflows']} overflows, "
+        f"playback {xruns['playback_underflows']} underflows; capture buffer {xruns['buffer_size']} frames"
+    )
+    events = results["hook_events"]
+    print(f"Hook events:                    {events['delivered']} delivered, {events['dropped']} dropped")
+
+    loop = results["event_loop"]
+    lateness = loop["lateness_ms"]
+    print(
+        f"\nEvent loop lateness: p50 {lateness['p50']:.2f} ms, p95 {lateness['p95']:.2f} ms, "
+        f"max {lateness['max']:.2f} ms; {loop['stalls']} stalls > {STALL_THRESHOLD * 1000:.0f} ms "
+        f"({loop['stalled_ms']:.1f} ms total)"
+    )
+
+
+@click.command()
+@click.option(
+    "--fixtures",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of mono PCM16 WAV utterances",
+)
+@click.option("--turns", default=10, help="Number of turns to run")
+@click.option("--response-delay", default=0.3, help="Stub provider response delay (seconds)")
+@click.option("--device-rate", default=48000, help="Native rate of the fake sound card")
+@click.option("--speed", default=1.0, help="Fake device clock multiplier (>1 runs faster than real time)")
+@click.option("--stream-input/--no-stream-input", default=True, help="Stream audio while recording")
+@click.option("--trace-memory", is_flag=True, help="Measure the Python heap peak (slows the run)")
+@click.option("--hook-delay", default=0.0, help="Seconds each hook emit takes (simulates a slow logging hook)")
+@click.option("--sync-hooks", is_flag=True, help="Deliver hook events inline instead of from the event bus")
+@click.option("--stream-output/--no-stream-output", default=True, help="Play the response as it streams")
+@click.option("--show-levels", is_flag=True, help="Run the microphone level meter while recording")
+@click.option("--fail-every", type=int, default=0, help="Make every Nth provider request hang (0 = never)")
+@click.option("--response-timeout", type=float, default=15.0, help="Seconds before a request is cancelled and retried")
+@click.option("--adaptive-buffer", is_flag=True, help="Tune the capture buffer size as the app does")
+@click.option(
+    "--min-stable-buffer", type=int, default=0, help="Capture buffers below this many frames overflow (0 = none)"
+)
+@click.option("--dsp", is_flag=True, help="Run captured audio through the high-pass, noise gate and AGC chain")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSON")
+def main(
+    fixtures: Path | None,
+    turns: int,
+    response_delay: float,
+    device_rate: int,
+    speed: float,
+    stream_input: bool,
+    stream_output: bool,
+    trace_memory: bool,
+    hook_delay: float,
+    sync_hooks: bool,
+    show_levels: bool,
+    fail_every: int,
+    response_timeout: float,
+    adaptive_buffer: bool,
+    min_stable_buffer: int,
+    dsp: bool,
+    as_json: bool,
+) -> None:
+    """Run the offline end-to-end turn benchmark."""
+    device = FakeAudioDevice(
+        sample_rate=device_rate, speed=speed, min_stable_frames=min_stable_buffer * device_rate // SAMPLE_RATE
+    )
+    install_fake_pyaudio(device)
+
+    if fixtures:
+        utterances = [_load_wav(path, device_rate) for path in sorted(fixtures.glob("*.wav"))]
+        if not utterances:
+            raise click.ClickException(f"No .wav files in {fixtures}")
+    else:
+        utterances = [_synthetic_utterance(1.5, device_rate), _synthetic_utterance(0.8, device_rate, pitch=140.0)]
+
+    results = asyncio.run(
+        run_benchmark(
+            utterances,
+            device,
+            turns,
+            response_delay,
+            stream_input,
+            trace_memory,
+            hook_delay,
+            sync_hooks,
+            show_levels,
+            stream_output,
+            fail_every,
+            response_timeout,
+            adaptive_buffer,
+            dsp,
+        )
+    )
+    if as_json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""Stand-ins for audio devices, the keyboard and the Realtime provider.
+
+These let the app run headless with no sound card, no key presses and no
+network: a fake PyAudio whose streams run their callbacks on timer threads
+(feeding the microphone from queued PCM), a scripted keyboard, and a stub
+provider mounted under "openai-realtime" that answers with canned text and
+audio after configurable delays.
+
+install_fake_pyaudio() must run before amplifier_app_voice.audio is imported,
+so this module only imports from the app lazily.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+PA_INT16 = 8
+PA_CONTINUE = 0
+PA_COMPLETE = 1
+PA_INPUT_UNDERFLOW = 1
+PA_INPUT_OVERFLOW = 2
+PA_OUTPUT_UNDERFLOW = 4
+PA_OUTPUT_OVERFLOW = 8
+
+
+class FakeAudioDevice:
+    """One duplex sound card shared by every FakePyAudio instance."""
+
+    def __init__(self, sample_rate: int = 24000, speed: float = 1.0, min_stable_frames: int = 0) -> None:
+        """Initialize device.
+
+        Args:
+            sample_rate: Native rate reported to the app
+            speed: Clock multiplier (2.0 runs callbacks twice as fast as real time)
+            min_stable_frames: Input buffers of fewer frames report overflows (a machine that can't keep up)
+        """
+        self.sample_rate = sample_rate
+        self.speed = speed
+        self.min_stable_frames = min_stable_frames
+        self.captured_bytes = 0
+        self.played_bytes = 0
+        self.callbacks = 0
+        self.callback_seconds = 0.0  # Time spent inside stream callbacks
+        self.overruns = 0  # Callbacks that finished after their buffer period was over
+        self._mic: deque[memoryview] = deque()
+        self._mic_lock = threading.Lock()
+        self._mic_idle = threading.Event()
+        self._mic_idle.set()
+
+    @property
+    def bytes_per_second(self) -> int:
+        """Microphone byte rate (PCM16 mono)."""
+        return self.sample_rate * 2
+
+    def info(self, index: int = 0) -> dict:
+        """PortAudio-style device info dict."""
+        return {
+            "index": index,
+            "name": "Fake duplex device",
+            "maxInputChannels": 1,
+            "maxOutputChannels": 1,
+            "defaultSampleRate": float(self.sample_rate),
+        }
+
+    def say(self, pcm: bytes) -> None:
+        """Queue PCM16 audio (at the device rate) to come out of the microphone.
+
+        Args:
+            pcm: PCM16 mono audio
+        """
+        with self._mic_lock:
+            self._mic.append(memoryview(pcm))
+            self._mic_idle.clear()
+
+    async def wait_said(self) -> None:
+        """Wait until all queued microphone audio has been delivered."""
+        while not self._mic_idle.is_set():
+            await asyncio.sleep(0.005)
+
+    def read_mic(self, size: int) -> bytes:
+        """Next size bytes of microphone audio, padded with silence."""
+        out = bytearray()
+        with self._mic_lock:
+            while self._mic and len(out) < size:
+                chunk = self._mic[0]
+                take = size - len(out)
+                out += chunk[:take]
+                if len(chunk) <= take:
+                    self._mic.popleft()
+                else:
+                    self._mic[0] = chunk[take:]
+            if not self._mic:
+                self._mic_idle.set()
+        self.captured_bytes += size
+        return bytes(out) + b"\x00" * (size - len(out))
+
+
+class FakeStream:
+    """Callback stream driven by a timer thread at the device's pace."""
+
+    def __init__(self, device: FakeAudioDevice, **kwargs: Any) -> None:
+        """Initialize stream with the arguments of PyAudio.open()."""
+        self.device = device
+        self.rate = kwargs["rate"]
+        self.frames = kwargs.get("frames_per_buffer", 1024)
+        self.is_input = kwargs.get("input", False)
+        self.callback = kwargs["stream_callback"]
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start_stream(self) -> None:
+        """Start calling the callback."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop_stream(self) -> None:
+        """Stop calling the callback."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Close the stream."""
+        self.stop_stream()
+
+    def is_active(self) -> bool:
+        """True while the callback thread runs."""
+        return self._thread is not None
+
+    def _run(self) -> None:
+        """Invoke the callback once per period, on an absolute schedule so it doesn't drift.
+
+        Like PortAudio, flags a callback with an overflow (input) or underflow
+        (output) when the previous one overran its period.
+        """
+        period = self.frames / self.rate / self.device.speed
+        deadline = time.monotonic()
+        late = False
+        while not self._stop.is_set():
+            started = time.monotonic()
+            if self.is_input:
+                status = PA_INPUT_OVERFLOW if late or self.frames < self.device.min_stable_frames else 0
+                _, flag = self.callback(self.device.read_mic(self.frames * 2), self.frames, {}, status)
+            else:
+                data, flag = self.callback(None, self.frames, {}, PA_OUTPUT_UNDERFLOW if late else 0)
+                self.device.played_bytes += len(data)
+            finished = time.monotonic()
+            self.device.callbacks += 1
+            self.device.callback_seconds += finished - started
+            late = finished > deadline + period
+            if late:
+                self.device.overruns += 1  # A real device would have dropped or repeated a buffer
+            if flag != PA_CONTINUE:
+                break
+            deadline += period
+            self._stop.wait(max(0.0, deadline - time.monotonic()))
+
+
+class FakePyAudio:
+    """Drop-in for pyaudio.PyAudio backed by FakeAudioDevice."""
+
+    device = FakeAudioDevice()
+
+    def open(self, **kwargs: Any) -> FakeStream:
+        """Open a callback stream on the fake device."""
+        return FakeStream(self.device, **kwargs)
+
+    def get_device_count(self) -> int:
+        """Number of devices (always one)."""
+        return 1
+
+    def get_device_info_by_index(self, index: int) -> dict:
+        """Device info for index."""
+        return self.device.info(index)
+
+    def get_default_input_device_info(self) -> dict:
+        """Default input device info."""
+        return self.device.info()
+
+    def get_default_output_device_info(self) -> dict:
+        """Default output device info."""
+        return self.device.info()
+
+    def terminate(self) -> None:
+        """Release the (fake) PortAudio instance."""
+
+
+def install_fake_pyaudio(device: FakeAudioDevice) -> None:
+    """Replace the pyaudio module with one whose PyAudio opens fake streams.
+
+    Args:
+        device: Device all fake streams run on
+    """
+    FakePyAudio.device = device
+    module = types.ModuleType("pyaudio")
+    module.PyAudio = FakePyAudio
+    module.Stream = FakeStream
+    module.paInt16 = PA_INT16
+    module.paContinue = PA_CONTINUE
+    module.paComplete = PA_COMPLETE
+    module.paInputUnderflow = PA_INPUT_UNDERFLOW
+    module.paInputOverflow = PA_INPUT_OVERFLOW
+    module.paOutputUnderflow = PA_OUTPUT_UNDERFLOW
+    module.paOutputOverflow = PA_OUTPUT_OVERFLOW
+    sys.modules["pyaudio"] = module
+
+
+class ScriptedKeyboard:
+    """KeyboardHandler replacement driven by press() calls instead of pynput."""
+
+    def __init__(self) -> None:
+        """Initialize keyboard state and async events."""
+        self.recording = False
+        self._start_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+
+    def start(self) -> None:
+        """No listener to start."""
+
+    def stop(self) -> None:
+        """No listener to stop."""
+
+    def press(self) -> None:
+        """Simulate a spacebar press (toggles recording)."""
+        self.recording = not self.recording
+        (self._start_event if self.recording else self._stop_event).set()
+
+    async def wait_for_press(self) -> None:
+        """Wait for a press that starts recording (including one made before waiting)."""
+        await self._start_event.wait()
+        self._start_event.clear()
+
+    async def wait_for_release(self) -> None:
+        """Wait for a press that stops recording (including one made before waiting)."""
+        await self._stop_event.wait()
+        self._stop_event.clear()
+
+    def end_recording(self) -> None:
+        """Mark recording as stopped without a key press."""
+        self.recording = False
+
+
+class StubRealtimeProvider:
+    """Local provider answering every turn with canned text and audio.
+
+    Implements the optional input streaming, response streaming, clear and
+    cancel methods, so the app takes the same code paths as with the real provider.
+    stream() takes as long as complete() in total but spreads the answer
+    over 100ms audio deltas, like a model generating it.
+    """
+
+    def __init__(
+        self,
+        responses: list[tuple[str, bytes]],
+        sample_rate: int = 24000,
+        commit_delay: float = 0.05,
+        response_delay: float = 0.3,
+        fail_every: int = 0,
+    ) -> None:
+        """Initialize stub provider.
+
+        Args:
+            responses: (text, PCM16 audio) answers, used in rotation
+            sample_rate: Sample rate of the response audio
+            commit_delay: Seconds commit_input_audio() takes
+            response_delay: Seconds complete() takes before answering
+            fail_every: Every Nth request hangs without answering (0 = never)
+        """
+        self.responses = responses
+        self.sample_rate = sample_rate
+        self.commit_delay = commit_delay
+        self.response_delay = response_delay
+        self.received_bytes = 0
+        self.sent_bytes = 0
+        self.turns = 0
+        self.cancelled = 0
+        self.cleared = 0
+        self.fail_every = fail_every
+        self.requests = 0
+        self.context_bytes: list[int] = []  # Text sent with each request (system prompt and history)
+
+    async def append_input_audio(self, chunk: bytes) -> None:
+        """Accept streamed input audio."""
+        self.received_bytes += len(chunk)
+
+    async def commit_input_audio(self) -> None:
+        """Commit streamed input audio as the user turn."""
+        await asyncio.sleep(self.commit_delay)
+
+    async def clear_input_audio(self) -> None:
+        """Discard streamed input audio that won't be committed."""
+        self.cleared += 1
+
+    async def cancel_response(self, audio_end_ms: int) -> None:
+        """Cancel the in-flight response."""
+        self.cancelled += 1
+
+    async def _next_response(self, messages: list[dict]) -> tuple[str, bytes]:
+        """Count what was sent in messages and pick the next canned answer (or hang, see fail_every)."""
+        self.requests += 1
+        if self.fail_every and self.requests % self.fail_every == 0:
+            await asyncio.Event().wait()  # Until the app's timeout cancels the request
+        context = 0
+        for message in messages:
+            if isinstance(message["content"], str):
+                context += len(message["content"].encode())
+            for part in message["content"] if isinstance(message["content"], list) else []:
+                if part.get("type") == "audio":
+                    self.received_bytes += len(part["data"])
+        self.context_bytes.append(context)
+        response = self.responses[self.turns % len(self.responses)]
+        self.turns += 1
+        return response
+
+    async def complete(self, messages: list[dict]) -> Any:
+        """Answer the turn after response_delay."""
+        text, audio = await self._next_response(messages)
+        await asyncio.sleep(self.response_delay)
+        self.sent_bytes += len(audio)
+        return types.SimpleNamespace(
+            content=text,
+            raw={
+                "audio_data": audio,
+                "audio_format": "pcm16",
+                "sample_rate": self.sample_rate,
+                "input_transcript": f"Question number {self.turns}?",
+            },
+        )
+
+    async def stream(self, messages: list[dict]) -> AsyncIterator[dict]:
+        """Answer the turn as text and audio deltas spread over response_delay."""
+        text, audio = await self._next_response(messages)
+        yield {"type": "input_transcript", "delta": f"Question number {self.turns}?"}
+        chunk_bytes = self.sample_rate // 10 * 2  # 100ms of PCM16
+        chunks = [audio[offset : offset + chunk_bytes] for offset in range(0, len(audio), chunk_bytes)]
+        words = text.split(" ")
+        for i, chunk in enumerate(chunks):
+            await asyncio.sleep(self.response_delay / len(chunks))
+            if i < len(words):
+                yield {"type": "text", "delta": words[i] if i == 0 else " " + words[i]}
+            self.sent_bytes += len(chunk)
+            yield {"type": "audio", "delta": chunk, "audio_format": "pcm16", "sample_rate": self.sample_rate}
+        if len(words) > len(chunks):
+            yield {"type": "text", "delta": (" " if chunks else "") + " ".join(words[len(chunks) :])}
+
+
+class RecordingHooks:
+    """Hook registry that keeps every emitted event."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Initialize empty event log.
+
+        Args:
+            delay: Seconds each emit takes (simulates a slow hook handler)
+        """
+        self.delay = delay
+        self.events: list[tuple[str, dict]] = []
+
+    async def emit(self, event: str, data: dict) -> None:
+        """Record an event."""
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.events.append((event, data))
+
+
+def stub_session(provider: StubRealtimeProvider, hook_delay: float = 0.0) -> Any:
+    """Minimal stand-in for an AmplifierSession with the provider mounted.
+
+    Args:
+        provider: Provider to mount under "openai-realtime"
+        hook_delay: Seconds each hook emit takes
+
+    Returns:
+        Object with coordinator.mount_points and coordinator.hooks
+    """
+    from amplifier_app_voice.realtime import PROVIDER_NAME
+
+    coordinator = types.SimpleNamespace(mount_points={"providers": {PROVIDER_NAME: provider}}, hooks=RecordingHooks(hook_delay))
+    return types.SimpleNamespace(coordinator=coordinator)
@@ -0,0 +1,161 @@
+"""Startup-time benchmark: where the time from launch to "Press SPACE" goes.
+
+Cold imports are timed in fresh interpreters (best of --repeat); the
+startup phases run in-process, first one after another and then the way
+async_main overlaps them. Phases whose dependencies are missing (no audio
+device, no Amplifier stack) are reported as skipped.
+
+Usage:
+    python -m amplifier_app_voice.bench.startup [--repeat N]
+"""
+
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import click
+
+IMPORTS = ["pyaudio", "pynput", "rich", "numpy", "yaml", "amplifier_core", "amplifier_profiles"]
+
+
+def _cold(code: str, repeat: int) -> float:
+    """Best-of-repeat wall time (seconds) of running code in a fresh interpreter.
+
+    Raises:
+        RuntimeError: If the code fails
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        best = min(best, elapsed)
+    return best
+
+
+def _report(name: str, fn: Callable[[], float]) -> float | None:
+    """Run one measurement and print it (or why it was skipped)."""
+    try:
+        seconds = fn()
+    except Exception as e:
+        print(f"{name:<40} {'skipped':>10}   {type(e).__name__}: {e}")
+        return None
+    print(f"{name:<40} {seconds * 1000:10.1f} ms")
+    return seconds
+
+
+def _timed(fn: Callable[[], object]) -> Callable[[], float]:
+    """Wrap fn so calling it returns its duration in seconds."""
+
+    def run() -> float:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+
+    return run
+
+
+def _config():
+    """Configuration to start with (the user's, if it loads)."""
+    from amplifier_app_voice.config import AppConfig
+    from amplifier_app_voice.config import load_config
+
+    try:
+        return load_config()
+    except ValueError:
+        return AppConfig(api_key="startup-benchmark")
+
+
+def _open_and_close_audio(config) -> None:
+    """Open the devices the way async_main does, then release them."""
+    from amplifier_app_voice.main import open_audio
+
+    pa, audio_capture, audio_playback = open_audio(config)
+    audio_capture.cleanup()
+    audio_playback.cleanup()
+    pa.terminate()
+
+
+async def _connect(mount_plan: dict) -> None:
+    """Enter and exit an AmplifierSession."""
+    from amplifier_core import AmplifierSession
+
+    session = AmplifierSession(config=mount_plan)
+    await session.__aenter__()
+    await session.__aexit__(None, None, None)
+
+
+async def _overlapped(config) -> None:
+    """Startup as async_main runs it: devices in a thread while the session compiles and connects."""
+    from amplifier_app_voice.session_manager import SessionManager
+
+    async def session() -> None:
+        await _connect(await asyncio.to_thread(SessionManager(config).compile_mount_plan))
+
+    await asyncio.gather(asyncio.to_thread(_open_and_close_audio, config), session())
+
+
+@click.command()
+@click.option("--repeat", default=3, help="Fresh interpreters per cold-import timing")
+def main(repeat: int) -> None:
+    """Break down startup time by phase."""
+    print("\nCold start (fresh interpreter, best of --repeat)")
+    print("-" * 68)
+    _report("python (baseline)", lambda: _cold("pass", repeat))
+    _report("amplifier-voice --help", lambda: _cold("from amplifier_app_voice.main import main; main(['--help'])", repeat))
+    for module in IMPORTS:
+        _report(f"import {module}", lambda m=module: _cold(f"import {m}", repeat))
+
+    print("\nStartup phases (in-process)")
+    print("-" * 68)
+    config = _config()
+
+    def portaudio_init() -> None:
+        import pyaudio
+
+        pyaudio.PyAudio().terminate()
+
+    def compile_plan() -> None:
+        from amplifier_app_voice.session_manager import SessionManager
+
+        phases["mount_plan"] = SessionManager(config).compile_mount_plan()
+
+    def compile_plan_uncached() -> None:
+        from amplifier_app_voice import plan_cache
+
+        # An empty cache directory forces a compile without touching the real cache
+        cache_dir = plan_cache.CACHE_DIR
+        with tempfile.TemporaryDirectory() as empty:
+            plan_cache.CACHE_DIR = Path(empty)
+            try:
+                compile_plan()
+            finally:
+                plan_cache.CACHE_DIR = cache_dir
+
+    phases: dict = {}
+    # First PortAudio init pays the shared-library and host API setup; the second shows the per-instance cost
+    _report("PortAudio init (first)", _timed(portaudio_init))
+    _report("PortAudio init (again)", _timed(portaudio_init))
+    audio = _report("open audio devices (shared PortAudio)", _timed(lambda: _open_and_close_audio(config)))
+    _report("profile load + compile (no cache)", _timed(compile_plan_uncached))
+    plan = _report("mount plan (cached)", _timed(compile_plan))
+    connect = None
+    if "mount_plan" in phases:
+        connect = _report("session connect", _timed(lambda: asyncio.run(_connect(phases["mount_plan"]))))
+
+    if None in (audio, plan, connect):
+        print("\n(sequential vs. overlapped total needs every phase)")
+        return
+    print("-" * 68)
+    print(f"{'sequential total':<40} {(audio + plan + connect) * 1000:10.1f} ms")
+    _report("overlapped total (as async_main)", _timed(lambda: asyncio.run(_overlapped(config))))
+
+
+if __name__ == "__main__":
+    main()
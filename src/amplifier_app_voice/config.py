@@ -2,10 +2,16 @@
 
 import os
 from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 
 import yaml
 
+from .archive import ARCHIVE_FORMATS
+from .audio.codec import WIRE_FORMATS
+from .audio.dsp import build_chain
+from .transcript import DURABILITY_POLICIES
+
 
 @dataclass
 class AppConfig:
@@ -17,17 +23,48 @@ class AppConfig:
     voice: str = "alloy"
     temperature: float = 0.7
     max_response_tokens: int | None = None
+    response_timeout: float = 15.0  # Seconds without a response before an attempt is cancelled
+    turn_deadline: float = 30.0  # Seconds from end of recording to give up on the turn
+    max_retries: int = 2
+    breaker_threshold: int = 3  # Consecutive failed requests that pause requests
+    breaker_cooldown: float = 30.0
 
     # Audio settings
     input_device: int | None = None
     output_device: int | None = None
     sample_rate: int = 24000
     buffer_size: int = 1024
+    adaptive_buffer: bool = False  # Tune capture buffer_size per device (see audio.tuning)
     max_recording_duration: int = 30
+    stream_input: bool = True
+    stream_output: bool = True
+    playback_buffer_ms: int = 2000
+    persistent_input: bool = False
+    preroll_ms: int = 300
+    trim_silence: bool = True
+    hands_free: bool = False
+    vad_threshold_db: float = -50.0
+    end_of_speech_ms: int = 800
+    wire_format: str = "pcm16"
+    native_rate: bool = True
+    dsp: list = field(default_factory=list)  # Capture filter chain (see audio.dsp)
+
+    # Session log settings
+    transcript_durability: str = "flush"
+    transcript_flush_ms: int = 200
+    archive_audio: bool = False
+    archive_format: str = "wav"
+    sync_hooks: bool = False
+    hook_queue_size: int = 256
+    history_max_tokens: int = 2000
 
     # UI settings
     show_transcripts: bool = True
     show_audio_levels: bool = False
+    meter_fps: float = 15.0
+    live_display: bool = True
+    render_fps: float = 10.0
+    history_lines: int = 200
     show_timestamps: bool = False
     theme: str = "dark"
 
@@ -54,13 +91,42 @@ def load_config(config_path: Path | None = None, cli_overrides: dict | None = No
         "voice": "alloy",
         "temperature": 0.7,
         "max_response_tokens": None,
+        "response_timeout": 15.0,
+        "turn_deadline": 30.0,
+        "max_retries": 2,
+        "breaker_threshold": 3,
+        "breaker_cooldown": 30.0,
         "input_device": None,
         "output_device": None,
         "sample_rate": 24000,
         "buffer_size": 1024,
+        "adaptive_buffer": False,
         "max_recording_duration": 30,
+        "stream_input": True,
+        "stream_output": True,
+        "playback_buffer_ms": 2000,
+        "persistent_input": False,
+        "preroll_ms": 300,
+        "trim_silence": True,
+        "hands_free": False,
+        "vad_threshold_db": -50.0,
+        "end_of_speech_ms": 800,
+        "wire_format": "pcm16",
+        "native_rate": True,
+        "dsp": [],
+        "transcript_durability": "flush",
+        "transcript_flush_ms": 200,
+        "archive_audio": False,
+        "archive_format": "wav",
+        "sync_hooks": False,
+        "hook_queue_size": 256,
+        "history_max_tokens": 2000,
         "show_transcripts": True,
         "show_audio_levels": False,
+        "meter_fps": 15.0,
+        "live_display": True,
+        "render_fps": 10.0,
+        "history_lines": 200,
         "show_timestamps": False,
         "theme": "dark",
     }
@@ -86,6 +152,16 @@ def load_config(config_path: Path | None = None, cli_overrides: dict | None = No
                 config_dict["temperature"] = openai["temperature"]
             if "max_response_tokens" in openai:
                 config_dict["max_response_tokens"] = openai["max_response_tokens"]
+            if "response_timeout" in openai:
+                config_dict["response_timeout"] = openai["response_timeout"]
+            if "turn_deadline" in openai:
+                config_dict["turn_deadline"] = openai["turn_deadline"]
+            if "max_retries" in openai:
+                config_dict["max_retries"] = openai["max_retries"]
+            if "breaker_threshold" in openai:
+                config_dict["breaker_threshold"] = openai["breaker_threshold"]
+            if "breaker_cooldown" in openai:
+                config_dict["breaker_cooldown"] = openai["breaker_cooldown"]
 
         if "audio" in file_config:
             audio = file_config["audio"]
@@ -97,8 +173,51 @@ def load_config(config_path: Path | None = None, cli_overrides: dict | None = No
                 config_dict["sample_rate"] = audio["sample_rate"]
             if "buffer_size" in audio:
                 config_dict["buffer_size"] = audio["buffer_size"]
+            if "adaptive_buffer" in audio:
+                config_dict["adaptive_buffer"] = audio["adaptive_buffer"]
             if "max_recording_duration" in audio:
                 config_dict["max_recording_duration"] = audio["max_recording_duration"]
+            if "stream_input" in audio:
+                config_dict["stream_input"] = audio["stream_input"]
+            if "stream_output" in audio:
+                config_dict["stream_output"] = audio["stream_output"]
+            if "playback_buffer_ms" in audio:
+                config_dict["playback_buffer_ms"] = audio["playback_buffer_ms"]
+            if "persistent_input" in audio:
+                config_dict["persistent_input"] = audio["persistent_input"]
+            if "preroll_ms" in audio:
+                config_dict["preroll_ms"] = audio["preroll_ms"]
+            if "trim_silence" in audio:
+                config_dict["trim_silence"] = audio["trim_silence"]
+            if "hands_free" in audio:
+                config_dict["hands_free"] = audio["hands_free"]
+            if "vad_threshold_db" in audio:
+                config_dict["vad_threshold_db"] = audio["vad_threshold_db"]
+            if "end_of_speech_ms" in audio:
+                config_dict["end_of_speech_ms"] = audio["end_of_speech_ms"]
+            if "wire_format" in audio:
+                config_dict["wire_format"] = audio["wire_format"]
+            if "native_rate" in audio:
+                config_dict["native_rate"] = audio["native_rate"]
+            if "dsp" in audio:
+                config_dict["dsp"] = audio["dsp"] or []
+
+        if "session" in file_config:
+            session = file_config["session"]
+            if "transcript_durability" in session:
+                config_dict["transcript_durability"] = session["transcript_durability"]
+            if "transcript_flush_ms" in session:
+                config_dict["transcript_flush_ms"] = session["transcript_flush_ms"]
+            if "archive_audio" in session:
+                config_dict["archive_audio"] = session["archive_audio"]
+            if "archive_format" in session:
+                config_dict["archive_format"] = session["archive_format"]
+            if "sync_hooks" in session:
+                config_dict["sync_hooks"] = session["sync_hooks"]
+            if "hook_queue_size" in session:
+                config_dict["hook_queue_size"] = session["hook_queue_size"]
+            if "history_max_tokens" in session:
+                config_dict["history_max_tokens"] = session["history_max_tokens"]
 
         if "ui" in file_config:
             ui = file_config["ui"]
@@ -106,6 +225,14 @@ def load_config(config_path: Path | None = None, cli_overrides: dict | None = No
                 config_dict["show_transcripts"] = ui["show_transcripts"]
             if "show_audio_levels" in ui:
                 config_dict["show_audio_levels"] = ui["show_audio_levels"]
+            if "meter_fps" in ui:
+                config_dict["meter_fps"] = ui["meter_fps"]
+            if "live_display" in ui:
+                config_dict["live_display"] = ui["live_display"]
+            if "render_fps" in ui:
+                config_dict["render_fps"] = ui["render_fps"]
+            if "history_lines" in ui:
+                config_dict["history_lines"] = ui["history_lines"]
             if "show_timestamps" in ui:
                 config_dict["show_timestamps"] = ui["show_timestamps"]
             if "theme" in ui:
@@ -127,6 +254,62 @@ def load_config(config_path: Path | None = None, cli_overrides: dict | None = No
             "OpenAI API key is required. Set OPENAI_API_KEY environment variable, add to config file, or pass --api-key"
         )
 
+    if config_dict["buffer_size"] < 1:
+        raise ValueError(f"Invalid audio.buffer_size {config_dict['buffer_size']} (must be at least 1)")
+
+    if not isinstance(config_dict["dsp"], list):
+        raise ValueError("Invalid audio.dsp (expected a list of filters)")
+    build_chain(config_dict["dsp"], config_dict["sample_rate"])  # Raises ValueError for a bad chain
+
+    if config_dict["wire_format"] not in WIRE_FORMATS:
+        raise ValueError(
+            f"Invalid audio.wire_format '{config_dict['wire_format']}' (expected one of {', '.join(WIRE_FORMATS)})"
+        )
+
+    if config_dict["transcript_durability"] not in DURABILITY_POLICIES:
+        raise ValueError(
+            f"Invalid session.transcript_durability '{config_dict['transcript_durability']}' "
+            f"(expected one of {', '.join(DURABILITY_POLICIES)})"
+        )
+
+    if config_dict["archive_format"] not in ARCHIVE_FORMATS:
+        raise ValueError(
+            f"Invalid session.archive_format '{config_dict['archive_format']}' "
+            f"(expected one of {', '.join(ARCHIVE_FORMATS)})"
+        )
+
+    if config_dict["response_timeout"] <= 0:
+        raise ValueError(f"Invalid openai.response_timeout {config_dict['response_timeout']} (must be positive)")
+
+    if config_dict["turn_deadline"] <= 0:
+        raise ValueError(f"Invalid openai.turn_deadline {config_dict['turn_deadline']} (must be positive)")
+
+    if config_dict["max_retries"] < 0:
+        raise ValueError(f"Invalid openai.max_retries {config_dict['max_retries']} (must be 0 or more)")
+
+    if config_dict["breaker_threshold"] < 1:
+        raise ValueError(f"Invalid openai.breaker_threshold {config_dict['breaker_threshold']} (must be at least 1)")
+
+    if config_dict["breaker_cooldown"] < 0:
+        raise ValueError(f"Invalid openai.breaker_cooldown {config_dict['breaker_cooldown']} (must be 0 or more)")
+
+    if config_dict["meter_fps"] <= 0:
+        raise ValueError(f"Invalid ui.meter_fps {config_dict['meter_fps']} (must be positive)")
+
+    if config_dict["render_fps"] <= 0:
+        raise ValueError(f"Invalid ui.render_fps {config_dict['render_fps']} (must be positive)")
+
+    if config_dict["history_lines"] < 1:
+        raise ValueError(f"Invalid ui.history_lines {config_dict['history_lines']} (must be at least 1)")
+
+    if config_dict["history_max_tokens"] < 0:
+        raise ValueError(
+            f"Invalid session.history_max_tokens {config_dict['history_max_tokens']} (must be 0 or more)"
+        )
+
+    if config_dict["hook_queue_size"] < 1:
+        raise ValueError(f"Invalid session.hook_queue_size {config_dict['hook_queue_size']} (must be at least 1)")
+
     # Handle environment variable substitution in config file
     if config_dict["api_key"].startswith("${") and config_dict["api_key"].endswith("}"):
         env_var = config_dict["api_key"][2:-1]  # Extract variable name
@@ -0,0 +1,113 @@
+"""Non-blocking delivery of app events to Amplifier hooks.
+
+Hook handlers (logging, tracing, anything a profile mounts) run inside
+``coordinator.hooks.emit()``. Awaiting that inline puts every handler on
+the turn's critical path - a slow logging hook between stop-recording and
+sending the audio delays the response by exactly that much.
+
+EventBus.emit() instead stamps the event and puts it on a bounded queue;
+a background task delivers queued events to the hooks in order, a batch per
+wake-up. When the queue is full, new events are dropped and counted rather
+than stalling the caller; the count is delivered as an ``app:events:dropped``
+event once there is room again. ``sync=True`` restores inline delivery
+(e.g. when a hook must observe an event before the app moves on).
+"""
+
+import asyncio
+import logging
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+
+DROPPED_EVENT = "app:events:dropped"
+
+
+class EventBus:
+    """Queues hook events and delivers them from a background task."""
+
+    def __init__(self, max_queue: int = 256, batch_size: int = 32, sync: bool = False) -> None:
+        """Initialize bus (the delivery task starts with the first event).
+
+        Args:
+            max_queue: Events waiting for delivery before new ones are dropped
+            batch_size: Most events delivered per wake-up of the delivery task
+            sync: Deliver each event inline in emit() instead of queueing it
+        """
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.sync = sync
+        self.delivered = 0
+        self.dropped = 0
+        self._unreported_drops = 0
+        self._queue: asyncio.Queue[tuple[Any, str, dict]] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task | None = None
+
+    async def emit(self, hooks: Any, event: str, data: dict) -> None:
+        """Queue an event for hooks, stamped with the time it happened.
+
+        Returns at once unless sync is set. Must be called from the event loop.
+
+        Args:
+            hooks: The session's coordinator.hooks
+            event: Event name
+            data: Event data
+        """
+        data = {"ts": datetime.now(UTC).isoformat(), **data}
+        if self.sync:
+            await self._deliver(hooks, event, data)
+            return
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-bus")
+        try:
+            self._queue.put_nowait((hooks, event, data))
+        except asyncio.QueueFull:
+            if not self.dropped:
+                logging.warning(f"Hook event queue full ({self.max_queue}); dropping events")
+            self.dropped += 1
+            self._unreported_drops += 1
+
+    async def close(self) -> None:
+        """Deliver everything queued, then stop the delivery task.
+
+        The bus can be used again afterwards.
+        """
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self.dropped:
+            logging.warning(f"Dropped {self.dropped} hook events (queue of {self.max_queue} was full)")
+
+    async def _run(self) -> None:
+        """Delivery task: wait for events, then deliver a batch of whatever is queued."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            for hooks, event, data in batch:
+                await self._deliver(hooks, event, data)
+            if self._unreported_drops:
+                count, self._unreported_drops = self._unreported_drops, 0
+                hooks, _, data = batch[-1]
+                await self._deliver(
+                    hooks,
+                    DROPPED_EVENT,
+                    {"ts": datetime.now(UTC).isoformat(), "session_id": data.get("session_id"), "count": count},
+                )
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _deliver(self, hooks: Any, event: str, data: dict) -> None:
+        """Emit one event; a failing hook is logged and never reaches the app."""
+        try:
+            await hooks.emit(event, data)
+            self.delivered += 1
+        except Exception as e:
+            logging.error(f"Hook failed for {event}: {e}")
@@ -0,0 +1,347 @@
+"""Multi-client gateway for amplifier-app-voice.
+
+One process serves many thin clients over TCP. Clients send microphone
+audio and get the assistant's text and audio back; the gateway owns the
+Amplifier sessions. Each client gets a session of its own at its first
+turn and keeps it until it disconnects, so no provider session (or the
+conversation it holds) is ever shared between clients. Sessions come from a
+pool capped at max_sessions that keeps a few fresh ones started ahead of
+time, so a client's first turn doesn't wait for session startup.
+
+Wire protocol - every frame is a 1-byte type, a 4-byte big-endian payload
+length, then the payload:
+
+    client -> gateway   A  PCM16 mono audio at the configured sample rate
+                        C  commit: the audio sent so far is one user turn
+    gateway -> client   T  response text (UTF-8)
+                        A  response audio, PCM16 mono at the configured sample rate
+                        E  end of response
+                        !  error message (UTF-8); the turn is dropped
+
+Backpressure: a client's connection isn't read while its first turn waits
+for a session or a turn is being answered, and response audio is written in chunks that
+wait for the client to drain, so a slow client stalls only itself.
+"""
+
+import asyncio
+import contextlib
+import logging
+import struct
+from collections.abc import AsyncIterator
+
+from rich.markup import escape
+
+from .audio import codec
+from .config import AppConfig
+from .pipeline import SYSTEM_PROMPT
+from .realtime import get_provider
+from .realtime import response_decoder
+from .realtime import user_audio_message
+from .session_manager import SessionManager
+from .ui.terminal import TerminalUI
+
+FRAME_HEADER = struct.Struct(">cI")
+MAX_FRAME_BYTES = 1 << 20
+AUDIO_CHUNK_BYTES = 9600  # 200ms of 24kHz PCM16 per response frame
+WRITE_BUFFER_BYTES = 256 * 1024
+
+FRAME_AUDIO = b"A"
+FRAME_COMMIT = b"C"
+FRAME_TEXT = b"T"
+FRAME_END = b"E"
+FRAME_ERROR = b"!"
+
+
+class ProtocolError(Exception):
+    """A client sent a malformed or oversized frame."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[bytes, bytes] | None:
+    """Read one frame.
+
+    Args:
+        reader: Client stream
+
+    Returns:
+        (type, payload), or None if the client closed the connection
+
+    Raises:
+        ProtocolError: If the frame is larger than MAX_FRAME_BYTES
+    """
+    try:
+        kind, length = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+        if length > MAX_FRAME_BYTES:
+            raise ProtocolError(f"Frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+        return kind, await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def write_frame(writer: asyncio.StreamWriter, kind: bytes, payload: bytes | memoryview = b"") -> None:
+    """Queue one frame for sending (call writer.drain() to apply backpressure).
+
+    Args:
+        writer: Client stream
+        kind: Frame type byte
+        payload: Frame payload
+    """
+    writer.write(FRAME_HEADER.pack(kind, len(payload)))
+    writer.write(payload)
+
+
+class SessionPool:
+    """Amplifier sessions for the gateway's clients, at most max_sessions at once.
+
+    A session is lent to one client and closed when that client is done with
+    it, never lent again. Up to `spare` fresh sessions are kept started so the
+    next client doesn't wait for startup.
+    """
+
+    def __init__(self, config: AppConfig, max_sessions: int) -> None:
+        """Initialize pool (sessions are created on demand).
+
+        Args:
+            config: Application configuration
+            max_sessions: Cap on concurrent sessions (provider connections), spares included
+        """
+        self.config = config
+        self.max_sessions = max_sessions
+        self.spare = 0
+        self.in_use = 0
+        self._idle: list[SessionManager] = []  # Fresh sessions; each holds a slot
+        self._slots = asyncio.Semaphore(max_sessions)
+        self._refill_task: asyncio.Task | None = None
+
+    async def warm(self, count: int) -> None:
+        """Create sessions up front, and keep that many ready as clients take them.
+
+        Args:
+            count: Number of spare sessions (capped at max_sessions)
+        """
+        self.spare = min(count, self.max_sessions)
+        await self._refill()
+
+    @contextlib.asynccontextmanager
+    async def lease(self, timeout: float) -> AsyncIterator[SessionManager]:
+        """Lend a fresh session to one client.
+
+        When the lease ends the session is closed rather than lent to anyone
+        else: it holds that client's conversation, and after an error or a
+        cancellation it may be broken or mid-response. A spare is started in
+        its place.
+
+        Args:
+            timeout: Seconds to wait for a free slot
+
+        Yields:
+            SessionManager with an open session
+
+        Raises:
+            TimeoutError: If no session frees up within timeout
+        """
+        if self._idle:
+            session_mgr = self._idle.pop()
+        else:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+            session_mgr = SessionManager(self.config)
+            try:
+                await session_mgr.create_session()
+            except BaseException:
+                self._slots.release()
+                raise
+        self.in_use += 1
+        try:
+            yield session_mgr
+        finally:
+            self.in_use -= 1
+            try:
+                await session_mgr.close()
+            except Exception as e:
+                logging.warning(f"Failed to close gateway session: {e}")
+            finally:
+                self._slots.release()
+                if self._refill_task is None or self._refill_task.done():
+                    self._refill_task = asyncio.create_task(self._refill_quietly())
+
+    async def _refill(self) -> None:
+        """Start sessions until `spare` are ready, using only slots no client is waiting for.
+
+        Raises:
+            RuntimeError: If a session fails to start (the others are kept)
+        """
+        sessions = []
+        while len(self._idle) + len(sessions) < self.spare and not self._slots.locked():
+            await self._slots.acquire()
+            sessions.append(SessionManager(self.config))
+        results = await asyncio.gather(*(s.create_session() for s in sessions), return_exceptions=True)
+        errors = []
+        for session_mgr, result in zip(sessions, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                self._slots.release()
+            else:
+                self._idle.append(session_mgr)
+        if errors:
+            raise errors[0]
+
+    async def _refill_quietly(self) -> None:
+        """_refill() in the background; a failure is logged and retried at the next lease's end."""
+        try:
+            await self._refill()
+        except Exception as e:
+            logging.warning(f"Failed to start a spare gateway session: {e}")
+
+    async def close(self) -> None:
+        """Stop refilling and close all idle sessions."""
+        if self._refill_task:
+            self._refill_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refill_task
+        await asyncio.gather(*(session_mgr.close() for session_mgr in self._idle), return_exceptions=True)
+        for _ in self._idle:
+            self._slots.release()
+        self._idle.clear()
+
+
+class VoiceGateway:
+    """TCP server mapping thin clients onto pooled Amplifier sessions."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_sessions: int = 8,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        """Initialize gateway.
+
+        Args:
+            config: Application configuration
+            host: Interface to listen on
+            port: TCP port to listen on
+            max_sessions: Cap on concurrent provider sessions
+            acquire_timeout: Seconds a client's first turn waits for a free session before failing
+        """
+        self.config = config
+        self.host = host
+        self.port = port
+        self.acquire_timeout = acquire_timeout
+        self.pool = SessionPool(config, max_sessions)
+        self.ui = TerminalUI()
+        self.clients = 0
+        self.max_turn_bytes = config.sample_rate * 2 * config.max_recording_duration  # PCM16 = 2 bytes per sample
+
+    async def serve(self, warm: int = 1) -> None:
+        """Accept clients until cancelled (e.g. Ctrl+C).
+
+        Args:
+            warm: Fresh sessions to start before accepting clients, and to keep ready
+        """
+        await self.pool.warm(warm)
+        server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.ui.show_status(
+            f"Gateway listening on {self.host}:{self.port} (max {self.pool.max_sessions} sessions)", "green"
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.pool.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read turns from one client and answer them in order."""
+        peer = writer.get_extra_info("peername")
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_BYTES)
+        self.clients += 1
+        self.ui.show_status(f"Client connected: {peer} ({self.clients} connected)", "cyan")
+
+        audio = bytearray()
+        overflow = False
+        try:
+            async with contextlib.AsyncExitStack() as lease:
+                session_mgr = None  # This client's own session, leased at its first turn
+                while frame := await read_frame(reader):
+                    kind, payload = frame
+                    if kind == FRAME_AUDIO:
+                        if overflow:
+                            continue  # Rest of a turn already rejected
+                        if len(audio) + len(payload) > self.max_turn_bytes:
+                            overflow = True
+                            audio = bytearray()
+                            write_frame(writer, FRAME_ERROR, b"Turn exceeds max_recording_duration")
+                            await writer.drain()
+                            continue
+                        audio += payload
+                    elif kind == FRAME_COMMIT:
+                        if not audio and not overflow:
+                            write_frame(writer, FRAME_ERROR, b"Empty turn")
+                            await writer.drain()
+                        elif not overflow:
+                            # Not reading the next frame until this turn is answered is the inbound backpressure
+                            session_mgr = session_mgr or await self._lease(writer, lease)
+                            if session_mgr and not await self._answer(writer, audio, session_mgr):
+                                # The session may be broken or mid-response - the next turn gets a new one
+                                await lease.aclose()
+                                session_mgr = None
+                        audio = bytearray()
+                        overflow = False
+                    else:
+                        raise ProtocolError(f"Unknown frame type {kind!r}")
+        except (ProtocolError, ConnectionError) as e:
+            self.ui.show_status(f"Client {peer}: {escape(str(e))}", "red")
+        finally:
+            self.clients -= 1
+            self.ui.show_status(f"Client disconnected: {peer} ({self.clients} connected)", "cyan")
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _lease(self, writer: asyncio.StreamWriter, lease: contextlib.AsyncExitStack) -> SessionManager | None:
+        """Lease a session for the rest of a client's connection, or tell the client why not."""
+        try:
+            return await lease.enter_async_context(self.pool.lease(self.acquire_timeout))
+        except TimeoutError:
+            message = b"Gateway busy: no session available"
+        except Exception as e:
+            message = f"{type(e).__name__}: {e}".encode()
+        write_frame(writer, FRAME_ERROR, message)
+        await writer.drain()
+        return None
+
+    async def _answer(self, writer: asyncio.StreamWriter, audio: bytearray, session_mgr: SessionManager) -> bool:
+        """Send one turn to the client's session and stream the response back.
+
+        Returns:
+            False if the provider call failed (the client has been sent the error)
+        """
+        try:
+            provider = get_provider(session_mgr.session)
+            if not provider:
+                raise RuntimeError("openai-realtime provider not found in session")
+            encoder = codec.WireEncoder(self.config.wire_format, self.config.sample_rate)
+            messages = [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                user_audio_message(encoder.encode(audio), encoder),
+            ]
+            try:
+                async with asyncio.timeout(self.config.turn_deadline):
+                    response = await provider.complete(messages)
+            except TimeoutError as e:
+                raise RuntimeError(f"No response within {self.config.turn_deadline:.0f}s") from e
+        except Exception as e:
+            write_frame(writer, FRAME_ERROR, f"{type(e).__name__}: {e}".encode())
+            await writer.drain()
+            return False
+
+        # Streaming to a slow client holds only this connection
+        write_frame(writer, FRAME_TEXT, (response.content or "").encode())
+        raw = response.raw or {}
+        if "audio_data" in raw:
+            pcm = memoryview(response_decoder(raw, self.config.sample_rate).decode(raw["audio_data"]))
+            for offset in range(0, len(pcm), AUDIO_CHUNK_BYTES):
+                write_frame(writer, FRAME_AUDIO, pcm[offset : offset + AUDIO_CHUNK_BYTES])
+                await writer.drain()
+        write_frame(writer, FRAME_END)
+        await writer.drain()
+        return True
@@ -0,0 +1,77 @@
+"""Text conversation memory for amplifier-app-voice.
+
+Past turns are kept as text - what the user said (the provider's input
+transcription, when it reports one) and what the assistant answered - and
+sent ahead of each new turn's audio. Audio is never resent, and the
+history is held to a token budget by evicting the oldest turns, so request
+size stays flat however long the session runs.
+
+Tokens are estimated from UTF-8 length (about four bytes per token plus a
+small per-message overhead); the budget is a ceiling on context sent, not
+an exact count.
+"""
+
+from collections import deque
+
+MESSAGE_OVERHEAD_TOKENS = 4  # Role and framing per message
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of one message's text."""
+    return (len(text.encode()) + 3) // 4 + MESSAGE_OVERHEAD_TOKENS
+
+
+class ConversationHistory:
+    """Prior turns as text messages, evicted oldest-first to stay within max_tokens."""
+
+    def __init__(self, max_tokens: int = 2000) -> None:
+        """Initialize empty history.
+
+        Args:
+            max_tokens: Budget for all remembered messages (0 = remember nothing)
+        """
+        self.max_tokens = max_tokens
+        self.tokens = 0
+        self.evicted = 0
+        self._turns: deque[tuple[list[dict], int]] = deque()
+
+    def __len__(self) -> int:
+        """Number of remembered turns."""
+        return len(self._turns)
+
+    def add(self, user_text: str | None, assistant_text: str | None) -> None:
+        """Remember a finished turn, evicting the oldest turns beyond the budget.
+
+        A turn that alone exceeds the budget is not remembered.
+
+        Args:
+            user_text: Transcription of what the user said (None if unknown)
+            assistant_text: The assistant's answer
+        """
+        messages = [
+            {"role": role, "content": text}
+            for role, text in (("user", user_text), ("assistant", assistant_text))
+            if text
+        ]
+        if not messages:
+            return
+        cost = sum(estimate_tokens(message["content"]) for message in messages)
+        if cost > self.max_tokens:
+            self.evicted += 1
+            return
+
+        self._turns.append((messages, cost))
+        self.tokens += cost
+        while self.tokens > self.max_tokens:
+            _, evicted_cost = self._turns.popleft()
+            self.tokens -= evicted_cost
+            self.evicted += 1
+
+    def messages(self) -> list[dict]:
+        """Remembered messages, oldest first, ready to place before the new turn."""
+        return [message for messages, _ in self._turns for message in messages]
+
+    def clear(self) -> None:
+        """Forget all turns."""
+        self._turns.clear()
+        self.tokens = 0
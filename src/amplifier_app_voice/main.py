@@ -1,21 +1,36 @@
-"""Main application entry point and event loop for amplifier-app-voice."""
+"""Main application entry point and event loop for amplifier-app-voice.
+
+Heavy dependencies (PortAudio, pynput, rich, the Amplifier stack) are imported
+inside the commands that need them, so ``--help`` and ``--list-devices`` start
+instantly.
+"""
 
 import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from .audio.capture import AudioCapture
-from .audio.playback import AudioPlayback
-from .config import AppConfig
-from .config import load_config
-from .session_manager import SessionManager
-from .ui.keyboard import KeyboardHandler
-from .ui.terminal import TerminalUI
+if TYPE_CHECKING:
+    import pyaudio
+
+    from .audio.capture import AudioCapture
+    from .audio.playback import AudioPlayback
+    from .config import AppConfig
+
+
+def _list_devices(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Eager --list-devices callback: print audio devices and exit."""
+    if not value or ctx.resilient_parsing:
+        return
+    from .audio.utils import list_audio_devices
 
+    list_audio_devices()
+    ctx.exit()
 
-@click.command()
+
+@click.group(invoke_without_command=True)
 @click.option("--voice", help="Voice selection (alloy, echo, shimmer, marin, cedar)")
 @click.option("--temperature", type=float, help="Response randomness (0.0-1.0)")
 @click.option("--model", help="Model override")
@@ -23,7 +38,18 @@ from .ui.terminal import TerminalUI
 @click.option("--output-device", type=int, help="Output device index")
 @click.option("--config", type=click.Path(), help="Config file path")
 @click.option("--debug", is_flag=True, help="Enable debug logging")
+@click.option("--sync-hooks", is_flag=True, help="Deliver hook events inline instead of from a background task")
+@click.option(
+    "--list-devices",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_list_devices,
+    help="List audio devices and exit",
+)
+@click.pass_context
 def main(
+    ctx: click.Context,
     voice: str | None,
     temperature: float | None,
     model: str | None,
@@ -31,10 +57,12 @@ def main(
     output_device: int | None,
     config: str | None,
     debug: bool,
+    sync_hooks: bool,
 ) -> None:
     """Launch Amplifier voice assistant.
 
     Press SPACE to start talking, press SPACE again to stop and send. Press Ctrl+C to exit.
+    Options given before a subcommand (e.g. batch) apply to it as well.
     """
     # Build CLI overrides dict from Click options
     cli_overrides = {}
@@ -48,221 +76,194 @@ def main(
         cli_overrides["input_device"] = input_device
     if output_device is not None:
         cli_overrides["output_device"] = output_device
+    if sync_hooks:
+        cli_overrides["sync_hooks"] = True
 
-    # Load configuration with priority: defaults < YAML < env vars < CLI args
     config_path = Path(config) if config else None
+    if ctx.invoked_subcommand is not None:
+        # Subcommands load the configuration themselves (so their --help works without an API key)
+        ctx.obj = (config_path, cli_overrides)
+        return
+
+    # Run async main loop
+    asyncio.run(async_main(_load_app_config(config_path, cli_overrides), debug))
+
+
+def _load_app_config(config_path: Path | None, cli_overrides: dict) -> "AppConfig":
+    """Load configuration with priority: defaults < YAML < env vars < CLI args.
+
+    Exits with an error message if the configuration is invalid.
+    """
+    from .config import load_config
+
     try:
-        app_config = load_config(config_path, cli_overrides)
+        return load_config(config_path, cli_overrides)
     except ValueError as e:
         click.echo(f"Configuration error: {e}", err=True)
         sys.exit(1)
 
-    # Run async main loop
-    asyncio.run(async_main(app_config, debug))
 
+@main.command()
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Output directory (default: INPUT_DIR/responses)",
+)
+@click.option("--concurrency", "-j", default=4, show_default=True, help="Sessions processing files in parallel")
+@click.pass_obj
+def batch(obj: tuple[Path | None, dict], input_dir: Path, output: Path | None, concurrency: int) -> None:
+    """Send each WAV/PCM file in INPUT_DIR to the assistant as one turn.
 
-async def async_main(config: AppConfig, debug: bool = False) -> None:
-    """Async main event loop.
+    Writes response.wav and transcript.jsonl per file. Raw .pcm files must be
+    PCM16 mono at the configured sample rate.
+    """
+    from .batch import run_batch
+
+    app_config = _load_app_config(*obj)
+    results = asyncio.run(run_batch(app_config, input_dir, output or input_dir / "responses", concurrency))
+    if any(result.error for result in results):
+        sys.exit(1)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to listen on")
+@click.option("--port", default=8765, show_default=True, help="TCP port to listen on")
+@click.option("--max-sessions", default=8, show_default=True, help="Cap on concurrent provider sessions")
+@click.option("--warm", default=1, show_default=True, help="Fresh sessions kept started for new clients")
+@click.option("--acquire-timeout", default=30.0, show_default=True, help="Seconds a client's first turn waits for a free session")
+@click.pass_obj
+def serve(
+    obj: tuple[Path | None, dict], host: str, port: int, max_sessions: int, warm: int, acquire_timeout: float
+) -> None:
+    """Serve many thin clients from one process over TCP (see amplifier_app_voice.gateway)."""
+    from .gateway import VoiceGateway
+
+    app_config = _load_app_config(*obj)
+    gateway = VoiceGateway(app_config, host, port, max_sessions, acquire_timeout)
+    try:
+        asyncio.run(gateway.serve(warm))
+    except KeyboardInterrupt:
+        gateway.ui.show_status("\nGateway stopped", "green")
+
+
+def open_audio(config: "AppConfig") -> tuple["pyaudio.PyAudio", "AudioCapture", "AudioPlayback"]:
+    """Initialize PortAudio once and open the capture and playback devices on it.
+
+    Blocking (PortAudio enumerates devices); async_main runs it in a thread
+    while the Amplifier session is created.
 
     Args:
         config: Application configuration
-        debug: Enable debug logging if True
+
+    Returns:
+        (shared PyAudio instance, audio capture, audio playback)
     """
-    # Initialize all components
-    ui = TerminalUI()
-    keyboard_handler = KeyboardHandler()
+    import pyaudio
+
+    from .audio.capture import AudioCapture
+    from .audio.dsp import build_chain
+    from .audio.playback import AudioPlayback
+
+    pa = pyaudio.PyAudio()
     audio_capture = AudioCapture(
         device_index=config.input_device,
         sample_rate=config.sample_rate,
         buffer_size=config.buffer_size,
+        persistent=config.persistent_input,
+        preroll_ms=config.preroll_ms,
+        max_duration=config.max_recording_duration,
+        native_rate=config.native_rate,
+        pa=pa,
+        dsp=build_chain(config.dsp, config.sample_rate) if config.dsp else None,
     )
     audio_playback = AudioPlayback(
         device_index=config.output_device,
         sample_rate=config.sample_rate,
+        buffer_size=config.buffer_size,
+        max_buffer_ms=config.playback_buffer_ms,
+        native_rate=config.native_rate,
+        pa=pa,
+    )
+
+    # Pre-warm the microphone so the first key press doesn't pay the device open cost
+    if config.persistent_input:
+        audio_capture.open()
+
+    return pa, audio_capture, audio_playback
+
+
+async def async_main(config: "AppConfig", debug: bool = False) -> None:
+    """Async main event loop.
+
+    Args:
+        config: Application configuration
+        debug: Enable debug logging if True
+    """
+    from .audio.vad import VoiceActivityDetector
+    from .pipeline import TurnPipeline
+    from .session_manager import SessionManager
+    from .ui.keyboard import KeyboardHandler
+    from .ui.terminal import TerminalUI
+
+    # Initialize all components
+    ui = TerminalUI(live=config.live_display, render_fps=config.render_fps, history_lines=config.history_lines)
+    keyboard_handler = KeyboardHandler()
+    vad = VoiceActivityDetector(
+        sample_rate=config.sample_rate,
+        threshold_db=config.vad_threshold_db,
+        end_of_speech_ms=config.end_of_speech_ms,
     )
     session_mgr = SessionManager(config)
+    audio_task: asyncio.Task | None = None
 
     try:
         # Show welcome message
         ui.show_welcome()
 
+        # Open audio devices (in a thread) while the profile compiles and the session connects
+        audio_task = asyncio.create_task(asyncio.to_thread(open_audio, config))
+
         # Create Amplifier session with Realtime provider
-        session = await session_mgr.create_session()
+        await session_mgr.create_session()
         ui.show_status("Session created", "green")
-        
+        pa, audio_capture, audio_playback = await audio_task
+
         # Emit app initialization event
-        if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-            await session.coordinator.hooks.emit(
-                "app:initialized",
-                {
-                    "session_id": session_mgr.session_id,
-                    "application": "amplifier-app-voice",
-                    "input_device": config.input_device,
-                    "output_device": config.output_device,
-                    "sample_rate": config.sample_rate,
-                },
-            )
-
-        # Start keyboard listener
+        await session_mgr.emit(
+            "app:initialized",
+            {
+                "application": "amplifier-app-voice",
+                "input_device": config.input_device,
+                "output_device": config.output_device,
+                "sample_rate": config.sample_rate,
+            },
+        )
+
+        # Start keyboard listener and switch to the live layout
         keyboard_handler.start()
+        ui.start()
         ui.show_status("Press SPACE to start talking...", "green")
 
-        # Main loop
-        while True:
-            # Wait for spacebar press to start
-            await keyboard_handler.wait_for_press()
-
-            # Start audio recording
-            audio_capture.start_recording()
-            ui.show_status("🎤 Recording... (press SPACE again to stop)", "yellow")
-            
-            # Emit recording start event
-            if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-                await session.coordinator.hooks.emit(
-                    "audio:recording:start",
-                    {
-                        "session_id": session_mgr.session_id,
-                        "sample_rate": config.sample_rate,
-                    },
-                )
-
-            # Wait for spacebar press again to stop
-            await keyboard_handler.wait_for_release()
-
-            # Stop recording
-            audio_data = audio_capture.stop_recording()
-            audio_duration_ms = len(audio_data) / (config.sample_rate * 2) * 1000  # PCM16 = 2 bytes per sample
-            
-            # Emit recording complete event
-            if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-                await session.coordinator.hooks.emit(
-                    "audio:recording:complete",
-                    {
-                        "session_id": session_mgr.session_id,
-                        "duration_ms": int(audio_duration_ms),
-                        "bytes": len(audio_data),
-                    },
-                )
-            
-            ui.clear_status()
-            ui.show_status("⏳ Sending to AI...", "cyan")
-
-            # Send actual audio to OpenAI Realtime API
-            # Access provider directly since session.execute() doesn't support audio yet
-            try:
-                # Get the provider from session coordinator
-                provider = session.coordinator.mount_points["providers"].get("openai-realtime")
-
-                if provider:
-                    # Build messages with system instruction
-                    messages = [
-                        {
-                            "role": "system",
-                            "content": "You are a playful, creative voice assistant with a sense of wonder. When someone asks to 'show me something magical', delight them with unexpected facts, fascinating ideas, or whimsical stories. Be conversational, enthusiastic, and bring a spark of joy to every interaction."
-                        },
-                        {
-                            "role": "user",
-                            "content": [{"type": "audio", "data": audio_data, "format": "pcm16", "sample_rate": 24000}],
-                        }
-                    ]
-
-                    # Call provider directly with audio (provider emits provider:request and provider:response hooks)
-                    provider_response = await provider.complete(messages)
-
-                    # Extract transcript
-                    transcript = provider_response.content
-                    
-                    # Log user input to transcript.jsonl (we don't have the user's actual words, just audio)
-                    session_mgr.write_transcript(
-                        "user",
-                        "[audio input]",
-                        audio_metadata={
-                            "format": "pcm16",
-                            "sample_rate": 24000,
-                            "duration_ms": int(audio_duration_ms),
-                            "bytes": len(audio_data),
-                        },
-                    )
-
-                    # Log assistant response to transcript.jsonl
-                    session_mgr.write_transcript(
-                        "assistant",
-                        transcript,
-                        audio_metadata={
-                            "format": provider_response.raw.get("audio_format", "pcm16"),
-                            "sample_rate": provider_response.raw.get("sample_rate", 24000),
-                        } if provider_response.raw and "audio_data" in provider_response.raw else None,
-                    )
-
-                    # Display transcript
-                    if config.show_transcripts:
-                        ui.show_transcript("assistant", transcript)
-
-                    # Play audio response
-                    if provider_response.raw and "audio_data" in provider_response.raw:
-                        ui.show_status("🔊 Playing response...", "magenta")
-                        
-                        # Emit playback start event
-                        if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-                            await session.coordinator.hooks.emit(
-                                "audio:playback:start",
-                                {
-                                    "session_id": session_mgr.session_id,
-                                    "audio_format": provider_response.raw.get("audio_format", "pcm16"),
-                                    "sample_rate": provider_response.raw.get("sample_rate", 24000),
-                                },
-                            )
-                        
-                        audio_playback.play(provider_response.raw["audio_data"])
-                        
-                        # Emit playback complete event
-                        if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-                            await session.coordinator.hooks.emit(
-                                "audio:playback:complete",
-                                {
-                                    "session_id": session_mgr.session_id,
-                                },
-                            )
-                    else:
-                        ui.show_status("🔊 Response received (no audio)", "magenta")
-                else:
-                    ui.show_status("❌ Provider not found", "red")
-                    
-                    # Emit error event
-                    if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-                        await session.coordinator.hooks.emit(
-                            "app:error",
-                            {
-                                "session_id": session_mgr.session_id,
-                                "error_type": "ProviderNotFound",
-                                "error_message": "openai-realtime provider not found in session",
-                            },
-                        )
-
-            except Exception as e:
-                ui.show_status(f"❌ Error: {e}", "red")
-                
-                # Emit error event
-                if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
-                    await session.coordinator.hooks.emit(
-                        "app:error",
-                        {
-                            "session_id": session_mgr.session_id,
-                            "error_type": type(e).__name__,
-                            "error_message": str(e),
-                        },
-                    )
-
-            # Ready for next input
-            ui.show_status("Press SPACE to start talking...", "green")
+        # Run turns through the staged pipeline until Ctrl+C
+        pipeline = TurnPipeline(config, session_mgr, ui, keyboard_handler, audio_capture, audio_playback, vad)
+        await pipeline.run()
 
     except KeyboardInterrupt:
         ui.show_status("\nGoodbye!", "green")
     finally:
         # Cleanup all resources
+        ui.stop()
         keyboard_handler.stop()
-        audio_capture.cleanup()
-        audio_playback.cleanup()
+        if audio_task:
+            # Wait for device init even if session creation failed, so devices are always released
+            devices = await asyncio.gather(audio_task, return_exceptions=True)
+            if not isinstance(devices[0], BaseException):
+                pa, audio_capture, audio_playback = devices[0]
+                audio_capture.cleanup()
+                audio_playback.cleanup()
+                pa.terminate()
         await session_mgr.close()
 
 
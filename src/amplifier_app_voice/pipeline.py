@@ -0,0 +1,689 @@
+"""Staged turn pipeline for amplifier-app-voice.
+
+A conversation turn moves through five stages, each its own asyncio task,
+connected by bounded queues:
+
+    capture -> upload -> response -> transcript
+                                  \\-> playback
+
+Capture waits for the next key press as soon as it has handed a turn off,
+so transcript writes and playback overlap with whatever the other stages
+are doing instead of running one after another. Hook events are queued
+(see events.EventBus), so a slow hook never holds up a stage.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+from rich.markup import escape
+
+from .audio import codec
+from .audio.meter import watch_levels
+from .audio.tuning import BufferTuner
+from .audio.tuning import device_key
+from .config import AppConfig
+from .history import ConversationHistory
+from .realtime import cancel_response
+from .realtime import clear_input_audio
+from .realtime import get_provider
+from .realtime import input_transcript
+from .realtime import response_decoder
+from .realtime import response_sample_rate
+from .realtime import StreamedResponse
+from .realtime import stream_input_audio
+from .realtime import supports_input_streaming
+from .realtime import supports_response_streaming
+from .realtime import user_audio_message
+from .resilience import CircuitBreaker
+from .resilience import backoff_delay
+from .session_manager import SessionManager
+from .tracing import TurnTracer
+
+if TYPE_CHECKING:
+    # Device and UI modules load PortAudio/pynput; batch and gateway modes import this module without them
+    from .audio.capture import AudioCapture
+    from .audio.playback import AudioPlayback
+    from .audio.vad import VoiceActivityDetector
+    from .ui.keyboard import KeyboardHandler
+    from .ui.terminal import TerminalUI
+
+SYSTEM_PROMPT = "You are a playful, creative voice assistant with a sense of wonder. When someone asks to 'show me something magical', delight them with unexpected facts, fascinating ideas, or whimsical stories. Be conversational, enthusiastic, and bring a spark of joy to every interaction."
+
+
+@dataclass
+class Turn:
+    """One user turn as it moves through the pipeline."""
+
+    turn_id: int
+    audio: memoryview  # Recorded (trimmed) PCM16, a view of the capture buffer
+    duration_ms: int
+    encoder: codec.WireEncoder
+    trace: TurnTracer
+    upload_task: asyncio.Task | None = None
+    holds_capture_buffer: bool = True  # False once no stage references audio anymore
+    messages: list[dict] = field(default_factory=list)
+    response: Any = None
+    response_audio: bytes | memoryview | None = None  # Decoded response, PCM16 at the app sample rate
+    # Streamed responses: decoded chunks as they arrive, None-terminated (created with the first audio)
+    response_chunks: "asyncio.Queue[bytes | memoryview | None] | None" = None
+    archive: dict[str, dict] = field(default_factory=dict)  # Stream -> AudioArchive.segment()
+    attempts: int = 0  # Provider requests made for this turn
+    retry_ms: float = 0.0  # Time lost to failed attempts and backoff
+
+
+async def _wait_for_end_of_speech(audio_capture: "AudioCapture", vad: "VoiceActivityDetector") -> None:
+    """Wait until the VAD hears speech followed by silence (hands-free turn end).
+
+    Reads newly captured audio straight from the recording buffer every few
+    frames, so the audio callback does no extra work.
+
+    Args:
+        audio_capture: Capture that is currently recording
+        vad: Detector used for end-of-speech decisions
+    """
+    vad.reset()
+    processed = 0
+    while True:
+        await asyncio.sleep(vad.frame_ms * 3 / 1000)
+        length = audio_capture.length
+        if length > processed and vad.feed(memoryview(audio_capture.buffer)[processed:length]):
+            return
+        processed = length
+
+
+class TurnPipeline:
+    """Runs conversation turns through concurrent stages joined by bounded queues."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        session_mgr: SessionManager,
+        ui: "TerminalUI",
+        keyboard_handler: "KeyboardHandler",
+        audio_capture: "AudioCapture",
+        audio_playback: "AudioPlayback",
+        vad: "VoiceActivityDetector",
+        queue_size: int = 2,
+    ) -> None:
+        """Initialize pipeline.
+
+        Args:
+            config: Application configuration
+            session_mgr: Session manager with an active session
+            ui: Terminal UI
+            keyboard_handler: Started keyboard handler
+            audio_capture: Audio capture
+            audio_playback: Audio playback
+            vad: Voice activity detector (trimming and hands-free)
+            queue_size: Maximum turns waiting between two stages (default: 2)
+        """
+        self.config = config
+        self.session_mgr = session_mgr
+        self.ui = ui
+        self.keyboard_handler = keyboard_handler
+        self.audio_capture = audio_capture
+        self.audio_playback = audio_playback
+        self.vad = vad
+        self.archive = session_mgr.archive
+        if self.archive:
+            audio_capture.tap = partial(self.archive.write, "user")
+
+        self.provider = get_provider(session_mgr.session)
+        self.stream_input = config.stream_input and self.provider is not None and supports_input_streaming(self.provider)
+        self.stream_output = (
+            config.stream_output and self.provider is not None and supports_response_streaming(self.provider)
+        )
+
+        self.upload_queue: asyncio.Queue[Turn] = asyncio.Queue(maxsize=queue_size)
+        self.response_queue: asyncio.Queue[Turn] = asyncio.Queue(maxsize=queue_size)
+        self.transcript_queue: asyncio.Queue[Turn] = asyncio.Queue(maxsize=queue_size)
+        self.playback_queue: asyncio.Queue[Turn] = asyncio.Queue(maxsize=queue_size)
+
+        self.history = ConversationHistory(config.history_max_tokens)
+        self.breaker = CircuitBreaker(config.breaker_threshold, config.breaker_cooldown)
+
+        self.buffer_tuner: BufferTuner | None = None
+        if config.adaptive_buffer:
+            from .audio.utils import get_device_info
+
+            info = get_device_info(audio_capture.p, audio_capture.device_index, "input")
+            self.buffer_tuner = BufferTuner(device_key(info, audio_capture.device_rate), config.buffer_size)
+            if self.buffer_tuner.buffer_size != audio_capture.buffer_size:
+                audio_capture.set_buffer_size(self.buffer_tuner.buffer_size)
+        self._xruns_reported = self.xrun_counts()
+
+        self._turn_id = 0
+        self._last_turn: Turn | None = None
+        self._play_task: asyncio.Task | None = None
+        self._played_before = 0
+
+    def queue_depths(self) -> dict[str, int]:
+        """Turns waiting in front of each stage."""
+        return {
+            "upload": self.upload_queue.qsize(),
+            "response": self.response_queue.qsize(),
+            "transcript": self.transcript_queue.qsize(),
+            "playback": self.playback_queue.qsize(),
+        }
+
+    def xrun_counts(self) -> dict[str, int]:
+        """Overflows and underflows PortAudio has reported since the devices were opened."""
+        return {
+            "capture_overflows": self.audio_capture.overflows,
+            "capture_underflows": self.audio_capture.underflows,
+            "playback_underflows": self.audio_playback.underflows,
+            "playback_overflows": self.audio_playback.overflows,
+        }
+
+    async def run(self) -> None:
+        """Run all stages until cancelled (e.g. Ctrl+C)."""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._upload_stage())
+                tg.create_task(self._response_stage())
+                tg.create_task(self._transcript_stage())
+                tg.create_task(self._playback_stage())
+                await self._capture_stage()
+        finally:
+            if self.buffer_tuner and self.buffer_tuner.unsaved:
+                # Saved once at the end, so tuning never puts file I/O in a turn's path
+                await asyncio.to_thread(self.buffer_tuner.save)
+
+    async def _report_error(self, error: Exception) -> None:
+        """Show a turn error and emit app:error; the pipeline keeps running."""
+        self.ui.show_status(f"❌ Error: {escape(str(error))}", "red")
+        await self.session_mgr.emit("app:error", {"error_type": type(error).__name__, "error_message": str(error)})
+
+    def _show_ready(self) -> None:
+        """Prompt for the next turn unless one is already being recorded."""
+        if not self.audio_capture.is_recording:
+            self.ui.show_status("Press SPACE to start talking...", "green")
+
+    def _is_current(self, turn: Turn) -> bool:
+        """False once the user has started a newer turn."""
+        return turn.turn_id == self._turn_id
+
+    async def _finish_turn(self, turn: Turn, outcome: str) -> None:
+        """Report a turn's latency spans (once) via turn:timing and timings.jsonl.
+
+        A turn whose answer reached the user is also added to the conversation history.
+
+        Args:
+            turn: Finished turn
+            outcome: "played", "interrupted", "no_audio", "superseded" or "error"
+        """
+        if turn.trace.finished:
+            return
+        turn.trace.finished = True
+        if outcome in ("played", "no_audio") and turn.response is not None:
+            # Only answers the user actually got; a superseded or interrupted one never reached them
+            self.history.add(input_transcript(turn.response), turn.response.content)
+
+        timing = {
+            "turn_id": turn.turn_id,
+            "outcome": outcome,
+            "spans_ms": turn.trace.spans(),
+            "attempts": turn.attempts,
+            "retry_ms": round(turn.retry_ms, 2),
+        }
+        await self.session_mgr.emit("turn:timing", timing)
+        self.session_mgr.write_timing(timing)
+
+        # Xruns since the last report, so a hook sees which turns glitched
+        counts = self.xrun_counts()
+        xruns = {name: count - self._xruns_reported[name] for name, count in counts.items()}
+        if any(xruns.values()):
+            self._xruns_reported = counts
+            await self.session_mgr.emit(
+                "audio:xruns", {"turn_id": turn.turn_id, **xruns, "buffer_size": self.audio_capture.buffer_size}
+            )
+
+    # Stage 1: capture
+
+    async def _capture_stage(self) -> None:
+        """Record turns on key presses and hand them to the upload stage."""
+        while True:
+            await self.keyboard_handler.wait_for_press()
+            self._turn_id += 1
+            trace = TurnTracer(self._turn_id)
+            trace.mark("key_press")
+
+            # The previous turn may still be sending its audio - give this one a fresh buffer
+            if self._last_turn and self._last_turn.holds_capture_buffer:
+                self.audio_capture.detach_buffer()
+
+            # Barge-in: drop the rest of any playing response before recording
+            interrupted = self._play_task is not None and not self._play_task.done()
+            if interrupted:
+                self._play_task.cancel()
+                discarded_bytes = self.audio_playback.flush()
+                played_bytes = self.audio_playback.played_bytes - self._played_before
+
+            # Start audio recording (and, if supported, upload while the user talks)
+            archive_offset = self.archive.position("user") if self.archive else 0
+            overflows_before = self.audio_capture.overflows
+            self.audio_capture.start_recording(streaming=self.stream_input)
+            trace.mark("stream_open")
+            encoder = codec.WireEncoder(self.config.wire_format, self.config.sample_rate)
+            upload_task = (
+                asyncio.create_task(stream_input_audio(self.provider, self.audio_capture.chunks(), encoder))
+                if self.stream_input
+                else None
+            )
+            self.ui.show_status("🎤 Recording... (press SPACE again to stop)", "yellow")
+
+            if interrupted:
+                played_ms = int(played_bytes / self.audio_playback.bytes_per_second * 1000)
+                cancelled = await cancel_response(self.provider, played_ms)
+                await self.session_mgr.emit(
+                    "audio:playback:interrupted",
+                    {
+                        "played_ms": played_ms,
+                        "discarded_bytes": discarded_bytes,
+                        "discarded_ms": int(discarded_bytes / self.audio_playback.bytes_per_second * 1000),
+                        "response_cancelled": cancelled,
+                    },
+                )
+
+            await self.session_mgr.emit(
+                "audio:recording:start",
+                {"sample_rate": self.config.sample_rate, "streaming": self.stream_input},
+            )
+
+            meter_task = (
+                asyncio.create_task(
+                    watch_levels(self.audio_capture, self.ui.show_recording, self.config.meter_fps)
+                )
+                if self.config.show_audio_levels
+                else None
+            )
+
+            # Wait for spacebar press again to stop, max_recording_duration, or (hands-free) end of speech
+            release_task = asyncio.create_task(self.keyboard_handler.wait_for_release())
+            stop_tasks = {release_task, asyncio.create_task(self.audio_capture.wait_for_limit())}
+            if self.config.hands_free:
+                stop_tasks.add(asyncio.create_task(_wait_for_end_of_speech(self.audio_capture, self.vad)))
+            done, pending = await asyncio.wait(stop_tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            if release_task not in done:
+                self.keyboard_handler.end_recording()
+            trace.mark("stop")
+            if meter_task:
+                meter_task.cancel()
+                self.ui.clear_status()
+
+            # Stop recording
+            audio_data = self.audio_capture.stop_recording()
+            if self.audio_capture.limit_reached:
+                self.ui.show_status(
+                    f"⏱ Maximum recording duration ({self.config.max_recording_duration}s) reached", "yellow"
+                )
+            recorded_bytes = len(audio_data)
+            overflows = self.audio_capture.overflows - overflows_before
+            if self.buffer_tuner:
+                await self._tune_buffer(overflows)
+
+            # Drop leading/trailing silence before upload (already sent when streaming)
+            if self.config.trim_silence and not upload_task:
+                audio_data = self.vad.trim(audio_data)
+
+            duration_ms = int(len(audio_data) / (self.config.sample_rate * 2) * 1000)  # PCM16 = 2 bytes per sample
+
+            await self.session_mgr.emit(
+                "audio:recording:complete",
+                {
+                    "duration_ms": duration_ms,
+                    "bytes": len(audio_data),
+                    "truncated": self.audio_capture.limit_reached,
+                    "overflows": overflows,
+                    "dsp": self.audio_capture.dsp.stats() if self.audio_capture.dsp else None,
+                    "trimmed_bytes": recorded_bytes - len(audio_data),
+                    "queue_depths": self.queue_depths(),
+                },
+            )
+
+            turn = Turn(
+                turn_id=self._turn_id,
+                audio=audio_data,
+                duration_ms=duration_ms,
+                encoder=encoder,
+                trace=trace,
+                upload_task=upload_task,
+            )
+            if not audio_data:
+                if upload_task:
+                    # Whatever was streamed won't be committed - don't let the next turn build on it
+                    upload_task.cancel()
+                    await asyncio.gather(upload_task, return_exceptions=True)
+                    await clear_input_audio(self.provider)
+                self.ui.show_status("🔇 No speech detected. Press SPACE to start talking...", "yellow")
+                await self._finish_turn(turn, "no_audio")
+                continue
+
+            self.ui.clear_status()
+            self.ui.show_status("⏳ Sending to AI...", "cyan")
+
+            self._last_turn = turn
+            if self.archive:
+                self._last_turn.archive["user"] = self.archive.segment("user", archive_offset)
+            await self.upload_queue.put(self._last_turn)
+
+    async def _tune_buffer(self, overflows: int) -> None:
+        """Let the tuner resize the capture buffer after a recording (see audio.tuning)."""
+        previous = self.audio_capture.buffer_size
+        buffer_size = self.buffer_tuner.observe(overflows)
+        if buffer_size is None:
+            return
+        # Reopens the device in persistent mode (blocking); otherwise applies from the next recording
+        await asyncio.to_thread(self.audio_capture.set_buffer_size, buffer_size)
+        await self.session_mgr.emit(
+            "audio:buffer_size",
+            {"device": self.buffer_tuner.key, "buffer_size": buffer_size, "previous": previous, "overflows": overflows},
+        )
+
+    # Stage 2: encode/upload
+
+    async def _upload_stage(self) -> None:
+        """Encode buffered audio (or commit streamed audio) and build the request."""
+        while True:
+            turn = await self.upload_queue.get()
+            try:
+                if not self.provider:
+                    turn.holds_capture_buffer = False
+                    if turn.upload_task:
+                        turn.upload_task.cancel()
+                    self.ui.show_status("❌ Provider not found", "red")
+                    await self.session_mgr.emit(
+                        "app:error",
+                        {
+                            "error_type": "ProviderNotFound",
+                            "error_message": "openai-realtime provider not found in session",
+                        },
+                    )
+                    await self._finish_turn(turn, "error")
+                    continue
+
+                # Build messages with system instruction
+                turn.messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+
+                if turn.upload_task:
+                    # Audio is already in the provider's input buffer - just commit it. The capture
+                    # buffer stays referenced until the response arrives, so a failed request can resend it.
+                    try:
+                        await turn.upload_task
+                        async with asyncio.timeout(self.config.response_timeout):
+                            await self.provider.commit_input_audio()
+                    except Exception as e:
+                        await self._emit_retry(turn, "commit", e, 0.0)
+                        self._send_audio_inline(turn)
+                else:
+                    wire_data = turn.encoder.encode(turn.audio)
+                    # pcm16 is sent straight from the capture buffer; encoded formats are copies
+                    turn.holds_capture_buffer = wire_data is turn.audio
+                    turn.messages.append(user_audio_message(wire_data, turn.encoder))
+
+                await self.response_queue.put(turn)
+            except Exception as e:
+                turn.holds_capture_buffer = False
+                if turn.upload_task and not turn.upload_task.done():
+                    turn.upload_task.cancel()
+                await self._report_error(e)
+                await self._finish_turn(turn, "error")
+
+    # Stage 3: response receive
+
+    async def _response_stage(self) -> None:
+        """Send each request to the provider and fan the response out."""
+        while True:
+            turn = await self.response_queue.get()
+            try:
+                # Earlier turns go in as text between the system prompt and this turn's audio. Added
+                # here rather than in the upload stage, so the turn answered just before is included.
+                turn.messages[1:1] = self.history.messages()
+                await self._request_response(turn)
+            except Exception as e:
+                await self._report_error(e)
+                await self._finish_turn(turn, "error")
+                continue
+            finally:
+                turn.holds_capture_buffer = False
+                turn.messages = []
+                if turn.response_chunks is not None:
+                    turn.response_chunks.put_nowait(None)  # Playback finishes what arrived
+
+            raw = turn.response.raw
+            if raw and "audio_data" in raw:
+                turn.response_audio = response_decoder(raw, self.config.sample_rate).decode(raw["audio_data"])
+                if self.archive:
+                    offset = self.archive.position("assistant")
+                    self.archive.write("assistant", turn.response_audio)
+                    turn.archive["assistant"] = self.archive.segment("assistant", offset)
+
+            await self.transcript_queue.put(turn)
+
+            if not self._is_current(turn):
+                await self._finish_turn(turn, "superseded")
+            elif turn.response_audio is not None:
+                await self.playback_queue.put(turn)
+            elif turn.response_chunks is None:
+                self.ui.show_status("🔊 Response received (no audio)", "magenta")
+                self._show_ready()
+                await self._finish_turn(turn, "no_audio")
+
+    async def _request_response(self, turn: Turn) -> None:
+        """Get the turn's response within its deadline, retrying failed attempts.
+
+        Each attempt is cancelled after response_timeout (or whatever is left
+        of turn_deadline, counted from the end of recording). Failed attempts
+        are retried after a jittered backoff while attempts and deadline
+        allow - but not once a streamed response has started to play. The
+        circuit breaker fails the turn at once while the provider is down.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            TimeoutError: If the last attempt timed out, or the turn deadline passed
+            Exception: Whatever the last attempt raised
+        """
+        deadline = turn.trace.marks.get("stop", time.monotonic()) + self.config.turn_deadline
+        while True:
+            started = time.monotonic()
+            timeout = min(self.config.response_timeout, deadline - started)
+            if timeout <= 0:
+                # Not the provider's fault, so not a breaker failure
+                raise TimeoutError(f"Turn deadline of {self.config.turn_deadline:.0f}s exceeded")
+            self.breaker.check()
+            turn.attempts += 1
+            try:
+                try:
+                    # Call provider directly with audio (provider emits provider:request and provider:response hooks)
+                    turn.trace.mark("request_sent")
+                    async with asyncio.timeout(timeout) as scope:
+                        if self.stream_output:
+                            await self._stream_response(turn, scope)
+                        else:
+                            turn.response = await self.provider.complete(turn.messages)
+                            turn.trace.mark("first_response")
+                except TimeoutError as e:
+                    raise TimeoutError(f"No response from provider within {timeout:.1f}s") from e
+            except Exception as e:
+                self.breaker.record_failure()
+                delay = backoff_delay(turn.attempts)
+                if (
+                    turn.attempts > self.config.max_retries
+                    or "first_response" in turn.trace.marks  # Part of a streamed answer was already shown/played
+                    or self.breaker.state == "open"
+                    or time.monotonic() + delay >= deadline
+                ):
+                    raise
+                turn.retry_ms += (time.monotonic() - started + delay) * 1000
+                await self._emit_retry(turn, "response", e, delay)
+                if turn.upload_task:
+                    # The provider's committed input may have gone with the failed request
+                    self._send_audio_inline(turn)
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return
+
+    def _send_audio_inline(self, turn: Turn) -> None:
+        """Send the captured recording with the request instead of relying on the provider's input buffer."""
+        turn.upload_task = None
+        encoder = codec.WireEncoder(turn.encoder.wire_format, turn.encoder.sample_rate)  # Fresh stream state
+        turn.messages.append(user_audio_message(encoder.encode(turn.audio), encoder))
+
+    async def _emit_retry(self, turn: Turn, stage: str, error: Exception, delay: float) -> None:
+        """Report a failed provider call that is being retried (or worked around)."""
+        self.ui.show_status(f"⚠ {type(error).__name__}: {escape(str(error))} - retrying", "yellow")
+        await self.session_mgr.emit(
+            "provider:retry",
+            {
+                "turn_id": turn.turn_id,
+                "stage": stage,
+                "attempt": turn.attempts,
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+                "delay_ms": round(delay * 1000, 1),
+                "breaker": self.breaker.state,
+            },
+        )
+
+    async def _stream_response(self, turn: Turn, scope: asyncio.Timeout) -> None:
+        """Consume the provider's response deltas as they are generated.
+
+        Text is shown as it grows; the turn goes to playback with its first
+        audio chunk, and later chunks follow through turn.response_chunks.
+        turn.response.content is complete once the stream ends.
+
+        Args:
+            turn: Turn being answered
+            scope: Timeout of this attempt; each delta extends it by response_timeout
+        """
+        loop = asyncio.get_running_loop()
+        turn.response = StreamedResponse()
+        text: list[str] = []
+        decoder = None
+        archive_offset = 0
+        async for delta in self.provider.stream(turn.messages):
+            # Once the answer is flowing the deadline no longer applies, only a stall between deltas does
+            scope.reschedule(loop.time() + self.config.response_timeout)
+            turn.trace.mark("first_response")  # Only the first delta counts
+            kind = delta.get("type")
+            if kind == "input_transcript" and delta.get("delta"):
+                turn.response.raw["input_transcript"] = turn.response.raw.get("input_transcript", "") + delta["delta"]
+            elif kind == "text" and delta.get("delta"):
+                text.append(delta["delta"])
+                if self.config.show_transcripts and self._is_current(turn):
+                    self.ui.show_partial_transcript("assistant", "".join(text))
+            elif kind == "audio" and delta.get("delta"):
+                if decoder is None:
+                    turn.response.raw["audio_format"] = delta.get("audio_format", "pcm16")
+                    turn.response.raw["sample_rate"] = delta.get("sample_rate")
+                    decoder = response_decoder(turn.response.raw, self.config.sample_rate)
+                    archive_offset = self.archive.position("assistant") if self.archive else 0
+                    turn.response_chunks = asyncio.Queue()
+                    if self._is_current(turn):
+                        await self.playback_queue.put(turn)
+                pcm = decoder.decode(delta["delta"])
+                if self.archive:
+                    self.archive.write("assistant", pcm)
+                if self._is_current(turn):  # Nobody will play a superseded turn's audio
+                    turn.response_chunks.put_nowait(pcm)
+
+        turn.response.content = "".join(text)
+        if self.archive and decoder is not None:
+            turn.archive["assistant"] = self.archive.segment("assistant", archive_offset)
+
+    # Stage 4: transcript persistence
+
+    async def _transcript_stage(self) -> None:
+        """Persist and display transcripts without holding up playback."""
+        while True:
+            turn = await self.transcript_queue.get()
+            response = turn.response
+            user_text = input_transcript(response)
+
+            # Log user input to transcript.jsonl (the provider's transcription if it reports one, else just audio)
+            self.session_mgr.write_transcript(
+                "user",
+                user_text or "[audio input]",
+                audio_metadata={
+                    "format": turn.encoder.wire_format,
+                    "sample_rate": turn.encoder.sample_rate,
+                    "duration_ms": turn.duration_ms,
+                    "bytes": len(turn.audio),
+                    **({"archive": turn.archive["user"]} if "user" in turn.archive else {}),
+                },
+            )
+
+            # Log assistant response to transcript.jsonl
+            self.session_mgr.write_transcript(
+                "assistant",
+                response.content,
+                audio_metadata={
+                    "format": response.raw.get("audio_format", "pcm16"),
+                    "sample_rate": response_sample_rate(response.raw, self.config.sample_rate),
+                    **({"archive": turn.archive["assistant"]} if "assistant" in turn.archive else {}),
+                }
+                if turn.response_audio is not None or turn.response_chunks is not None
+                else None,
+            )
+
+            # Display transcript
+            if self.config.show_transcripts:
+                if user_text:
+                    self.ui.show_transcript("user", user_text)
+                self.ui.show_transcript("assistant", response.content)
+
+    # Stage 5: playback
+
+    async def _play_stream(self, chunks: "asyncio.Queue[bytes | memoryview | None]") -> None:
+        """Play a streamed response chunk by chunk as it arrives, then wait for it to finish."""
+        while (chunk := await chunks.get()) is not None:
+            await self.audio_playback.feed(chunk)
+        await self.audio_playback.drain()
+
+    async def _playback_stage(self) -> None:
+        """Play responses; the capture stage cancels playback on barge-in."""
+        while True:
+            turn = await self.playback_queue.get()
+            if not self._is_current(turn):
+                await self._finish_turn(turn, "superseded")  # The user already started talking again
+                continue
+
+            # Assign the task before awaiting anything, so a barge-in from here on cancels it
+            self.ui.show_status("🔊 Playing response...", "magenta")
+            self._played_before = self.audio_playback.played_bytes
+            turn.trace.mark("playback_start")
+            if turn.response_chunks is not None:
+                self._play_task = asyncio.create_task(self._play_stream(turn.response_chunks))
+            else:
+                self._play_task = asyncio.create_task(self.audio_playback.play(turn.response_audio))
+
+            raw = turn.response.raw
+            await self.session_mgr.emit(
+                "audio:playback:start",
+                {
+                    "audio_format": raw.get("audio_format", "pcm16"),
+                    "sample_rate": response_sample_rate(raw, self.config.sample_rate),
+                },
+            )
+            await asyncio.wait({self._play_task})
+            turn.trace.mark("playback_end")
+
+            if self._play_task.cancelled():
+                # Barge-in - the capture stage reports the interruption
+                await self._finish_turn(turn, "interrupted")
+                continue
+            if self._play_task.exception():
+                await self._report_error(self._play_task.exception())
+                await self._finish_turn(turn, "error")
+            else:
+                await self.session_mgr.emit("audio:playback:complete", {})
+                await self._finish_turn(turn, "played")
+            self._show_ready()
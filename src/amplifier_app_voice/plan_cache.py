@@ -0,0 +1,108 @@
+"""Mount plan cache for amplifier-app-voice.
+
+Compiling profiles/voice.md means importing amplifier_profiles, parsing the
+profile and resolving it to a mount plan - the same result every launch
+until the profile or the Amplifier packages change. The compiled plan is
+cached under ``~/.amplifier/cache/mount-plans/`` keyed by a hash of the
+profile file's bytes and the installed version of each Amplifier
+distribution, so a warm start reads one small JSON file instead.
+
+Editing the profile or upgrading/reinstalling any of KEY_DISTRIBUTIONS
+changes the key, which is all the invalidation there is; stale entries are
+left behind and can be deleted freely. Plans are cached before the app
+config overrides are applied, and provider API keys are stripped, so the
+key never reaches the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from importlib import metadata
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".amplifier" / "cache" / "mount-plans"
+
+# Distributions whose code shapes the compiled plan or the modules it mounts
+KEY_DISTRIBUTIONS = (
+    "amplifier-app-voice",
+    "amplifier-core",
+    "amplifier-profiles",
+    "amplifier-module-resolution",
+    "amplifier-module-loop-basic",
+    "amplifier-module-context-simple",
+    "amplifier-module-provider-openai-realtime",
+    "amplifier-module-hooks-logging",
+)
+
+
+def _distribution_fingerprint(name: str) -> str:
+    """Installed version of a distribution, plus its VCS commit for git installs."""
+    try:
+        dist = metadata.distribution(name)
+    except metadata.PackageNotFoundError:
+        return "-"
+    # Git installs from a branch keep the same version across commits; direct_url.json records the commit
+    return f"{dist.version} {dist.read_text('direct_url.json') or ''}"
+
+
+def cache_key(profile_file: Path) -> str:
+    """Cache key for a profile file and the installed Amplifier packages.
+
+    Args:
+        profile_file: Profile markdown file
+
+    Returns:
+        Hex digest
+
+    Raises:
+        OSError: If the profile file can't be read
+    """
+    digest = hashlib.sha256(profile_file.read_bytes())
+    for name in KEY_DISTRIBUTIONS:
+        digest.update(f"\0{name}={_distribution_fingerprint(name)}".encode())
+    return digest.hexdigest()
+
+
+def _without_secrets(mount_plan: dict) -> dict:
+    """Shallow copy of a plan with provider API keys removed (the profile may expand them from the environment)."""
+    providers = [
+        {**provider, "config": {k: v for k, v in provider.get("config", {}).items() if k != "api_key"}}
+        for provider in mount_plan.get("providers", [])
+    ]
+    return {**mount_plan, "providers": providers} if providers else mount_plan
+
+
+def load(key: str) -> dict | None:
+    """Cached mount plan for key, or None on a miss (or an unreadable entry)."""
+    try:
+        with (CACHE_DIR / f"{key}.json").open() as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable mount plan cache entry {key}: {e}")
+        return None
+
+
+def store(key: str, mount_plan: dict) -> None:
+    """Cache a compiled mount plan. Failures are logged, never raised.
+
+    Written to a temporary file and renamed into place, so concurrent
+    launches never read a partial entry.
+
+    Args:
+        key: cache_key() of the profile it was compiled from
+        mount_plan: Compiled plan, before app config overrides
+    """
+    path = CACHE_DIR / f"{key}.json"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w") as f:
+            json.dump(_without_secrets(mount_plan), f)
+        os.replace(tmp, path)
+    except Exception as e:
+        # Don't fail the application if caching fails; the next launch just compiles again
+        logging.error(f"Failed to cache mount plan: {e}")
+        tmp.unlink(missing_ok=True)
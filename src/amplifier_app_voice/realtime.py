@@ -0,0 +1,199 @@
+"""Helpers for driving the openai-realtime provider from the app.
+
+The provider's required interface is ``complete(messages)``. Providers may
+additionally expose an incremental input buffer:
+
+- ``append_input_audio(chunk: bytes)`` - send captured audio as it arrives
+- ``commit_input_audio()`` - commit the appended audio as the user turn
+- ``clear_input_audio()`` - discard appended audio that won't be committed
+
+When input was committed this way, the messages passed to ``complete()``
+carry no audio part and the provider answers the committed turn.
+
+Providers may also expose ``cancel_response(audio_end_ms: int)`` to stop an
+in-flight response and truncate it to the audio the user actually heard.
+
+Instead of waiting for ``complete()``, the app consumes the response as it
+is generated when the provider exposes ``stream(messages)``: an async
+iterator over delta dicts, in order,
+
+- ``{"type": "text", "delta": str}`` - the next piece of the transcript
+- ``{"type": "audio", "delta": bytes, "audio_format": str, "sample_rate": int}``
+  - the next audio chunk in wire format (format keys as in ``raw``)
+- ``{"type": "input_transcript", "delta": str}`` - the next piece of the
+  transcription of the user's audio
+
+Either way, a provider that transcribes the user's audio reports it as
+``raw["input_transcript"]`` (or input_transcript deltas); the app uses it
+for the transcript and the conversation history.
+
+Other delta types are ignored. The iterator ends with the response.
+"""
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from .audio import codec
+
+PROVIDER_NAME = "openai-realtime"
+
+
+def get_provider(session: Any) -> Any | None:
+    """Look up the Realtime provider mounted in an Amplifier session.
+
+    Args:
+        session: AmplifierSession instance
+
+    Returns:
+        Provider instance, or None if not mounted
+    """
+    return session.coordinator.mount_points["providers"].get(PROVIDER_NAME)
+
+
+def user_audio_message(data: bytes | memoryview, encoder: codec.WireEncoder) -> dict:
+    """Build the user message carrying a recorded turn for ``complete()``.
+
+    Args:
+        data: Audio already encoded by encoder
+        encoder: Encoder that produced data (supplies format and sample rate)
+
+    Returns:
+        Message dict with a single audio content part
+    """
+    return {
+        "role": "user",
+        "content": [
+            {
+                "type": "audio",
+                "data": data,
+                "format": encoder.wire_format,
+                "sample_rate": encoder.sample_rate,
+            }
+        ],
+    }
+
+
+def response_sample_rate(raw: dict, sample_rate: int) -> int:
+    """Sample rate of a response's audio: what the provider reported, else its format's rate.
+
+    Args:
+        raw: The response's raw dict (audio_format, sample_rate)
+        sample_rate: App sample rate
+    """
+    return raw.get("sample_rate") or codec.wire_sample_rate(raw.get("audio_format", "pcm16"), sample_rate)
+
+
+def response_decoder(raw: dict, sample_rate: int) -> codec.WireDecoder:
+    """Decoder turning a response's audio into PCM16 at the app sample rate.
+
+    Args:
+        raw: The response's raw dict (audio_format, sample_rate)
+        sample_rate: App sample rate
+
+    Returns:
+        Decoder for raw["audio_data"]
+    """
+    return codec.WireDecoder(
+        raw.get("audio_format", "pcm16"),
+        sample_rate,
+        wire_rate=raw.get("sample_rate"),  # None: the format's rate (8 kHz for G.711)
+    )
+
+
+@dataclass
+class StreamedResponse:
+    """A response assembled from stream() deltas, shaped like complete()'s result.
+
+    raw carries the audio format keys but no audio_data; the audio went to
+    playback chunk by chunk.
+    """
+
+    content: str = ""
+    raw: dict = field(default_factory=dict)
+
+
+def input_transcript(response: Any) -> str | None:
+    """The provider's transcription of the user's audio for a response, if it reported one."""
+    return (response.raw or {}).get("input_transcript") or None
+
+
+def supports_response_streaming(provider: Any) -> bool:
+    """Check whether a provider can stream its response.
+
+    Args:
+        provider: Provider instance
+
+    Returns:
+        True if the provider has stream()
+    """
+    return callable(getattr(provider, "stream", None))
+
+
+def supports_input_streaming(provider: Any) -> bool:
+    """Check whether a provider accepts audio incrementally.
+
+    Args:
+        provider: Provider instance
+
+    Returns:
+        True if the provider has append_input_audio() and commit_input_audio()
+    """
+    return callable(getattr(provider, "append_input_audio", None)) and callable(
+        getattr(provider, "commit_input_audio", None)
+    )
+
+
+async def stream_input_audio(
+    provider: Any, chunks: AsyncIterator[bytes], encoder: codec.WireEncoder | None = None
+) -> int:
+    """Forward captured chunks to the provider's input buffer as they arrive.
+
+    Args:
+        provider: Provider supporting input streaming
+        chunks: Async iterator of PCM16 chunks (ends when recording stops)
+        encoder: Wire encoder applied to each chunk (default: send PCM16 as is)
+
+    Returns:
+        Total bytes forwarded
+    """
+    sent = 0
+    async for chunk in chunks:
+        data = encoder.encode(chunk) if encoder else chunk
+        await provider.append_input_audio(data)
+        sent += len(data)
+    return sent
+
+
+async def cancel_response(provider: Any, audio_end_ms: int) -> bool:
+    """Cancel or truncate the provider's current response after a barge-in.
+
+    Args:
+        provider: Provider instance (may be None)
+        audio_end_ms: Milliseconds of response audio played before the interruption
+
+    Returns:
+        True if the provider supports cancellation and was asked to cancel
+    """
+    cancel = getattr(provider, "cancel_response", None)
+    if not callable(cancel):
+        return False
+    await cancel(audio_end_ms=audio_end_ms)
+    return True
+
+
+async def clear_input_audio(provider: Any) -> bool:
+    """Discard audio appended to the provider's input buffer but never committed.
+
+    Args:
+        provider: Provider instance (may be None)
+
+    Returns:
+        True if the provider supports clearing its input and was asked to
+    """
+    clear = getattr(provider, "clear_input_audio", None)
+    if not callable(clear):
+        return False
+    await clear()
+    return True
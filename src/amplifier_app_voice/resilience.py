@@ -0,0 +1,70 @@
+"""Failure handling for provider calls in amplifier-app-voice.
+
+A turn's request is retried with jittered exponential backoff while it has
+budget left (see TurnPipeline._request_response). Across turns, a circuit
+breaker stops sending requests after repeated failures, so a provider that
+is down costs one fast error per turn instead of a full timeout, and lets
+one trial request through after a cooldown.
+"""
+
+import random
+import time
+
+
+class CircuitOpenError(Exception):
+    """The provider failed too often recently; requests are not being sent."""
+
+
+def backoff_delay(attempt: int, base: float = 0.25, cap: float = 4.0) -> float:
+    """Seconds to wait before retry number attempt (1-based), with full jitter.
+
+    Random in [0, min(cap, base * 2 ** (attempt - 1))], so retries from many
+    clients after a shared outage don't arrive in lockstep.
+    """
+    return random.uniform(0.0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Closed -> open after threshold consecutive failures -> half-open after cooldown."""
+
+    def __init__(self, threshold: int = 3, cooldown: float = 30.0) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open before a trial request
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half-open"."""
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def check(self) -> None:
+        """Raise unless a request may be sent now.
+
+        Raises:
+            CircuitOpenError: While the circuit is open
+        """
+        if self.state == "open":
+            remaining = self.cooldown - (time.monotonic() - self.opened_at)
+            raise CircuitOpenError(
+                f"Provider failed {self.failures} times in a row; next attempt in {remaining:.0f}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure; open (or re-open, after a failed trial) the circuit at the threshold."""
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
@@ -1,16 +1,21 @@
 """Amplifier session management for amplifier-app-voice."""
 
+import asyncio
 import json
+import logging
+import sys
 import uuid
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
 
 from amplifier_core import AmplifierSession
-from amplifier_profiles import ProfileLoader
-from amplifier_profiles import compile_profile_to_mount_plan
 
+from . import plan_cache
+from .archive import AudioArchive
 from .config import AppConfig
+from .events import EventBus
+from .transcript import JsonlWriter
 
 
 def _get_project_slug() -> str:
@@ -22,6 +27,42 @@ def _get_project_slug() -> str:
     return slug
 
 
+def _profile_search_paths() -> list[Path]:
+    """Directories that may hold voice.md, in lookup order."""
+    # Try package directory first (local dev), then installed location (uvx)
+    profile_paths = [
+        Path(__file__).parent.parent.parent / "profiles",  # Local dev
+        Path(__file__).parent.parent / "profiles",  # Also try closer
+    ]
+
+    # Add system install location if available
+    site_packages = Path(sys.prefix) / "share" / "amplifier_app_voice" / "profiles"
+    if site_packages.exists():
+        profile_paths.append(site_packages)
+    return profile_paths
+
+
+def transcript_entry(role: str, content: str, audio_metadata: dict | None = None) -> dict:
+    """Build a transcript.jsonl entry.
+
+    Args:
+        role: "user" or "assistant"
+        content: Transcript text
+        audio_metadata: Optional audio metadata (format, sample_rate, duration, etc.)
+
+    Returns:
+        Entry dict with a UTC timestamp
+    """
+    entry = {
+        "ts": datetime.now(UTC).isoformat(),
+        "role": role,
+        "content": content,
+    }
+    if audio_metadata:
+        entry["audio"] = audio_metadata
+    return entry
+
+
 class SessionManager:
     """Manages Amplifier session with Realtime provider."""
 
@@ -36,6 +77,9 @@ class SessionManager:
         self.session: AmplifierSession | None = None
         self.session_id: str | None = None
         self.session_dir: Path | None = None
+        self.writer = JsonlWriter(config.transcript_durability, config.transcript_flush_ms)
+        self.archive: AudioArchive | None = None
+        self.events = EventBus(config.hook_queue_size, sync=config.sync_hooks)
 
     async def create_session(self) -> AmplifierSession:
         """
@@ -70,58 +114,35 @@ class SessionManager:
         with (self.session_dir / "metadata.json").open("w") as f:
             json.dump(metadata, f, indent=2)
 
-        # Load voice profile from profiles/voice.md
-        # Try package directory first (local dev), then installed location (uvx)
-        profile_paths = [
-            Path(__file__).parent.parent.parent / "profiles",  # Local dev
-            Path(__file__).parent.parent / "profiles",  # Also try closer
-        ]
-
-        # Add system install location if available
-        try:
-            import sys
-
-            site_packages = Path(sys.prefix) / "share" / "amplifier_app_voice" / "profiles"
-            if site_packages.exists():
-                profile_paths.append(site_packages)
-        except Exception:
-            pass
+        if self.config.archive_audio:
+            self.archive = AudioArchive(
+                self.session_dir / "audio",
+                self.config.sample_rate,
+                self.config.archive_format,
+                self.config.transcript_flush_ms,
+            )
 
-        loader = ProfileLoader(search_paths=profile_paths)
-        profile = loader.load_profile("voice")
-
-        # Compile to mount plan
-        mount_plan = compile_profile_to_mount_plan(profile)
+        # Profile loading and compilation is blocking file/module work - keep it off the event loop
+        mount_plan = await asyncio.to_thread(self.compile_mount_plan)
 
         # Add session_id to mount plan for event tracking
         mount_plan["session_id"] = self.session_id
 
-        # Override provider config with app settings
-        if mount_plan.get("providers"):
-            mount_plan["providers"][0]["config"]["api_key"] = self.config.api_key
-            mount_plan["providers"][0]["config"]["model"] = self.config.model
-            mount_plan["providers"][0]["config"]["voice"] = self.config.voice
-            mount_plan["providers"][0]["config"]["temperature"] = self.config.temperature
-            if self.config.max_response_tokens:
-                mount_plan["providers"][0]["config"]["max_response_tokens"] = self.config.max_response_tokens
-
         try:
             self.session = AmplifierSession(config=mount_plan)
             await self.session.__aenter__()
             
             # Emit session:start event
-            if self.session and hasattr(self.session, "coordinator") and hasattr(self.session.coordinator, "hooks"):
-                await self.session.coordinator.hooks.emit(
-                    "session:start",
-                    {
-                        "session_id": self.session_id,
-                        "application": "amplifier-app-voice",
-                        "profile": "voice",
-                        "model": self.config.model,
-                        "voice": self.config.voice,
-                    },
-                )
-            
+            await self.emit(
+                "session:start",
+                {
+                    "application": "amplifier-app-voice",
+                    "profile": "voice",
+                    "model": self.config.model,
+                    "voice": self.config.voice,
+                },
+            )
+
             return self.session
         except Exception as e:
             self.session = None
@@ -129,28 +150,95 @@ class SessionManager:
             self.session_dir = None
             raise RuntimeError(f"Failed to create Amplifier session: {e}") from e
 
+    def compile_mount_plan(self) -> dict:
+        """
+        Load profiles/voice.md and compile it to a mount plan with app config overrides.
+
+        The compiled plan is cached by profile content and installed package
+        versions (see plan_cache), so a warm start skips profile parsing and
+        compilation. Blocking (files and module resolution); create_session()
+        runs it in a thread.
+
+        Returns:
+            Mount plan for AmplifierSession
+        """
+        profile_paths = _profile_search_paths()
+        profile_file = next((path / "voice.md" for path in profile_paths if (path / "voice.md").is_file()), None)
+
+        mount_plan = None
+        key = None
+        if profile_file:
+            try:
+                key = plan_cache.cache_key(profile_file)
+                mount_plan = plan_cache.load(key)
+            except OSError as e:
+                logging.warning(f"Mount plan cache unavailable: {e}")
+
+        if mount_plan is None:
+            # Imported here so warm starts never load amplifier_profiles
+            from amplifier_profiles import ProfileLoader
+            from amplifier_profiles import compile_profile_to_mount_plan
+
+            loader = ProfileLoader(search_paths=profile_paths)
+            profile = loader.load_profile("voice")
+
+            # Compile to mount plan
+            mount_plan = compile_profile_to_mount_plan(profile)
+            if key:
+                plan_cache.store(key, mount_plan)
+
+        # Override provider config with app settings
+        if mount_plan.get("providers"):
+            mount_plan["providers"][0]["config"]["api_key"] = self.config.api_key
+            mount_plan["providers"][0]["config"]["model"] = self.config.model
+            mount_plan["providers"][0]["config"]["voice"] = self.config.voice
+            mount_plan["providers"][0]["config"]["temperature"] = self.config.temperature
+            if self.config.max_response_tokens:
+                mount_plan["providers"][0]["config"]["max_response_tokens"] = self.config.max_response_tokens
+            if self.config.wire_format != "pcm16":
+                mount_plan["providers"][0]["config"]["input_audio_format"] = self.config.wire_format
+                mount_plan["providers"][0]["config"]["output_audio_format"] = self.config.wire_format
+
+        return mount_plan
+
     async def close(self):
         """Close session gracefully."""
         if self.session:
             try:
-                # Emit session:end event
-                if hasattr(self.session, "coordinator") and hasattr(self.session.coordinator, "hooks"):
-                    await self.session.coordinator.hooks.emit(
-                        "session:end",
-                        {
-                            "session_id": self.session_id,
-                            "application": "amplifier-app-voice",
-                        },
-                    )
+                # Emit session:end event and deliver everything queued while the hooks are still mounted
+                await self.emit("session:end", {"application": "amplifier-app-voice"})
+                await self.events.close()
                 await self.session.__aexit__(None, None, None)
             finally:
                 self.session = None
                 self.session_id = None
                 self.session_dir = None
+
+        # Drain queued transcript/timing entries and archived audio (off the event loop)
+        await asyncio.to_thread(self.writer.close)
+        if self.archive:
+            await asyncio.to_thread(self.archive.close)
+            self.archive = None
     
+    async def emit(self, event: str, data: dict) -> None:
+        """Emit a hook event tagged with the session ID, without waiting for the hooks.
+
+        Delivered in order by a background task (see events.EventBus), or
+        inline when sync_hooks is set. Does nothing without a session.
+
+        Args:
+            event: Event name
+            data: Event data
+        """
+        session = self.session
+        if session and hasattr(session, "coordinator") and hasattr(session.coordinator, "hooks"):
+            await self.events.emit(session.coordinator.hooks, event, {"session_id": self.session_id, **data})
+
     def write_transcript(self, role: str, content: str, audio_metadata: dict | None = None):
-        """Write transcript entry to transcript.jsonl.
-        
+        """Queue a transcript entry for transcript.jsonl.
+
+        Written by a background thread (see transcript.JsonlWriter), so this never blocks.
+
         Args:
             role: "user" or "assistant"
             content: Transcript text
@@ -158,20 +246,16 @@ class SessionManager:
         """
         if not self.session_dir:
             return
-        
-        transcript_file = self.session_dir / "transcript.jsonl"
-        entry = {
-            "ts": datetime.now(UTC).isoformat(),
-            "role": role,
-            "content": content,
-        }
-        if audio_metadata:
-            entry["audio"] = audio_metadata
-        
-        try:
-            with transcript_file.open("a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception as e:
-            # Don't fail the application if transcript logging fails
-            import logging
-            logging.error(f"Failed to write transcript: {e}")
+
+        self.writer.write(self.session_dir / "transcript.jsonl", transcript_entry(role, content, audio_metadata))
+
+    def write_timing(self, entry: dict):
+        """Queue a per-turn timing entry for timings.jsonl.
+
+        Args:
+            entry: Timing data (turn_id, spans_ms, ...)
+        """
+        if not self.session_dir:
+            return
+
+        self.writer.write(self.session_dir / "timings.jsonl", {"ts": datetime.now(UTC).isoformat(), **entry})
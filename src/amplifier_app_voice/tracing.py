@@ -0,0 +1,108 @@
+"""Per-turn latency tracing for amplifier-app-voice.
+
+Each turn records monotonic timestamps at points on the critical path and
+reports the spans between them (in milliseconds) as a ``turn:timing`` hook
+event and a line in the session's ``timings.jsonl``.
+
+Usage:
+    python -m amplifier_app_voice.tracing <session_dir>   # p50/p95 per span
+"""
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+# span name -> (start mark, end mark)
+SPANS = {
+    "key_to_stream_open": ("key_press", "stream_open"),
+    "stop_to_request_sent": ("stop", "request_sent"),
+    "request_to_first_response": ("request_sent", "first_response"),
+    "response_to_playback_start": ("first_response", "playback_start"),
+    "playback": ("playback_start", "playback_end"),
+    "stop_to_playback_start": ("stop", "playback_start"),
+}
+
+
+class TurnTracer:
+    """Collects monotonic timestamps for one turn."""
+
+    def __init__(self, turn_id: int) -> None:
+        """Initialize tracer.
+
+        Args:
+            turn_id: Turn this trace belongs to
+        """
+        self.turn_id = turn_id
+        self.marks: dict[str, float] = {}
+        self.finished = False
+
+    def mark(self, name: str) -> None:
+        """Record the first time a point on the critical path is reached.
+
+        Args:
+            name: Mark name (see SPANS)
+        """
+        self.marks.setdefault(name, time.monotonic())
+
+    def spans(self) -> dict[str, float]:
+        """Durations between recorded marks.
+
+        Returns:
+            Span name -> milliseconds, for spans whose marks were both recorded
+        """
+        return {
+            name: round((self.marks[end] - self.marks[start]) * 1000, 2)
+            for name, (start, end) in SPANS.items()
+            if start in self.marks and end in self.marks
+        }
+
+
+def summarize(timings_path: Path) -> dict[str, dict[str, float]]:
+    """Compute per-span percentiles from a session's timings.jsonl.
+
+    Args:
+        timings_path: Path to timings.jsonl
+
+    Returns:
+        Span name -> {"count", "p50", "p95", "max"} in milliseconds
+    """
+    values: dict[str, list[float]] = {}
+    with timings_path.open() as f:
+        for line in f:
+            for name, ms in json.loads(line).get("spans_ms", {}).items():
+                values.setdefault(name, []).append(ms)
+
+    return {
+        name: {
+            "count": len(ms),
+            "p50": float(np.percentile(ms, 50)),
+            "p95": float(np.percentile(ms, 95)),
+            "max": max(ms),
+        }
+        for name, ms in values.items()
+    }
+
+
+def main() -> None:
+    """CLI entry point for timing summaries."""
+    import sys
+
+    if len(sys.argv) != 2:
+        print("Usage: python -m amplifier_app_voice.tracing <session_dir>")
+        sys.exit(1)
+
+    timings_path = Path(sys.argv[1]) / "timings.jsonl"
+    if not timings_path.exists():
+        print(f"No timings found at {timings_path}")
+        sys.exit(1)
+
+    print(f"\n{'span':<28} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    print("-" * 68)
+    for name, stats in summarize(timings_path).items():
+        print(f"{name:<28} {stats['count']:>6} {stats['p50']:>10.1f} {stats['p95']:>10.1f} {stats['max']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Background JSON-lines writer for session logs (transcript.jsonl, timings.jsonl).
+
+Entries are queued from the event loop without touching the filesystem.
+A writer thread serializes them, coalesces whatever arrives within
+flush_ms into one batch and appends it with one write per file, keeping
+files open between batches. What happens after each batch is the
+durability policy:
+
+- ``close`` - leave entries in Python's file buffer until close (fastest)
+- ``flush`` - hand each batch to the OS; survives an app crash (default)
+- ``fsync`` - also sync each batch to disk; survives power loss
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import IO
+
+DURABILITY_POLICIES = ("close", "flush", "fsync")
+
+_CLOSE = object()  # Queue sentinel
+
+
+class JsonlWriter:
+    """Appends JSON lines to files from a background thread."""
+
+    def __init__(self, durability: str = "flush", flush_ms: int = 200) -> None:
+        """Initialize writer (the thread starts with the first entry).
+
+        Args:
+            durability: One of DURABILITY_POLICIES
+            flush_ms: How long to gather entries into one batch
+
+        Raises:
+            ValueError: If durability is unknown
+        """
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"Unknown durability policy: {durability} (expected one of {', '.join(DURABILITY_POLICIES)})"
+            )
+        self.durability = durability
+        self.flush_interval = flush_ms / 1000
+        self.written = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._files: dict[Path, IO[str]] = {}
+
+    def write(self, path: Path, entry: dict) -> None:
+        """Queue an entry to be appended to path. Never blocks.
+
+        Args:
+            path: JSON-lines file
+            entry: JSON-serializable dict
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="jsonl-writer", daemon=True)
+            self._thread.start()
+        self._queue.put((path, entry))
+
+    def close(self) -> None:
+        """Write everything queued, sync according to the policy and close files.
+
+        Blocks until done; from the event loop use ``await asyncio.to_thread(writer.close)``.
+        The writer can be used again afterwards.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Writer thread: gather batches until the close sentinel."""
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not _CLOSE:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch[-1] is _CLOSE:
+                closing = True
+                batch.pop()
+            self._write_batch(batch, sync=closing)
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def _write_batch(self, batch: list[tuple[Path, dict]], sync: bool) -> None:
+        """Append one batch, grouped by file, then apply the durability policy."""
+        lines: dict[Path, list[str]] = {}
+        for path, entry in batch:
+            try:
+                lines.setdefault(path, []).append(json.dumps(entry) + "\n")
+            except Exception as e:
+                # Skip the entry, not the batch (an exception here would end the writer thread)
+                logging.error(f"Failed to serialize {path.name} entry: {e}")
+
+        for path, path_lines in lines.items():
+            try:
+                f = self._files.get(path)
+                if f is None:
+                    f = self._files[path] = path.open("a")
+                f.write("".join(path_lines))
+                self.written += len(path_lines)
+            except Exception as e:
+                # Don't fail the application if session logging fails
+                logging.error(f"Failed to write {path.name}: {e}")
+
+        touched = self._files.values() if sync else [self._files[path] for path in lines if path in self._files]
+        for f in touched:
+            try:
+                if sync or self.durability != "close":
+                    f.flush()
+                if (sync and self.durability != "close") or self.durability == "fsync":
+                    os.fsync(f.fileno())
+            except Exception as e:
+                logging.error(f"Failed to flush {f.name}: {e}")
@@ -1,6 +1,20 @@
-"""Terminal UI and keyboard input handling."""
+"""Terminal UI and keyboard input handling.
 
-from .keyboard import KeyboardHandler
-from .terminal import TerminalUI
+Exports are imported on first use, so the terminal UI doesn't load pynput.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "KeyboardHandler": "keyboard",
+    "TerminalUI": "terminal",
+}
 
 __all__ = ["TerminalUI", "KeyboardHandler"]
+
+
+def __getattr__(name: str):
+    """Import an exported name's module on first access."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -58,6 +58,13 @@ class KeyboardHandler:
         self._stop_event.clear()
         await self._stop_event.wait()
 
+    def end_recording(self: "KeyboardHandler") -> None:
+        """Mark recording as stopped without a key press (e.g. auto-stop).
+
+        The next spacebar press then starts a new recording instead of stopping one.
+        """
+        self.recording = False
+
     def stop(self: "KeyboardHandler") -> None:
         """Stop keyboard listener."""
         self._running = False
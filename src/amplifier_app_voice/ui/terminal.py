@@ -1,16 +1,132 @@
-"""Terminal UI using Rich library for beautiful console output."""
+"""Terminal UI using Rich library for beautiful console output.
+
+Two modes:
+
+- Live (interactive, stdout is a terminal, between start() and stop()): a
+  ``rich.live`` layout with a transcript pane above a status bar. UI calls
+  only update state; a render task redraws at most render_fps times a
+  second, so bursts of updates (e.g. the level meter) coalesce into one
+  frame and nothing scrolls.
+- Plain (no terminal, or never started - batch and gateway modes): every
+  status and transcript entry is written once as a line; transient output
+  (the recording meter, clearing the status) is skipped.
+
+The transcript keeps the last history_lines entries; older ones are only
+in transcript.jsonl.
+"""
+
+import asyncio
+from collections import deque
 
 from rich.console import Console
+from rich.console import Group
+from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
+from rich.segment import SegmentLines
+from rich.text import Text
+
+METER_WIDTH = 30  # Level meter cells
+METER_FLOOR_DB = -60.0  # Level shown as an empty meter
+
+
+def _meter_cells(level_db: float) -> int:
+    """Number of meter cells lit for a level in dBFS."""
+    fraction = (level_db - METER_FLOOR_DB) / -METER_FLOOR_DB
+    return round(min(1.0, max(0.0, fraction)) * METER_WIDTH)
+
+
+def _transcript_line(role: str, text: str) -> str:
+    """Markup for one transcript entry."""
+    prefix = "You:" if role == "user" else "Assistant:"
+    return f"[bold]{prefix}[/bold] {escape(text)}"
 
 
 class TerminalUI:
     """Terminal UI using Rich library."""
 
-    def __init__(self: "TerminalUI") -> None:
-        """Initialize Rich console and transcript storage."""
-        self.console = Console()
-        self.transcript_lines: list[str] = []
+    def __init__(
+        self: "TerminalUI",
+        console: Console | None = None,
+        live: bool = True,
+        render_fps: float = 10.0,
+        history_lines: int = 200,
+    ) -> None:
+        """Initialize Rich console and transcript storage.
+
+        Args:
+            console: Console to draw on (default: stdout)
+            live: Use the live layout after start() when the console is a terminal (default: True)
+            render_fps: Maximum live redraws per second (default: 10)
+            history_lines: Transcript entries kept for the transcript pane (default: 200)
+        """
+        self.console = console or Console()
+        self.live = live
+        self.render_fps = render_fps
+        self.transcript_lines: deque[str] = deque(maxlen=history_lines)
+        self.partial_line: str | None = None  # Transcript entry still being generated
+        self.status = Text()
+        self.recording: Text | None = None
+        self._live: Live | None = None
+        self._dirty = asyncio.Event()
+        self._render_task: asyncio.Task | None = None
+
+    @property
+    def is_live(self: "TerminalUI") -> bool:
+        """True while the live layout is being rendered."""
+        return self._live is not None
+
+    def start(self: "TerminalUI") -> None:
+        """Switch to the live layout (no-op without a terminal). Requires a running event loop."""
+        if not self.live or not self.console.is_terminal or self._live:
+            return
+        self._live = Live(console=self.console, auto_refresh=False, get_renderable=self._render)
+        self._live.start()
+        self._render_task = asyncio.create_task(self._render_loop(), name="terminal-ui")
+
+    def stop(self: "TerminalUI") -> None:
+        """Draw the final frame and return to plain line output."""
+        if not self._live:
+            return
+        if self._render_task:
+            self._render_task.cancel()
+            self._render_task = None
+        self.recording = None
+        self._live.refresh()
+        self._live.stop()
+        self._live = None
+
+    async def _render_loop(self: "TerminalUI") -> None:
+        """Redraw after updates, at most render_fps times a second."""
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            self._live.refresh()
+            await asyncio.sleep(1 / self.render_fps)
+
+    def _render(self: "TerminalUI") -> Group:
+        """Live layout: transcript pane with the newest lines that fit, then the status bar.
+
+        Entries wrap, so the pane is filled by rendered line, newest first,
+        until it plus the status and meter lines fill the terminal.
+        """
+        width, height = self.console.size
+        options = self.console.options.update_width(width)
+        footer = [self.status, self.recording or Text("")]
+        footer_height = sum(len(self.console.render_lines(part, options, pad=False)) for part in footer)
+        rows = max(1, height - 2 - footer_height)  # Panel top and bottom borders
+
+        entries = list(self.transcript_lines)
+        if self.partial_line is not None:
+            entries.append(self.partial_line)
+        inner = options.update_width(max(1, width - 4))  # Panel borders and padding
+        lines: list = []
+        for entry in reversed(entries):
+            lines[:0] = self.console.render_lines(Text.from_markup(entry), inner, pad=False)
+            if len(lines) >= rows:
+                break
+        pane = Panel(SegmentLines(lines[-rows:], new_lines=True) if lines else Text(""), title="Conversation")
+        return Group(pane, *footer)
 
     def show_welcome(self: "TerminalUI") -> None:
         """Display welcome message with instructions."""
@@ -28,10 +144,13 @@ class TerminalUI:
         """Display status message with optional styling.
 
         Args:
-            message: Status message to display
+            message: Status message to display, in Rich markup (escape() untrusted text)
             style: Rich style string (e.g., "green", "yellow", "red", "cyan")
         """
-        if style:
+        if self._live:
+            self.status = Text.from_markup(message.strip(), style=style)
+            self._dirty.set()
+        elif style:
             self.console.print(f"[{style}]{message}[/{style}]")
         else:
             self.console.print(message)
@@ -43,19 +162,57 @@ class TerminalUI:
             role: Either "user" or "assistant"
             text: Transcript text to display
         """
-        prefix = "You:" if role == "user" else "Assistant:"
-        line = f"[bold]{prefix}[/bold] {text}"
+        line = _transcript_line(role, text)
         self.transcript_lines.append(line)
-        self.console.print(line)
+        self.partial_line = None
+        if self._live:
+            self._dirty.set()
+        else:
+            self.console.print(line)
+
+    def show_partial_transcript(self: "TerminalUI", role: str, text: str) -> None:
+        """Display a transcript entry that is still growing (e.g. a streamed response).
 
-    def show_recording(self: "TerminalUI", duration: float) -> None:
-        """Display recording status with duration timer.
+        Replaced by the next show_transcript(); only shown in the live layout.
+
+        Args:
+            role: Either "user" or "assistant"
+            text: Transcript text so far
+        """
+        if self._live:
+            self.partial_line = _transcript_line(role, text) + " [dim]…[/dim]"
+            self._dirty.set()
+
+    def show_recording(
+        self: "TerminalUI", duration: float, rms_db: float | None = None, peak_db: float | None = None
+    ) -> None:
+        """Display recording status with duration timer and optional level meter.
+
+        Call it repeatedly (e.g. from audio.meter.watch_levels); only shown in the live layout.
 
         Args:
             duration: Recording duration in seconds
+            rms_db: Current RMS level in dBFS (None = no meter)
+            peak_db: Current peak level in dBFS, marked on the meter
         """
-        self.console.print(f"[yellow]Recording... ({duration:.1f}s)[/yellow]", end="\r")
+        if not self._live:
+            return
+
+        line = Text(f"Recording... ({duration:4.1f}s)", style="yellow")
+        if rms_db is not None:
+            filled = _meter_cells(rms_db)
+            bar = "█" * filled + "░" * (METER_WIDTH - filled)
+            if peak_db is not None and (peak := _meter_cells(peak_db) - 1) >= filled:
+                bar = bar[:peak] + "▏" + bar[peak + 1 :]
+            line.append(" ")
+            line.append(bar, style="red" if peak_db is not None and peak_db > -1.0 else "green")
+            line.append(f" {rms_db:6.1f} dB")
+        self.recording = line
+        self._dirty.set()
 
     def clear_status(self: "TerminalUI") -> None:
-        """Clear the current status line."""
-        self.console.print(" " * 80, end="\r")
+        """Clear the current status line (and recording meter)."""
+        if self._live:
+            self.status = Text()
+            self.recording = None
+            self._dirty.set()
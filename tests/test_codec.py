@@ -0,0 +1,112 @@
+"""Tests for the G.711 wire encodings."""
+
+import numpy as np
+import pytest
+
+from amplifier_app_voice.audio import codec
+
+# Scalar port of the G.711 reference implementation (Sun Microsystems g711.c)
+_SEG_UEND = (0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF)
+_SEG_AEND = (0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF)
+BIAS = 0x84
+CLIP = 8159
+
+
+def _search(value: int, table: tuple[int, ...]) -> int:
+    return next((i for i, end in enumerate(table) if value <= end), len(table))
+
+
+def linear2ulaw(pcm: int) -> int:
+    pcm >>= 2
+    mask = 0x7F if pcm < 0 else 0xFF
+    pcm = min(abs(pcm), CLIP) + (BIAS >> 2)
+    seg = _search(pcm, _SEG_UEND)
+    if seg >= 8:
+        return 0x7F ^ mask
+    return ((seg << 4) | ((pcm >> (seg + 1)) & 0x0F)) ^ mask
+
+
+def ulaw2linear(u: int) -> int:
+    u = ~u & 0xFF
+    t = (((u & 0x0F) << 3) + BIAS) << ((u & 0x70) >> 4)
+    return BIAS - t if u & 0x80 else t - BIAS
+
+
+def linear2alaw(pcm: int) -> int:
+    pcm >>= 3
+    if pcm >= 0:
+        mask = 0xD5
+    else:
+        mask = 0x55
+        pcm = -pcm - 1
+    seg = _search(pcm, _SEG_AEND)
+    if seg >= 8:
+        return 0x7F ^ mask
+    return ((seg << 4) | ((pcm >> (1 if seg < 2 else seg)) & 0x0F)) ^ mask
+
+
+def alaw2linear(a: int) -> int:
+    a ^= 0x55
+    t = (a & 0x0F) << 4
+    seg = (a & 0x70) >> 4
+    t = t + 8 if seg == 0 else (t + 0x108) << max(seg - 1, 0)
+    return t if a & 0x80 else -t
+
+
+REFERENCE = {"g711_ulaw": (linear2ulaw, ulaw2linear), "g711_alaw": (linear2alaw, alaw2linear)}
+ALL_SAMPLES = np.arange(-32768, 32768, dtype=np.int16)
+
+
+@pytest.mark.parametrize("wire_format", ["g711_ulaw", "g711_alaw"])
+def test_encode_matches_reference_for_every_sample(wire_format: str) -> None:
+    to_wire, _ = REFERENCE[wire_format]
+    expected = bytes(to_wire(int(s)) for s in ALL_SAMPLES)
+
+    assert codec.encode(ALL_SAMPLES.tobytes(), wire_format) == expected
+
+
+@pytest.mark.parametrize("wire_format", ["g711_ulaw", "g711_alaw"])
+def test_decode_matches_reference_for_every_byte(wire_format: str) -> None:
+    _, from_wire = REFERENCE[wire_format]
+    expected = np.array([from_wire(b) for b in range(256)], dtype=np.int16)
+
+    assert np.array_equal(np.frombuffer(codec.decode(bytes(range(256)), wire_format), dtype=np.int16), expected)
+
+
+@pytest.mark.parametrize("wire_format", ["g711_ulaw", "g711_alaw"])
+def test_round_trip_error_is_within_a_quantization_step(wire_format: str) -> None:
+    decoded = np.frombuffer(codec.decode(codec.encode(ALL_SAMPLES.tobytes(), wire_format), wire_format), np.int16)
+    error = np.abs(decoded.astype(np.int32) - ALL_SAMPLES)
+
+    # Steps grow with the segment: at most 1/16 of the magnitude (plus the smallest step near zero)
+    assert np.all(error <= np.abs(ALL_SAMPLES.astype(np.int32)) // 16 + 16)
+    assert len(decoded) == len(ALL_SAMPLES)
+
+
+def test_pcm16_passes_through_without_copying() -> None:
+    pcm = memoryview(bytes(100))
+    assert codec.encode(pcm, "pcm16") is pcm
+    assert codec.decode(pcm, "pcm16") is pcm
+
+
+def test_unknown_format_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown wire format"):
+        codec.encode(b"\0\0", "opus")
+    with pytest.raises(ValueError, match="Unknown wire format"):
+        codec.decode(b"\0", "opus")
+
+
+def test_streamed_g711_round_trip_keeps_a_tone() -> None:
+    t = np.arange(24000) / 24000
+    pcm = (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16).tobytes()
+    encoder = codec.WireEncoder("g711_ulaw", 24000)
+    decoder = codec.WireDecoder("g711_ulaw", 24000)
+
+    wire = b"".join(encoder.encode(pcm[i : i + 4800]) for i in range(0, len(pcm), 4800))
+    out = np.frombuffer(b"".join(decoder.decode(wire[i : i + 800]) for i in range(0, len(wire), 800)), np.int16)
+
+    assert encoder.sample_rate == 8000
+    assert abs(len(wire) - 8000) < 50  # One byte per 8 kHz sample
+    assert abs(len(out) - 24000) < 150
+    spectrum = np.abs(np.fft.rfft(out[2400:-2400] * np.hanning(len(out) - 4800)))
+    assert abs(np.argmax(spectrum) * 24000 / (len(out) - 4800) - 440) < 5
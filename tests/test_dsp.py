@@ -0,0 +1,120 @@
+"""Tests for the capture DSP filters."""
+
+import numpy as np
+import pytest
+
+from amplifier_app_voice.audio.dsp import AutomaticGainControl
+from amplifier_app_voice.audio.dsp import Filter
+from amplifier_app_voice.audio.dsp import HighPassFilter
+from amplifier_app_voice.audio.dsp import NoiseGate
+from amplifier_app_voice.audio.dsp import build_chain
+
+SAMPLE_RATE = 24000
+
+
+def _noise(seconds: float = 0.5, scale: float = 3000.0) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * scale).astype(np.float32)
+
+
+def _chunked(process, x: np.ndarray, size: int) -> np.ndarray:
+    return np.concatenate([process(x[i : i + size]) for i in range(0, len(x), size)])
+
+
+def _tone(freq: float, seconds: float = 1.0, amplitude: float = 10000.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _rms(x: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(x.astype(np.float64) ** 2)))
+
+
+@pytest.mark.parametrize("order", [1, 2, 4])
+def test_highpass_output_is_finite_up_to_the_cutoff_limit(order: int) -> None:
+    x = _noise()
+    for cutoff in [*np.geomspace(1.0, SAMPLE_RATE / 2, 40)[:-1], SAMPLE_RATE / 2 - 0.01]:
+        y = HighPassFilter(SAMPLE_RATE, cutoff_hz=float(cutoff), order=order).process(x)
+        assert np.all(np.isfinite(y)), f"non-finite output at cutoff {cutoff:.2f} Hz"
+        assert np.max(np.abs(y)) < 4 * np.max(np.abs(x))
+
+
+@pytest.mark.parametrize("cutoff", [20.0, 80.0, 1000.0, 11000.0])
+def test_highpass_matches_per_sample_recursion(cutoff: float) -> None:
+    x = _noise(0.2)
+    hp = HighPassFilter(SAMPLE_RATE, cutoff_hz=cutoff, order=1)
+    y = _chunked(hp.process, x, 777)
+
+    ref = np.empty(len(x))
+    x_prev = y_prev = 0.0
+    for n, value in enumerate(x.astype(np.float64)):
+        y_prev = hp.a * (y_prev + value - x_prev)
+        x_prev = value
+        ref[n] = y_prev
+
+    np.testing.assert_allclose(y, ref, atol=0.01)
+
+
+def test_highpass_is_independent_of_chunking() -> None:
+    x = _noise()
+    whole = HighPassFilter(SAMPLE_RATE).process(x)
+    chunked = _chunked(HighPassFilter(SAMPLE_RATE).process, x, 333)
+    np.testing.assert_allclose(chunked, whole, atol=0.01)
+
+
+def test_highpass_removes_rumble_and_keeps_speech_band() -> None:
+    rumble = HighPassFilter(SAMPLE_RATE, cutoff_hz=80.0).process(_tone(20.0))
+    voice = HighPassFilter(SAMPLE_RATE, cutoff_hz=80.0).process(_tone(1000.0))
+    assert _rms(rumble[SAMPLE_RATE // 2 :]) < 0.1 * _rms(_tone(20.0))
+    assert _rms(voice[SAMPLE_RATE // 2 :]) > 0.95 * _rms(_tone(1000.0))
+
+
+def test_noise_gate_attenuates_quiet_audio_and_passes_loud_audio() -> None:
+    gate = NoiseGate(SAMPLE_RATE, threshold_db=-45.0, floor_db=-30.0)
+    quiet = _chunked(gate.process, _noise(1.0, scale=30.0), 1024)
+    loud = _chunked(gate.process, _tone(300.0, amplitude=5000.0), 1024)
+
+    assert _rms(quiet[SAMPLE_RATE // 2 :]) == pytest.approx(_rms(_noise(1.0, scale=30.0)) * 10 ** (-30 / 20), rel=0.1)
+    assert _rms(loud[SAMPLE_RATE // 10 :]) == pytest.approx(_rms(_tone(300.0, amplitude=5000.0)), rel=0.01)
+
+
+def test_agc_raises_quiet_speech_toward_target() -> None:
+    agc = AutomaticGainControl(SAMPLE_RATE, target_db=-20.0)
+    y = _chunked(agc.process, _tone(200.0, seconds=4.0, amplitude=1500.0), 1024)  # About -30 dBFS
+    level_db = 20 * np.log10(_rms(y[-SAMPLE_RATE // 10 :]) / 32768.0)
+    assert level_db == pytest.approx(-20.0, abs=1.5)
+
+
+def test_agc_never_pushes_peaks_past_full_scale() -> None:
+    agc = AutomaticGainControl(SAMPLE_RATE)
+    _chunked(agc.process, _tone(200.0, seconds=4.0, amplitude=300.0), 1024)  # Gain climbs to the maximum
+    y = _chunked(agc.process, _tone(200.0, amplitude=30000.0), 1000)
+    assert np.max(np.abs(y)) <= 32767.0
+
+
+def test_chain_keeps_pcm_length_and_counts_chunks() -> None:
+    chain = build_chain(["highpass", "noise_gate", "agc"], SAMPLE_RATE)
+    pcm = _noise(0.2).astype(np.int16).tobytes()
+    out = b"".join(chain.process(pcm[i : i + 2048]) for i in range(0, len(pcm), 2048))
+
+    assert len(out) == len(pcm)
+    stats = chain.stats()
+    assert list(stats) == ["highpass", "noise_gate", "agc"]
+    assert all(s["chunks"] == -(-len(pcm) // 2048) for s in stats.values())
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [["reverb"], [{"highpass": {"cutoff_hz": SAMPLE_RATE / 2}}], [{"agc": {"speed": 1}}], [3], [{"a": {}, "b": {}}]],
+)
+def test_invalid_chain_is_rejected(spec: list) -> None:
+    with pytest.raises(ValueError, match="audio.dsp"):
+        build_chain(spec, SAMPLE_RATE)
+
+
+def test_filter_without_process_cannot_be_created() -> None:
+    class Incomplete(Filter):
+        name = "incomplete"
+
+    with pytest.raises(TypeError, match="process"):
+        Incomplete(SAMPLE_RATE)
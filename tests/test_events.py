@@ -0,0 +1,117 @@
+"""Tests for hook event delivery."""
+
+import asyncio
+import logging
+
+import pytest
+
+from amplifier_app_voice.events import DROPPED_EVENT
+from amplifier_app_voice.events import EventBus
+
+
+class Hooks:
+    """Hook registry that records events, optionally slowly or failing on some."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str | None = None) -> None:
+        self.delay = delay
+        self.fail_on = fail_on
+        self.events: list[tuple[str, dict]] = []
+
+    async def emit(self, event: str, data: dict) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if event == self.fail_on:
+            raise RuntimeError("hook broke")
+        self.events.append((event, data))
+
+
+def test_events_are_delivered_in_order_with_timestamps() -> None:
+    hooks = Hooks()
+
+    async def run() -> None:
+        bus = EventBus(batch_size=4)
+        for i in range(10):
+            await bus.emit(hooks, "turn:timing", {"i": i})
+        await bus.close()
+        assert bus.delivered == 10
+
+    asyncio.run(run())
+    assert [data["i"] for _, data in hooks.events] == list(range(10))
+    assert all("ts" in data for _, data in hooks.events)
+
+
+def test_emit_does_not_wait_for_slow_hooks() -> None:
+    hooks = Hooks(delay=0.05)
+
+    async def run() -> float:
+        bus = EventBus()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(5):
+            await bus.emit(hooks, "audio:recording:start", {"i": i})
+        elapsed = loop.time() - started
+        await bus.close()
+        return elapsed
+
+    assert asyncio.run(run()) < 0.05
+    assert len(hooks.events) == 5  # close() delivered them all
+
+
+def test_sync_delivers_before_emit_returns() -> None:
+    hooks = Hooks()
+
+    async def run() -> None:
+        bus = EventBus(sync=True)
+        await bus.emit(hooks, "app:initialized", {})
+        assert [event for event, _ in hooks.events] == ["app:initialized"]
+
+    asyncio.run(run())
+
+
+def test_failing_hook_is_logged_and_later_events_still_arrive(caplog: pytest.LogCaptureFixture) -> None:
+    hooks = Hooks(fail_on="app:error")
+
+    async def run() -> EventBus:
+        bus = EventBus()
+        for event in ("session:start", "app:error", "session:end"):
+            await bus.emit(hooks, event, {})
+        await bus.close()
+        return bus
+
+    with caplog.at_level(logging.ERROR):
+        bus = asyncio.run(run())
+
+    assert [event for event, _ in hooks.events] == ["session:start", "session:end"]
+    assert bus.delivered == 2
+    assert "Hook failed for app:error: hook broke" in caplog.text
+
+
+def test_full_queue_drops_and_reports_the_count() -> None:
+    hooks = Hooks()
+
+    async def run() -> EventBus:
+        bus = EventBus(max_queue=3)
+        for i in range(5):  # The delivery task doesn't run until we yield
+            await bus.emit(hooks, "audio:level", {"i": i, "session_id": "s"})
+        await bus.close()
+        return bus
+
+    bus = asyncio.run(run())
+
+    assert bus.dropped == 2
+    assert [data.get("i") for event, data in hooks.events if event != DROPPED_EVENT] == [0, 1, 2]
+    assert [data for event, data in hooks.events if event == DROPPED_EVENT][0]["count"] == 2
+
+
+def test_bus_can_be_reused_after_close() -> None:
+    hooks = Hooks()
+
+    async def run() -> None:
+        bus = EventBus()
+        await bus.emit(hooks, "first", {})
+        await bus.close()
+        await bus.emit(hooks, "second", {})
+        await bus.close()
+
+    asyncio.run(run())
+    assert [event for event, _ in hooks.events] == ["first", "second"]
@@ -0,0 +1,116 @@
+"""Tests for the gateway's session handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("amplifier_core")
+
+from amplifier_app_voice import gateway  # noqa: E402
+from amplifier_app_voice.config import AppConfig  # noqa: E402
+
+
+class FakeProvider:
+    """Answers with a count of its calls; fails the calls listed in fail."""
+
+    def __init__(self, fail: set[int]) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def complete(self, messages: list) -> SimpleNamespace:
+        self.calls += 1
+        if self.calls in self.fail:
+            raise RuntimeError("provider [bold]broke")
+        return SimpleNamespace(content=f"answer {self.calls}", raw={})
+
+
+@pytest.fixture
+def sessions(monkeypatch: pytest.MonkeyPatch) -> list:
+    created = []
+
+    class FakeSessionManager:
+        def __init__(self, config: AppConfig) -> None:
+            self.session = None
+            self.closed = False
+            created.append(self)
+
+        async def create_session(self) -> None:
+            self.provider = FakeProvider(fail={2} if len(created) == 1 else set())
+            providers = {"openai-realtime": self.provider}
+            self.session = SimpleNamespace(coordinator=SimpleNamespace(mount_points={"providers": providers}))
+
+        async def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(gateway, "SessionManager", FakeSessionManager)
+    return created
+
+
+async def _client(port: int, turns: int) -> list[tuple[bytes, bytes]]:
+    """Send turns one after another; return each turn's text or error frame."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    replies = []
+    for _ in range(turns):
+        gateway.write_frame(writer, gateway.FRAME_AUDIO, bytes(200))
+        gateway.write_frame(writer, gateway.FRAME_COMMIT)
+        await writer.drain()
+        while (frame := await gateway.read_frame(reader))[0] != gateway.FRAME_END:
+            if frame[0] in (gateway.FRAME_TEXT, gateway.FRAME_ERROR):
+                replies.append(frame)
+            if frame[0] == gateway.FRAME_ERROR:
+                break
+    writer.close()
+    await writer.wait_closed()
+    return replies
+
+
+def _serve(clients, max_sessions: int = 4, warm: int = 1):
+    """Run clients(port) against a gateway; return their result and the gateway."""
+
+    async def run():
+        server_gateway = gateway.VoiceGateway(AppConfig(api_key="test"), port=0, max_sessions=max_sessions)
+        await server_gateway.pool.warm(warm)
+        server = await asyncio.start_server(server_gateway._handle_client, "127.0.0.1", 0)
+        async with server:
+            result = await clients(server.sockets[0].getsockname()[1])
+            await asyncio.sleep(0.05)  # Let disconnects and refills finish
+        await server_gateway.pool.close()
+        return result, server_gateway
+
+    return asyncio.run(run())
+
+
+def test_failed_turn_gets_a_fresh_session(sessions: list) -> None:
+    replies, _ = _serve(lambda port: _client(port, 3))
+
+    assert replies == [
+        (gateway.FRAME_TEXT, b"answer 1"),
+        (gateway.FRAME_ERROR, b"RuntimeError: provider [bold]broke"),
+        (gateway.FRAME_TEXT, b"answer 1"),  # A new session, not the one that failed
+    ]
+    assert sessions[0].closed
+
+
+def test_clients_never_share_a_session(sessions: list) -> None:
+    async def two_clients(port: int):
+        return await asyncio.gather(_client(port, 1), _client(port, 1))
+
+    (first, second), server_gateway = _serve(two_clients)
+
+    assert first == second == [(gateway.FRAME_TEXT, b"answer 1")]
+    used = [s for s in sessions if s.provider.calls]
+    assert len(used) == 2 and all(s.closed for s in used)
+    assert server_gateway.pool.in_use == 0
+    assert server_gateway.pool._slots._value == server_gateway.pool.max_sessions
+
+
+def test_clients_beyond_max_sessions_wait_for_a_disconnect(sessions: list) -> None:
+    async def three_clients(port: int):
+        return await asyncio.gather(*(_client(port, 2) for _ in range(3)))
+
+    replies, _ = _serve(three_clients, max_sessions=1, warm=0)
+
+    # The first session fails its second turn; everyone else has a session to themselves throughout
+    assert replies[0][0] == (gateway.FRAME_TEXT, b"answer 1")
+    assert all(r == [(gateway.FRAME_TEXT, b"answer 1"), (gateway.FRAME_TEXT, b"answer 2")] for r in replies[1:])
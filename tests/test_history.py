@@ -0,0 +1,66 @@
+"""Tests for the bounded conversation history."""
+
+from amplifier_app_voice.history import ConversationHistory
+from amplifier_app_voice.history import estimate_tokens
+
+
+def _turn_cost(user: str, assistant: str) -> int:
+    return estimate_tokens(user) + estimate_tokens(assistant)
+
+
+def test_messages_alternate_oldest_first() -> None:
+    history = ConversationHistory(max_tokens=1000)
+    history.add("hello", "hi there")
+    history.add(None, "an answer to unheard audio")
+
+    assert history.messages() == [
+        {"role": "user", "content": "hello"},
+        {"role": "assistant", "content": "hi there"},
+        {"role": "assistant", "content": "an answer to unheard audio"},
+    ]
+    assert len(history) == 2
+
+
+def test_oldest_turns_are_evicted_to_stay_within_budget() -> None:
+    cost = _turn_cost("question 00", "answer 00")
+    history = ConversationHistory(max_tokens=cost * 3)
+    for i in range(10):
+        history.add(f"question {i:02}", f"answer {i:02}")
+
+    assert len(history) == 3
+    assert history.tokens == cost * 3 <= history.max_tokens
+    assert history.evicted == 7
+    assert history.messages()[0]["content"] == "question 07"
+
+
+def test_token_total_stays_flat_in_a_long_session() -> None:
+    history = ConversationHistory(max_tokens=200)
+    for i in range(500):
+        history.add("user says " * (i % 7), "assistant says " * (i % 5))
+        assert history.tokens <= 200
+        assert history.tokens == sum(estimate_tokens(m["content"]) for m in history.messages())
+
+
+def test_turn_larger_than_the_budget_is_not_remembered() -> None:
+    history = ConversationHistory(max_tokens=50)
+    history.add("short", "reply")
+    history.add("x" * 1000, "reply")
+
+    assert [m["content"] for m in history.messages()] == ["short", "reply"]
+    assert history.evicted == 1
+
+
+def test_empty_turns_and_zero_budget_remember_nothing() -> None:
+    history = ConversationHistory(max_tokens=0)
+    history.add("hello", "hi")
+    history.add(None, "")
+
+    assert history.messages() == [] and history.tokens == 0
+
+
+def test_clear_forgets_everything() -> None:
+    history = ConversationHistory()
+    history.add("hello", "hi")
+    history.clear()
+
+    assert len(history) == 0 and history.tokens == 0 and history.messages() == []
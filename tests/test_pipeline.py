@@ -0,0 +1,134 @@
+"""End-to-end tests of the turn pipeline on the benchmark's fake devices."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("amplifier_core")
+
+from amplifier_app_voice.bench.fakes import FakeAudioDevice  # noqa: E402
+from amplifier_app_voice.bench.fakes import ScriptedKeyboard  # noqa: E402
+from amplifier_app_voice.bench.fakes import StubRealtimeProvider  # noqa: E402
+from amplifier_app_voice.bench.fakes import install_fake_pyaudio  # noqa: E402
+from amplifier_app_voice.bench.fakes import stub_session  # noqa: E402
+
+SAMPLE_RATE = 24000
+SPEED = 4.0  # Fake device clock multiplier
+
+
+def _tone(seconds: float, pitch: float = 180.0) -> bytes:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * pitch * t) * 8000).astype(np.int16).tobytes()
+
+
+@pytest.fixture
+def device(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FakeAudioDevice:
+    device = FakeAudioDevice(sample_rate=SAMPLE_RATE, speed=SPEED)
+    monkeypatch.delitem(sys.modules, "pyaudio", raising=False)  # Restored after the test
+    install_fake_pyaudio(device)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return device
+
+
+async def _run_turns(device: FakeAudioDevice, session_dir: Path, script, response_delay: float = 0.05) -> tuple:
+    """Run script(say, wait_for_event) against a pipeline on the fake devices.
+
+    Returns:
+        (pipeline, outcome of each finished turn in order)
+    """
+    from rich.console import Console
+
+    from amplifier_app_voice.audio.capture import AudioCapture
+    from amplifier_app_voice.audio.playback import AudioPlayback
+    from amplifier_app_voice.audio.vad import VoiceActivityDetector
+    from amplifier_app_voice.config import AppConfig
+    from amplifier_app_voice.pipeline import TurnPipeline
+    from amplifier_app_voice.session_manager import SessionManager
+    from amplifier_app_voice.ui.terminal import TerminalUI
+
+    config = AppConfig(api_key="test", sync_hooks=True)
+    provider = StubRealtimeProvider(
+        [("First answer.", _tone(2.0, 220.0)), ("Second answer.", _tone(2.0, 200.0)), ("Third answer.", _tone(0.2))],
+        sample_rate=SAMPLE_RATE,
+        response_delay=response_delay,
+    )
+    ui = TerminalUI()
+    ui.console = Console(quiet=True)
+    keyboard = ScriptedKeyboard()
+    capture = AudioCapture(sample_rate=config.sample_rate, max_duration=config.max_recording_duration)
+    playback = AudioPlayback(sample_rate=config.sample_rate)
+    session_mgr = SessionManager(config)
+    session_mgr.session = stub_session(provider)
+    session_mgr.session_id = "test"
+    session_mgr.session_dir = session_dir
+    hooks = session_mgr.session.coordinator.hooks
+    pipeline = TurnPipeline(config, session_mgr, ui, keyboard, capture, playback, VoiceActivityDetector(SAMPLE_RATE))
+
+    async def say(seconds: float) -> None:
+        keyboard.press()
+        device.say(_tone(seconds))
+        await device.wait_said()
+        keyboard.press()
+
+    async def event(name: str, count: int = 1) -> None:
+        while sum(1 for n, _ in hooks.events if n == name) < count:
+            await asyncio.sleep(0.01)
+
+    run = asyncio.create_task(pipeline.run())
+    try:
+        await asyncio.wait_for(script(say, event), 30)
+    finally:
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        capture.cleanup()
+        playback.cleanup()
+        await asyncio.to_thread(session_mgr.writer.close)
+    outcomes = [data["outcome"] for name, data in hooks.events if name == "turn:timing"]
+    return pipeline, outcomes
+
+
+def _remembered(pipeline) -> list[str]:
+    return [message["content"] for message in pipeline.history.messages()]
+
+
+def test_played_answers_are_remembered(device: FakeAudioDevice, tmp_path: Path) -> None:
+    async def script(say, event) -> None:
+        for turn in (1, 2):
+            await say(0.5)
+            await event("turn:timing", turn)
+
+    pipeline, outcomes = asyncio.run(_run_turns(device, tmp_path, script))
+
+    assert outcomes == ["played", "played"]
+    assert _remembered(pipeline) == ["Question number 1?", "First answer.", "Question number 2?", "Second answer."]
+
+
+def test_interrupted_answer_is_not_remembered(device: FakeAudioDevice, tmp_path: Path) -> None:
+    async def script(say, event) -> None:
+        await say(0.5)
+        await event("turn:timing", 1)
+        await say(0.5)
+        await event("audio:playback:start", 2)
+        await say(0.5)  # Barge-in: the second answer is cut off
+        await event("turn:timing", 3)
+
+    pipeline, outcomes = asyncio.run(_run_turns(device, tmp_path, script))
+
+    assert outcomes == ["played", "interrupted", "played"]
+    assert "Second answer." not in _remembered(pipeline)
+    assert _remembered(pipeline) == ["Question number 1?", "First answer.", "Question number 3?", "Third answer."]
+
+
+def test_superseded_answer_is_not_remembered(device: FakeAudioDevice, tmp_path: Path) -> None:
+    async def script(say, event) -> None:
+        await say(0.5)
+        await say(0.5)  # Before the first answer arrives
+        await event("turn:timing", 2)
+
+    pipeline, outcomes = asyncio.run(_run_turns(device, tmp_path, script, response_delay=1.0))
+
+    assert outcomes == ["superseded", "played"]
+    assert _remembered(pipeline) == ["Question number 2?", "Second answer."]
@@ -0,0 +1,27 @@
+"""Tests for decoding provider responses."""
+
+import numpy as np
+import pytest
+
+from amplifier_app_voice.audio import codec
+from amplifier_app_voice.realtime import response_decoder
+from amplifier_app_voice.realtime import response_sample_rate
+
+
+@pytest.mark.parametrize("wire_format", ["g711_ulaw", "g711_alaw"])
+def test_g711_response_without_sample_rate_decodes_at_8khz(wire_format: str) -> None:
+    pcm = (np.sin(np.arange(8000) * 2 * np.pi * 440 / 8000) * 8000).astype(np.int16).tobytes()
+    raw = {"audio_format": wire_format, "sample_rate": None}
+
+    out = response_decoder(raw, 24000).decode(codec.encode(pcm, wire_format))
+
+    assert response_sample_rate(raw, 24000) == 8000
+    assert abs(len(out) // 2 - 24000) < 100  # One second at the app rate, not a third of one
+
+
+def test_reported_sample_rate_wins() -> None:
+    raw = {"audio_format": "pcm16", "sample_rate": 16000}
+    out = response_decoder(raw, 24000).decode(np.zeros(16000, dtype=np.int16).tobytes())
+
+    assert response_sample_rate(raw, 24000) == 16000
+    assert abs(len(out) // 2 - 24000) < 100
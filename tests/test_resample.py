@@ -0,0 +1,78 @@
+"""Tests for the streaming polyphase resampler."""
+
+import numpy as np
+import pytest
+
+from amplifier_app_voice.audio.resample import StreamingResampler
+
+RATE_PAIRS = [(48000, 24000), (44100, 24000), (16000, 24000), (24000, 48000), (24000, 8000)]
+DOWNSAMPLING = [(in_rate, out_rate) for in_rate, out_rate in RATE_PAIRS if out_rate < in_rate]
+
+
+def _tone(freq: float, rate: int, seconds: float = 1.0, amplitude: float = 10000.0) -> bytes:
+    """PCM16 sine tone."""
+    t = np.arange(int(rate * seconds)) / rate
+    return np.rint(amplitude * np.sin(2 * np.pi * freq * t)).astype(np.int16).tobytes()
+
+
+def _resample(pcm: bytes, in_rate: int, out_rate: int, chunk_bytes: int = 2048) -> np.ndarray:
+    """Resample pcm in fixed-size chunks, as the capture callback does."""
+    resampler = StreamingResampler(in_rate, out_rate)
+    out = b"".join(resampler.process(pcm[i : i + chunk_bytes]) for i in range(0, len(pcm), chunk_bytes))
+    return np.frombuffer(out, dtype=np.int16).astype(np.float64)
+
+
+def _steady(y: np.ndarray) -> np.ndarray:
+    """Drop the filter's start-up transient and the unfinished tail."""
+    return y[len(y) // 10 : -len(y) // 10]
+
+
+@pytest.mark.parametrize(("in_rate", "out_rate"), RATE_PAIRS)
+def test_output_independent_of_chunking(in_rate: int, out_rate: int) -> None:
+    rng = np.random.default_rng(0)
+    pcm = (rng.standard_normal(in_rate // 2) * 3000).astype(np.int16).tobytes()
+
+    whole = StreamingResampler(in_rate, out_rate).process(pcm)
+
+    resampler = StreamingResampler(in_rate, out_rate)
+    pieces = []
+    offset = 0
+    while offset < len(pcm):
+        size = int(rng.integers(1, 700)) * 2  # Whole samples, including single-sample chunks
+        pieces.append(resampler.process(pcm[offset : offset + size]))
+        offset += size
+
+    assert b"".join(pieces) == whole
+
+
+@pytest.mark.parametrize(("in_rate", "out_rate"), RATE_PAIRS)
+def test_output_length_matches_rate_ratio(in_rate: int, out_rate: int) -> None:
+    y = _resample(_tone(440.0, in_rate), in_rate, out_rate)
+    assert abs(len(y) - out_rate) <= 1
+
+
+@pytest.mark.parametrize(("in_rate", "out_rate"), RATE_PAIRS)
+def test_tone_keeps_frequency_and_amplitude(in_rate: int, out_rate: int) -> None:
+    freq = 1000.0
+    y = _steady(_resample(_tone(freq, in_rate), in_rate, out_rate))
+
+    spectrum = np.abs(np.fft.rfft(y * np.hanning(len(y))))
+    peak_hz = np.argmax(spectrum) * out_rate / len(y)
+    amplitude = np.sqrt(2 * np.mean(y * y))
+
+    assert peak_hz == pytest.approx(freq, abs=2 * out_rate / len(y))
+    assert amplitude == pytest.approx(10000.0, rel=0.02)
+
+
+@pytest.mark.parametrize(("in_rate", "out_rate"), DOWNSAMPLING)
+def test_tone_above_new_nyquist_is_attenuated(in_rate: int, out_rate: int) -> None:
+    freq = out_rate / 2 * 1.3  # Representable at in_rate, would alias at out_rate
+    y = _steady(_resample(_tone(freq, in_rate), in_rate, out_rate))
+
+    level_db = 20 * np.log10(np.sqrt(2 * np.mean(y * y)) / 10000.0 + 1e-12)
+    assert level_db < -40.0
+
+
+def test_equal_rates_pass_through() -> None:
+    pcm = _tone(440.0, 24000, seconds=0.1)
+    assert StreamingResampler(24000, 24000).process(pcm) == pcm
@@ -0,0 +1,79 @@
+"""Tests for retry backoff and the circuit breaker."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from amplifier_app_voice import resilience
+from amplifier_app_voice.resilience import CircuitBreaker
+from amplifier_app_voice.resilience import CircuitOpenError
+from amplifier_app_voice.resilience import backoff_delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Controllable monotonic clock for the breaker."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(resilience, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_opens_after_threshold_consecutive_failures(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker(threshold=3, cooldown=30.0)
+    for _ in range(2):
+        breaker.record_failure()
+        breaker.check()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError, match="3 times in a row; next attempt in 30s"):
+        breaker.check()
+
+
+def test_success_resets_the_failure_count(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker(threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_after_cooldown_then_closes_on_success(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker(threshold=1, cooldown=30.0)
+    breaker.record_failure()
+    clock.now += 29.9
+    assert breaker.state == "open"
+
+    clock.now += 0.1
+    assert breaker.state == "half-open"
+    breaker.check()  # The trial request may go
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_failed_trial_reopens_for_a_full_cooldown(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker(threshold=2, cooldown=10.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.state == "half-open"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 9.0
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    clock.now += 1.0
+    assert breaker.state == "half-open"
+
+
+def test_backoff_is_jittered_below_an_exponential_cap() -> None:
+    for attempt, ceiling in [(1, 0.25), (2, 0.5), (3, 1.0), (5, 4.0), (10, 4.0)]:
+        delays = [backoff_delay(attempt) for _ in range(200)]
+        assert all(0.0 <= d <= ceiling for d in delays)
+        assert max(delays) > ceiling * 0.8 and min(delays) < ceiling * 0.2  # Full jitter, not fixed
@@ -0,0 +1,75 @@
+"""Tests for the live terminal layout."""
+
+import asyncio
+import io
+
+from rich.console import Console
+from rich.markup import escape
+from rich.text import Text
+
+from amplifier_app_voice.ui.terminal import TerminalUI
+
+
+def _frame(ui: TerminalUI) -> list[str]:
+    """Render the live layout as plain text lines."""
+    lines = ui.console.render_lines(ui._render(), ui.console.options, pad=False)
+    return ["".join(segment.text for segment in line).rstrip() for line in lines]
+
+
+def _ui(width: int = 80, height: int = 24) -> TerminalUI:
+    console = Console(file=io.StringIO(), width=width, height=height, force_terminal=True, color_system=None)
+    ui = TerminalUI(console=console)
+    ui.status = Text("STATUS")
+    ui.recording = Text("METER")
+    return ui
+
+
+def test_wrapped_entries_fit_the_terminal() -> None:
+    ui = _ui()
+    for i in range(30):
+        ui.transcript_lines.append(f"[bold]Assistant:[/bold] reply {i} " + "word " * 60)
+
+    frame = _frame(ui)
+
+    assert len(frame) == 24
+    assert frame[-2:] == ["STATUS", "METER"]
+    assert "reply 29" in "".join(frame)  # Newest entry is shown
+    assert "reply 0 " not in "".join(frame)
+
+
+def test_entry_taller_than_the_pane_shows_its_end() -> None:
+    ui = _ui()
+    ui.partial_line = "[bold]Assistant:[/bold] start " + "word " * 600 + "finish"
+
+    frame = _frame(ui)
+
+    assert len(frame) == 24
+    assert "finish" in "".join(frame)
+    assert frame[-2:] == ["STATUS", "METER"]
+
+
+def test_short_transcript_is_not_padded() -> None:
+    ui = _ui()
+    ui.transcript_lines.append("[bold]You:[/bold] hello")
+
+    frame = _frame(ui)
+
+    assert len(frame) == 5  # Panel with one line, status, meter
+    assert "hello" in frame[1]
+
+
+def test_escaped_status_shows_brackets_literally() -> None:
+    message = f"reply: {escape('[bold]not markup[/] [')}"
+    live = _ui()
+
+    async def show_live() -> None:
+        live.start()
+        live.show_status(message, "green")
+        live.stop()
+
+    asyncio.run(show_live())
+    plain = _ui()
+    plain.show_status(message, "green")
+
+    assert live.status.plain == "reply: [bold]not markup[/] ["
+    assert plain.console.file.getvalue().rstrip().endswith("reply: [bold]not markup[/] [")
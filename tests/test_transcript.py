@@ -0,0 +1,68 @@
+"""Tests for the background JSON-lines writer."""
+
+import json
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
+from amplifier_app_voice.transcript import JsonlWriter
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize("durability", ["close", "flush", "fsync"])
+def test_close_writes_everything_in_order(tmp_path: Path, durability: str) -> None:
+    writer = JsonlWriter(durability, flush_ms=5)
+    for i in range(50):
+        writer.write(tmp_path / ("even.jsonl" if i % 2 == 0 else "odd.jsonl"), {"i": i})
+    writer.close()
+
+    assert [e["i"] for e in _read(tmp_path / "even.jsonl")] == list(range(0, 50, 2))
+    assert [e["i"] for e in _read(tmp_path / "odd.jsonl")] == list(range(1, 50, 2))
+    assert writer.written == 50
+
+
+def test_flush_policy_writes_batches_before_close(tmp_path: Path) -> None:
+    path = tmp_path / "transcript.jsonl"
+    writer = JsonlWriter("flush", flush_ms=1)
+    writer.write(path, {"role": "user"})
+
+    deadline = time.monotonic() + 2
+    while not (path.exists() and path.read_text()) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert _read(path) == [{"role": "user"}]
+    writer.close()
+
+
+def test_writer_can_be_reused_after_close(tmp_path: Path) -> None:
+    path = tmp_path / "timings.jsonl"
+    writer = JsonlWriter(flush_ms=1)
+    writer.write(path, {"turn": 1})
+    writer.close()
+    writer.write(path, {"turn": 2})
+    writer.close()
+
+    assert _read(path) == [{"turn": 1}, {"turn": 2}]
+
+
+def test_unserializable_entry_is_skipped_and_logged(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path / "transcript.jsonl"
+    writer = JsonlWriter(flush_ms=1)
+    with caplog.at_level(logging.ERROR):
+        writer.write(path, {"content": "before"})
+        writer.write(path, {"content": object()})
+        time.sleep(0.05)  # Let that batch go through the writer thread
+        writer.write(path, {"content": "after"})
+        writer.close()
+
+    assert _read(path) == [{"content": "before"}, {"content": "after"}]
+    assert "Failed to serialize transcript.jsonl entry" in caplog.text
+
+
+def test_unknown_durability_is_rejected() -> None:
+    with pytest.raises(ValueError, match="durability"):
+        JsonlWriter("sometimes")
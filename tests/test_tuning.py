@@ -0,0 +1,57 @@
+"""Tests for the adaptive capture buffer size."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from amplifier_app_voice.audio import tuning
+from amplifier_app_voice.audio.tuning import BufferTuner
+
+
+@pytest.fixture(autouse=True)
+def cache_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    path = tmp_path / "cache" / "audio-buffers.json"
+    monkeypatch.setattr(tuning, "CACHE_FILE", path)
+    return path
+
+
+def test_shrinks_after_clean_recordings_and_grows_after_an_overflow() -> None:
+    tuner = BufferTuner("dev", default=1024)
+    sizes = [tuner.observe(0) for _ in range(tuning.SHRINK_AFTER)]
+    assert sizes == [None] * (tuning.SHRINK_AFTER - 1) + [512]
+
+    assert tuner.observe(3) == 1024
+
+
+def test_size_that_keeps_overflowing_is_ruled_out() -> None:
+    tuner = BufferTuner("dev", default=256)
+    for _ in range(tuning.RULE_OUT_AFTER):
+        tuner.buffer_size = 256
+        tuner.observe(1)
+    assert tuner.too_small == 256
+
+    for _ in range(tuning.SHRINK_AFTER * 2):
+        assert tuner.observe(0) is None  # 512 is the smallest size left
+
+
+def test_observe_never_touches_the_cache_file(cache_file: Path) -> None:
+    tuner = BufferTuner("dev")
+    for _ in range(tuning.SHRINK_AFTER):
+        tuner.observe(0)
+    tuner.observe(2)
+
+    assert tuner.unsaved
+    assert not cache_file.exists()
+
+
+def test_saved_tuning_is_picked_up_by_the_next_launch(cache_file: Path) -> None:
+    tuner = BufferTuner("dev")
+    for _ in range(tuning.SHRINK_AFTER):
+        tuner.observe(0)
+    tuner.save()
+
+    assert not tuner.unsaved
+    assert json.loads(cache_file.read_text())["dev"]["buffer_size"] == 512
+    assert BufferTuner("dev").buffer_size == 512
+    assert BufferTuner("other", default=2048).buffer_size == 2048
@@ -0,0 +1,70 @@
+"""Tests for voice activity detection."""
+
+import numpy as np
+import pytest
+
+from amplifier_app_voice.audio.vad import VoiceActivityDetector
+
+SAMPLE_RATE = 24000
+
+
+def _speech(seconds: float, amplitude: float = 6000.0) -> np.ndarray:
+    """Voiced-speech stand-in: a low harmonic tone (few zero crossings)."""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return amplitude * (np.sin(2 * np.pi * 150 * t) + 0.5 * np.sin(2 * np.pi * 450 * t))
+
+
+def _silence(seconds: float, amplitude: float = 20.0) -> np.ndarray:
+    rng = np.random.default_rng(int(seconds * 1000))
+    return rng.standard_normal(int(SAMPLE_RATE * seconds)) * amplitude
+
+
+def _pcm(*parts: np.ndarray) -> bytes:
+    return np.concatenate(parts).astype(np.int16).tobytes()
+
+
+def test_trim_keeps_speech_and_padding() -> None:
+    vad = VoiceActivityDetector(SAMPLE_RATE, pad_ms=200)
+    trimmed = vad.trim(_pcm(_silence(1.0), _speech(0.5), _silence(1.0)))
+
+    assert len(trimmed) / 2 / SAMPLE_RATE == pytest.approx(0.5 + 2 * 0.2, abs=0.02)
+    samples = np.frombuffer(trimmed, dtype=np.int16)
+    assert np.max(np.abs(samples[: int(0.15 * SAMPLE_RATE)])) < 200  # Starts in the padding
+
+
+def test_trim_returns_a_view_not_a_copy() -> None:
+    pcm = bytearray(_pcm(_silence(0.5), _speech(0.3), _silence(0.5)))
+    trimmed = VoiceActivityDetector(SAMPLE_RATE).trim(pcm)
+
+    assert trimmed.obj is pcm
+
+
+def test_trim_of_silence_is_empty() -> None:
+    assert len(VoiceActivityDetector(SAMPLE_RATE).trim(_pcm(_silence(1.0)))) == 0
+
+
+def test_broadband_noise_is_not_speech() -> None:
+    hiss = np.random.default_rng(1).standard_normal(SAMPLE_RATE) * 3000  # Loud, but many zero crossings
+    assert not VoiceActivityDetector(SAMPLE_RATE).is_speech(_pcm(hiss)).any()
+
+
+def test_end_of_speech_needs_speech_then_trailing_silence() -> None:
+    vad = VoiceActivityDetector(SAMPLE_RATE, end_of_speech_ms=800)
+    pcm = _pcm(_silence(1.5), _speech(0.6), _silence(1.0))
+    chunk = 2 * 1000  # Not a whole number of 20 ms frames
+
+    ended_at = None
+    for offset in range(0, len(pcm), chunk):
+        if vad.feed(pcm[offset : offset + chunk]):
+            ended_at = (offset + chunk) / 2 / SAMPLE_RATE
+            break
+
+    assert ended_at == pytest.approx(1.5 + 0.6 + 0.8, abs=0.05)
+
+
+def test_silence_alone_never_ends_the_turn() -> None:
+    vad = VoiceActivityDetector(SAMPLE_RATE)
+    assert not vad.feed(_pcm(_silence(3.0)))
+
+    vad.reset()
+    assert vad.speech_frames == 0 and vad.silence_frames == 0